@@ -0,0 +1,151 @@
+"""Synthetic tournament data shared by the bench_*.py scripts.
+
+Run the benchmarks from the repo root, e.g. ``python scripts/bench_standings.py``.
+"""
+import os
+import sys
+import time
+import random
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.core.fixtures import add_fixture_keys  # noqa: E402
+
+GENDERS = ["Men", "Women"]
+
+
+def synthetic_fixtures(divisions=2, groups=8, teams_per_group=6, seed=7):
+    """Round-robin fixtures table (schedule + S1/S2/ScoreSource) like dm.load_fixtures().
+
+    ``divisions`` beyond Men/Women are named "Div 3", "Div 4"...
+    """
+    rng = random.Random(seed)
+    rows, mid = [], 0
+    for d in range(divisions):
+        gender = GENDERS[d] if d < len(GENDERS) else f"Div {d + 1}"
+        for g in range(groups):
+            grp = chr(ord("A") + g % 26) + (str(g // 26) if g >= 26 else "")
+            teams = [f"{gender} {grp} Team {t}" for t in range(teams_per_group)]
+            for i in range(teams_per_group):
+                for j in range(i + 1, teams_per_group):
+                    mid += 1
+                    day = 1 + mid % 10
+                    played = rng.random() < 0.8
+                    s1, s2 = (rng.randint(40, 110), rng.randint(40, 110)) if played else (None, None)
+                    rows.append({"Day": float(day), "Date": f"{day:02d}-01-2026", "Court": "Court 1",
+                                 "Match ID": str(mid), "Team A": teams[i].upper(), "Team B": teams[j].upper(),
+                                 "Gender": gender, "Group": grp, "Time": "09:00 AM",
+                                 "S1": s1, "S2": s2, "ScoreSource": "manual" if played else None})
+    df = pd.DataFrame(rows)
+    df["S1"] = df["S1"].astype("Int64")
+    df["S2"] = df["S2"].astype("Int64")
+    return add_fixture_keys(df)
+
+
+def synthetic_player_games(n_players=10_000, games_per_player=6, seed=7):
+    """Player-game rows with P_KEY, MIN_DEC and a daily USG% like MetricsEngine's df_merged."""
+    rng = np.random.default_rng(seed)
+    n = n_players * games_per_player
+    minutes = rng.uniform(0, 40, n).round(2)
+    minutes[rng.random(n) < 0.1] = 0.0  # DNP-ish rows with stats but no minutes
+    return pd.DataFrame({
+        "P_KEY": np.repeat([f"Player {i}_Team {i % 400}" for i in range(n_players)], games_per_player),
+        "MatchID": np.tile(np.arange(games_per_player), n_players).astype(str),
+        "MIN_DEC": minutes,
+        "PTS": rng.integers(0, 30, n),
+        "USG%_Daily": rng.uniform(0, 45, n),
+    })
+
+
+BOX_STATS = ["PTS", "FGM", "FGA", "3PM", "3PA", "FTM", "FTA", "OREB", "DREB", "REB",
+             "AST", "STL", "BLK", "TOV", "PF", "MIN_DEC"]
+
+
+def synthetic_matches(n_matches=200, players_per_team=10, seed=7):
+    """data.json-style match dicts with PlayerStats and Q1-Q4 PeriodStats."""
+    rng = np.random.default_rng(seed)
+    matches = []
+    for mid in range(1, n_matches + 1):
+        t1, t2 = f"Team {2 * mid % 64}", f"Team {(2 * mid + 1) % 64}"
+        periods = {q: {} for q in ("Q1", "Q2", "Q3", "Q4")}
+        for team in (t1, t2):
+            for p in range(players_per_team):
+                name = f"{team} Player {p}"
+                for q in periods:
+                    if rng.random() < 0.8:
+                        row = dict(zip(BOX_STATS, rng.integers(0, 6, len(BOX_STATS)).tolist()))
+                        row.update({"Team": team, "No": p, "USG%": float(rng.uniform(0, 40))})
+                        periods[q][name] = row
+        full = {}
+        for q_stats in periods.values():
+            for name, row in q_stats.items():
+                tot = full.setdefault(name, {"Team": row["Team"], "No": row["No"], "USG%": row["USG%"]})
+                for k in BOX_STATS:
+                    tot[k] = tot.get(k, 0) + row[k]
+        matches.append({"MatchID": str(mid), "Category": GENDERS[mid % 2], "Teams": {"t1": t1, "t2": t2},
+                        "TeamStats": {"t1": {}, "t2": {}}, "PlayerStats": full, "PeriodStats": periods,
+                        "Metadata": {"MatchDate": f"{1 + mid % 10:02d}-01-2026"}})
+    return matches
+
+
+def _box_line(rng, team, no):
+    """One player's plausible full-game box score line."""
+    fga = rng.randint(0, 15)
+    fgm = rng.randint(0, fga)
+    tpa = rng.randint(0, fga)
+    tpm = min(rng.randint(0, tpa), fgm)
+    fta = rng.randint(0, 6)
+    ftm = rng.randint(0, fta)
+    oreb, dreb = rng.randint(0, 3), rng.randint(0, 6)
+    minutes = round(rng.uniform(0, 40), 2)
+    return {"Team": team, "No": no, "PTS": 2 * (fgm - tpm) + 3 * tpm + ftm,
+            "FGM": fgm, "FGA": fga, "3PM": tpm, "3PA": tpa, "2PM": fgm - tpm, "2PA": fga - tpa,
+            "FTM": ftm, "FTA": fta, "OREB": oreb, "DREB": dreb, "REB": oreb + dreb,
+            "AST": rng.randint(0, 6), "STL": rng.randint(0, 3), "BLK": rng.randint(0, 2),
+            "TOV": rng.randint(0, 4), "PF": rng.randint(0, 4), "FD": rng.randint(0, 4),
+            "MIN_DEC": minutes, "Mins": f"{int(minutes):02d}:{int(minutes % 1 * 60):02d}",
+            "GmScr": round(rng.uniform(-2, 25), 1)}
+
+
+def synthetic_tournament(played=0.7, players_per_team=8, seed=2):
+    """data.json-style matches for the repo's own schedule (compiled_schedule.csv).
+
+    About ``played`` of the scheduled fixtures get a box score; most carry
+    the fixture's Genius Match ID, so they join the schedule like real data.
+    """
+    rng = random.Random(seed)
+    schedule = pd.read_csv(os.path.join(ROOT, "compiled_schedule.csv"))
+    matches = []
+    for i, row in enumerate(schedule.to_dict("records")):
+        if pd.isna(row["Team A"]) or pd.isna(row["Team B"]) or rng.random() > played:
+            continue
+        t1, t2 = str(row["Team A"]).title(), str(row["Team B"]).title()
+        genius = row.get("Genius Match ID")
+        mid = int(genius) if pd.notna(genius) and rng.random() < 0.8 else 9_000_000 + i
+        stats = {f"{team} P{p}": _box_line(rng, team, p) for team in (t1, t2) for p in range(players_per_team)}
+        team_pts = {key: sum(s["PTS"] for s in stats.values() if s["Team"] == team)
+                    for key, team in (("t1", t1), ("t2", t2))}
+        matches.append({"MatchID": mid, "Category": row["Gender"], "Teams": {"t1": t1, "t2": t2},
+                        "TeamStats": {k: {"PTS": v} for k, v in team_pts.items()},
+                        "PlayerStats": stats, "PeriodStats": {}, "Metadata": {"MatchDate": row["Date"]}})
+    return matches
+
+
+def timeit(fn, *args, repeat=5, **kwargs):
+    """Best wall time in seconds over ``repeat`` calls, and the last result."""
+    best, out = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn(*args, **kwargs)
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def report(label, legacy_s, new_s):
+    print(f"{label:<40} legacy {legacy_s * 1000:9.2f} ms   new {new_s * 1000:9.2f} ms   "
+          f"speedup {legacy_s / new_s if new_s else float('inf'):6.1f}x")
@@ -0,0 +1,59 @@
+"""Benchmark: stat table render, pandas Styler vs cached display table.
+
+The legacy path is what st.dataframe(df.style.apply(...).format(...)) runs
+on every rerun; the new one is a display_table cache hit plus table_html.
+
+    python scripts/bench_display.py
+"""
+import numpy as np
+import pandas as pd
+from streamlit.elements.lib.pandas_styler_utils import marshall_styler
+from streamlit.proto.ArrowData_pb2 import ArrowData
+
+from bench_data import timeit, report
+from src.core import tables as tbl
+from src.ui import display as dsp
+
+COUNT_COLS = ["PTS", "FGM", "FGA", "3PM", "3PA", "FTM", "FTA", "OREB", "DREB", "REB",
+              "AST", "TOV", "STL", "BLK", "PF", "FD"]
+PCT_COLS = ["FG%", "3P%", "FT%", "eFG%", "TS%", "USG%"]
+
+
+def stat_table(n_rows, seed=7):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({"Rank": range(1, n_rows + 1), "Player": [f"Player {i}" for i in range(n_rows)],
+                       "Team": [f"Team {i % 40}" for i in range(n_rows)], "GP": rng.integers(1, 9, n_rows)})
+    for col in COUNT_COLS:
+        df[col] = rng.integers(0, 40, n_rows)
+    for col in PCT_COLS:
+        df[col] = rng.uniform(0, 100, n_rows)
+    df.loc[df.index[::13], "3P%"] = np.nan
+    return df
+
+
+def legacy_render(df, format_dict):
+    def highlight_max(s):
+        if s.name in COUNT_COLS:
+            is_max = s == s.max()
+            return [dsp.MAX_CSS if v else '' for v in is_max]
+        return ['' for _ in s]
+    marshall_styler(ArrowData(), df.style.apply(highlight_max).format(format_dict, na_rep="-"), "bench")
+
+
+def main():
+    for n_rows in (100, 300, 1000):
+        df = stat_table(n_rows)
+        format_dict = {c: "{:.1f}" for c in PCT_COLS}
+        format_dict.update({c: "{:.0f}" for c in COUNT_COLS})
+        highlight = {c: "max" for c in COUNT_COLS}
+
+        legacy_s, _ = timeit(legacy_render, df, format_dict, repeat=3)
+        build_s, table = timeit(tbl.display_table, df, format_dict, highlight, repeat=1)
+        new_s, _ = timeit(lambda: dsp.table_html(tbl.display_table(df, format_dict, highlight)), repeat=3)
+        sort_s, _ = timeit(lambda: dsp.table_html(tbl.sort_table(table, "PTS")), repeat=3)
+        report(f"{n_rows} rows x {df.shape[1]} cols", legacy_s, new_s)
+        print(f"  first build {build_s * 1000:.1f} ms, re-sort + render {sort_s * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
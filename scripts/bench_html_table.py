@@ -0,0 +1,169 @@
+"""Benchmark: enhanced_components table markup, column-wise vs iterrows().
+
+    python scripts/bench_html_table.py
+"""
+import numpy as np
+import pandas as pd
+
+from bench_data import timeit, report
+from src.ui import enhanced_components as ec
+
+
+def legacy_render_html_table(df, highlight_cols=None, star_players=None, outlier_thresholds=None):
+    """The iterrows() renderer ec.render_html_table replaced, kept for comparison."""
+    if df.empty: return ""
+    
+    if highlight_cols is None:
+        highlight_cols = [
+            "PTS", "REB", "AST", "STL", "BLK", "Eff", "GmScr", 
+            "FIC", "PIE", "TS%", "eFG%", "USG%", "OFFRTG", "DEFRTG", "NETRTG", "FG%", "3P%", "FT%", "AST/TO"
+        ]
+
+    if star_players is None: star_players = []
+    if outlier_thresholds is None: outlier_thresholds = {}
+
+    # Calculate local max values just in case outlier_thresholds aren't provided
+    max_values = {}
+    if not outlier_thresholds:
+        for col in df.columns:
+            if col in highlight_cols:
+                try:
+                    numeric_vals = pd.to_numeric(df[col], errors='coerce')
+                    if not numeric_vals.dropna().empty:
+                        max_values[col] = numeric_vals.max()
+                except:
+                    pass
+
+    # Generate Table Headers
+    headers = "".join([f'<th style="text-align: center; padding: 12px; color: var(--text-muted); font-size: 0.8rem; background: rgba(0,0,0,0.3); border-bottom: 2px solid var(--border-glass); font-family: \'Space Grotesk\', sans-serif;">{col}</th>' for col in df.columns])
+    
+    # Generate Rows
+    rows_html = ""
+    for _, row in df.iterrows():
+        p_name = str(row.get('Player', row.get('PLAYER', '')))
+        is_star = any(star in p_name for star in star_players) if p_name else False
+        
+        row_style = "transition: background 0.2s;"
+        if is_star:
+            row_style += "background: rgba(255, 133, 51, 0.08);"
+
+        cells = ""
+        for col in df.columns:
+            val = row[col]
+            display_val = val
+            
+            # Formatting
+            if isinstance(val, (int, float, np.integer, np.floating)):
+                if val % 1 == 0:
+                    display_val = f"{int(val)}"
+                else:
+                    display_val = f"{float(val):.1f}"
+            
+            # Base style
+            style = f'text-align: center; padding: 10px; color: white; border-bottom: 1px solid var(--border-glass); transition: all 0.2s ease;'
+            
+            # 1. Outlier/Leader Highlight (Cell level)
+            is_highlighted = False
+            try:
+                numeric_val = float(val)
+                if col in outlier_thresholds:
+                    if numeric_val >= outlier_thresholds[col] and numeric_val > 0:
+                        is_highlighted = True
+                elif col in max_values:
+                    if numeric_val == max_values[col] and numeric_val > 0:
+                        is_highlighted = True
+                
+                if is_highlighted:
+                    style += 'background: rgba(255, 133, 51, 0.45); border-bottom: 2px solid var(--tappa-orange); font-weight: 800; text-shadow: 0 0 10px rgba(255,133,51,0.5);'
+                else:
+                    # Subtle background to maintain uniformity
+                    style += 'background: rgba(255, 255, 255, 0.02);'
+            except:
+                style += 'background: rgba(255, 255, 255, 0.02);'
+            
+            # 2. Player names - Left align + Clean Redundancy
+            if col in ["Player", "PLAYER"]:
+                # Strip (Team) if present in name to avoid redundancy with the Team column
+                if isinstance(display_val, str) and " (" in display_val:
+                    display_val = display_val.split(" (")[0]
+                    
+                style = style.replace("text-align: center", "text-align: left; padding-left: 15px")
+                style += "font-family: 'Space Grotesk', sans-serif; font-weight: 700;"
+                if is_star:
+                    style += "color: var(--tappa-orange);"
+            else:
+                style += "font-family: 'Outfit', sans-serif;"
+
+            cells += f'<td style="{style}">{display_val}</td>'
+        
+        rows_html += f'<tr style="{row_style}">{cells}</tr>'
+
+    html = f"""
+    <div style="
+        background: var(--bg-glass);
+        backdrop-filter: blur(12px);
+        border: 1px solid var(--border-glass);
+        border-radius: 12px;
+        overflow-x: auto;
+        margin-bottom: 24px;
+        position: relative;
+    ">
+        <table style="width: 100%; border-collapse: collapse; font-family: 'Space Grotesk', sans-serif; font-size: 0.85rem; min-width: 600px;">
+            <thead style="position: sticky; top: 0; z-index: 10;">
+                <tr>{headers}</tr>
+            </thead>
+            <tbody>
+                {rows_html}
+            </tbody>
+        </table>
+    </div>
+    """
+    return html
+
+
+def leaderboard(n_rows, seed=7):
+    """Leaderboard-shaped frame: names, ints, floats with NaN, a text and a bool column."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "Player": [f"Player {i} (Team {i % 40})" for i in range(n_rows)],
+        "Team": [f"Team {i % 40}" for i in range(n_rows)],
+        "GP": rng.integers(1, 9, n_rows),
+        "PTS": rng.integers(0, 40, n_rows),
+        "REB": rng.uniform(0, 15, n_rows).round(1),
+        "AST": rng.integers(0, 12, n_rows).astype(float),
+        "FG%": rng.uniform(0, 100, n_rows),
+        "TS%": rng.uniform(0, 100, n_rows),
+        "GmScr": rng.normal(8, 6, n_rows),
+        "FG": [f"{a}/{a + b}" for a, b in zip(rng.integers(0, 10, n_rows), rng.integers(0, 10, n_rows))],
+        "Starter": rng.random(n_rows) < 0.5,
+    })
+    df.loc[df.index[::17], "FG%"] = np.nan
+    return df
+
+
+def main():
+    df = leaderboard(300)
+    stars = ["Player 3 ", "Player 12 "]
+    cases = [
+        (df, {}),
+        (df, {"star_players": stars, "outlier_thresholds": {"PTS": 30, "REB": 10.0, "FG": 5}}),
+        (df.drop(columns="Player").rename(columns={"Team": "PLAYER"}), {"star_players": ["Team 1"]}),
+        (df[["PTS", "REB", "GmScr"]], {}),
+        (df[["Starter", "GP"]], {}),
+        (df.astype({"Team": "string[pyarrow]"}), {}),
+    ]
+    for frame, kwargs in cases:
+        assert ec._table_html(frame, kwargs.get("highlight_cols", ec.DEFAULT_HIGHLIGHT_COLS),
+                              kwargs.get("star_players", []), kwargs.get("outlier_thresholds", {})) \
+            == legacy_render_html_table(frame, **kwargs)
+
+    for n_rows in (300, 5000):
+        df = leaderboard(n_rows)
+        legacy_s, legacy = timeit(legacy_render_html_table, df, star_players=stars, repeat=3)
+        new_s, new = timeit(ec._table_html, df, ec.DEFAULT_HIGHLIGHT_COLS, stars, {}, repeat=3)
+        assert new == legacy
+        report(f"{n_rows} rows x {df.shape[1]} cols", legacy_s, new_s)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Benchmark: cold-start import cost of hub_app, with and without plotly/altair.
+
+The legacy hub imported altair and plotly.graph_objects at the top of the
+script; now plotly is imported by the chart sections and altair not at all.
+Recent streamlit releases import plotly.graph_objects themselves (for
+st.plotly_chart), so on those most of the saving is altair.
+Each measurement runs in a fresh interpreter:
+
+  imports       ``python -X importtime`` over the hub's module-level imports,
+                with the heaviest top-level packages listed
+  first render  process start to the end of the first HOME render
+                (needs data/processed/data.json)
+
+    python scripts/bench_imports.py
+"""
+import os
+import subprocess
+import sys
+
+from bench_data import ROOT, report
+
+BASE_IMPORTS = "import streamlit, pandas, numpy, json, threading, time; "
+SRC_IMPORTS = ("import src.analytics, src.ui.social_generator, src.data_manager, src.core.match_index, "
+               "src.core.fixtures, src.core.standings, src.core.power_rankings, src.core.fact_table, "
+               "src.core.formatters, src.core.tables, src.metrics_engine, src.ui.enhanced_components, src.ui.display, "
+               "src.ui.assets")
+LEGACY_IMPORTS = "import altair, plotly.graph_objects; "
+# Same order as the legacy hub: the chart libraries right after pandas
+HUB_IMPORTS = BASE_IMPORTS + SRC_IMPORTS
+LEGACY_HUB_IMPORTS = BASE_IMPORTS + LEGACY_IMPORTS + SRC_IMPORTS
+
+FIRST_RENDER = """
+import time
+t0 = time.perf_counter()
+{preload}
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=300)
+at.session_state["active_tab"] = "HOME"
+at.run()
+import sys
+print(time.perf_counter() - t0, int("altair" in sys.modules))
+"""
+
+
+def _python(code, *flags):
+    return subprocess.run([sys.executable, *flags, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+
+
+def import_profile(code):
+    """(total seconds, {top-level package: cumulative seconds}) from -X importtime."""
+    per_package = {}
+    for line in _python(code, "-X", "importtime").stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit() or name.startswith("  "):
+            continue  # header row, or nested under a module already counted
+        package = name.strip().split(".")[0]
+        per_package[package] = per_package.get(package, 0) + int(cumulative) / 1e6
+    return sum(per_package.values()), per_package
+
+
+def best_profile(code, repeat=3):
+    return min((import_profile(code) for _ in range(repeat)), key=lambda r: r[0])
+
+
+def first_render(preload, repeat=3):
+    app = os.path.join(ROOT, "src", "hub_app.py")
+    # The hub may print warnings first; the timing is the last line
+    runs = [_python(FIRST_RENDER.format(preload=preload, app=app)).stdout.splitlines()[-1].split()
+            for _ in range(repeat)]
+    seconds, altair_loaded = min(runs, key=lambda r: float(r[0]))
+    return float(seconds), altair_loaded == "1"
+
+
+def main():
+    legacy_s, legacy = best_profile(LEGACY_HUB_IMPORTS)
+    new_s, new = best_profile(HUB_IMPORTS)
+    report("hub module-level imports", legacy_s, new_s)
+    print("  heaviest packages (legacy -> lazy):")
+    for package in sorted(legacy, key=legacy.get, reverse=True)[:10]:
+        print(f"    {package:<22} {legacy[package] * 1000:8.1f} ms -> {new.get(package, 0) * 1000:8.1f} ms")
+
+    if not os.path.exists(os.path.join(ROOT, "data", "processed", "data.json")):
+        print("data/processed/data.json not found, skipping first-render timing")
+        return
+    legacy_s, _ = first_render(LEGACY_IMPORTS)
+    new_s, altair_loaded = first_render("")
+    report("cold start to first HOME render", legacy_s, new_s)
+    print(f"  altair loaded after HOME: {altair_loaded}")
+
+
+if __name__ == "__main__":
+    main()
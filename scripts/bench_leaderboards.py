@@ -0,0 +1,47 @@
+"""Benchmark: leader cards, full-frame sorts vs the top-k leaderboard index.
+
+Per rerun the Top Performances leaders tab sorts the single-game frame
+once per card; with the index each card is a lookup of precomputed rows.
+
+    python scripts/bench_leaderboards.py
+"""
+import numpy as np
+import pandas as pd
+
+from bench_data import timeit, report
+from src.core import leaderboards as lb
+
+
+def single_games(n_rows, n_dates=10, seed=7):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({"Player": [f"Player {i % (n_rows // 6 + 1)}" for i in range(n_rows)],
+                       "Date": [f"{1 + i % n_dates:02d}-01-2026" for i in range(n_rows)]})
+    for stat in lb.LEADER_STATS:
+        df[stat] = rng.integers(0, 40, n_rows).astype(float)
+    return df
+
+
+def legacy_cards(df, date=None):
+    view = df[df["Date"] == date] if date else df
+    return [view.nlargest(5, stat).reset_index(drop=True) for stat in lb.LEADER_STATS]
+
+
+def indexed_cards(board, date=None):
+    return [board.top(stat, 5, date) for stat in lb.LEADER_STATS]
+
+
+def main():
+    for n_rows in (5_000, 50_000, 500_000):
+        df = single_games(n_rows)
+        build_s, board = timeit(lb.Leaderboard, df, group_col="Date", repeat=1)
+        for date in (None, "03-01-2026"):
+            legacy_s, legacy = timeit(legacy_cards, df, date)
+            new_s, new = timeit(indexed_cards, board, date)
+            for a, b in zip(legacy, new):
+                pd.testing.assert_frame_equal(a, b)
+            report(f"{n_rows} rows, {date or 'whole tournament'}", legacy_s, new_s)
+        print(f"  index build (once per data version) {build_s * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
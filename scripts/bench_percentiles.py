@@ -0,0 +1,64 @@
+"""Benchmark: one Player Comparison interaction, legacy vs cached percentile matrix.
+
+Legacy: derive stats over every player, then loop iterrows per selected
+stat for the radar maxima and normalise in Python. New: a comparison_matrix
+cache hit (shallow copies) plus .loc slices of the pre-normalised frames.
+
+    python scripts/bench_percentiles.py
+"""
+import pandas as pd
+
+from bench_data import timeit, report
+from bench_shared_frames import engine_matches
+from src import analytics as ant
+from src.core import fact_table as ft
+from src.core import percentiles as pm
+from src.metrics_engine import MetricsEngine
+
+STATS = ["GmScr", "FIC", "PIE", "eFG%", "TS%", "USG%", "PTS", "AST"]
+
+
+def legacy_radar(df_players, players):
+    df = ant.calculate_derived_stats(df_players)
+    df = df[df["GP"] > 0].copy()
+    comp_df = df[df["Player"].isin(players)].copy()
+    maxima = {}
+    for stat in STATS:
+        max_val = 0
+        for _, row in comp_df.iterrows():
+            gp = row.get("GP", 1)
+            val = row.get(stat, 0) / gp if stat in pm.PER_GAME_STATS else abs(row.get(stat, 0))
+            max_val = max(max_val, val)
+        maxima[stat] = max_val
+    radar = []
+    for _, row in comp_df.iterrows():
+        gp = row["GP"]
+        radar.append([(row.get(s, 0) / gp if s in pm.PER_GAME_STATS else row.get(s, 0)) / (maxima[s] * 1.5 or 1) * 100
+                      for s in STATS])
+    return radar
+
+
+def new_radar(df_players, players, data_key):
+    values, units, pct, _ = pm.comparison_matrix(df_players, data_key=data_key, stats=tuple(STATS))
+    sel = values.index[values["Player"].isin(players)]
+    return pct.loc[sel, STATS], pm.relative_scale(units.loc[sel], STATS)
+
+
+def main():
+    pd.set_option("mode.copy_on_write", True)
+    for n_matches in (200, 800):
+        matches = engine_matches(n_matches)
+        facts = ft.build_player_game_table(matches)
+        prepared = MetricsEngine._prepare(matches, "Full Game", facts)
+        df_players = MetricsEngine._player_aggregates(*prepared)
+        build_s, _ = timeit(new_radar, df_players, [], ("bench", n_matches), repeat=1)
+        for n_players in (4, 8):
+            players = list(df_players["Player"].unique()[:n_players])
+            legacy_s, _ = timeit(legacy_radar, df_players, players, repeat=3)
+            new_s, _ = timeit(new_radar, df_players, players, ("bench", n_matches), repeat=10)
+            report(f"{len(df_players)} players, compare {n_players}", legacy_s, new_s)
+        print(f"  matrix build (once per data version) {build_s * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
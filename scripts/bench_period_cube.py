@@ -0,0 +1,38 @@
+"""Benchmark: halves / custom quarter sets from the period cube vs a groupby.
+
+    python scripts/bench_period_cube.py
+"""
+import pandas as pd
+
+from bench_data import synthetic_matches, timeit, report
+from src.core import fact_table as ft
+
+
+def legacy_quarter_rows(facts, quarters):
+    """Materialize the quarter rows and sum them per player-game (the old halves path)."""
+    rows = facts[facts["Period"].isin(quarters)]
+    rows = ft.materialize(rows.drop(columns="Period").dropna(axis=1, how="all"))
+    keys = ["MatchID", "PlayerKey"]
+    sum_cols, first_cols = [], []
+    for col in rows.columns:
+        if col not in keys:
+            (sum_cols if ft._is_summed(col, rows[col]) else first_cols).append(col)
+    grouped = rows.groupby(keys, sort=False)
+    out = pd.concat([grouped[sum_cols].sum(min_count=1), grouped[first_cols].first()], axis=1)
+    return out.reset_index()[list(rows.columns)]
+
+
+def main():
+    for n_matches in (100, 400):
+        facts = ft.build_player_game_table(synthetic_matches(n_matches))
+        build_s, cube = timeit(ft.build_period_cube, facts, repeat=3)
+        print(f"{n_matches} matches: cube build {build_s * 1000:.1f} ms (once per data version)")
+        for quarters in (["Q1", "Q2"], ["Q1", "Q3", "Q4"]):
+            legacy_s, legacy = timeit(legacy_quarter_rows, facts, quarters)
+            new_s, new = timeit(ft.cube_rows, cube, quarters)
+            pd.testing.assert_frame_equal(legacy, new)
+            report(f"  {'+'.join(quarters)} / {len(new)} player-games", legacy_s, new_s)
+
+
+if __name__ == "__main__":
+    main()
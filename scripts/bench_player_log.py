@@ -0,0 +1,38 @@
+"""Benchmark: switching players on the Player Profile game log.
+
+Legacy: derive every full-game performance, then filter by player, on each
+switch. New: the derived log is built once per data version
+(TournamentStore.game_log) and a switch slices the player's rows via
+ft.row_index, so its cost does not grow with the tournament.
+
+    python scripts/bench_player_log.py
+"""
+import pandas as pd
+
+from bench_data import synthetic_matches, timeit, report
+from src import analytics as ant
+from src.core import fact_table as ft
+
+
+def main():
+    pd.set_option("mode.copy_on_write", True)
+    for n_matches in (100, 400, 1600):
+        matches = synthetic_matches(n_matches)
+        facts = ft.build_player_game_table(matches)
+        player = facts["Player"].iloc[0]
+
+        def legacy():
+            log = ant.get_daily_stats(matches, period="Full Game", player_games=facts)
+            return log[log["Player"] == player]
+
+        build_s, log = timeit(ant.get_daily_stats, matches, period="Full Game", player_games=facts, repeat=1)
+        index_s, rows = timeit(ft.row_index, log, "Player", repeat=1)
+        legacy_s, old = timeit(legacy, repeat=3)
+        new_s, new = timeit(lambda: log.iloc[rows[player]], repeat=20)
+        pd.testing.assert_frame_equal(old, new)
+        report(f"{n_matches} matches / {len(log)} rows", legacy_s, new_s)
+        print(f"  once per data version: game log {build_s * 1000:.1f} ms, row index {index_s * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark: SRS team ratings, fixed-point iteration vs one least-squares solve.
+
+The usual way to compute SRS is to iterate rating = average margin +
+average opponent rating, over every team, until it settles; the ratings
+module solves the same system once. Schedules are round robins in pools
+of eight plus a few cross-pool games, so every pool is connected.
+
+    python scripts/bench_ratings.py
+"""
+import numpy as np
+
+from bench_data import timeit, report
+from src.core import ratings as rt
+
+
+def schedule(n_teams, pool=8, cross_games=2, seed=11):
+    rng = np.random.default_rng(seed)
+    strength = rng.normal(0, 8, n_teams)
+    games = []
+    for start in range(0, n_teams, pool):
+        teams = range(start, min(start + pool, n_teams))
+        games += [(a, b) for a in teams for b in teams if a < b]
+    for a in range(n_teams):
+        for b in rng.choice(n_teams, cross_games, replace=False):
+            if a != b:
+                games.append((a, int(b)))
+    return [(f"Team {a}", f"Team {b}", round(strength[a] - strength[b] + rng.normal(0, 10)))
+            for a, b in games]
+
+
+def iterative_ratings(games, tol=1e-9, max_iter=10_000):
+    """Damped fixed-point SRS, centred on 0 each sweep."""
+    opponents, margins = {}, {}
+    for a, b, m in games:
+        opponents.setdefault(a, []).append(b)
+        opponents.setdefault(b, []).append(a)
+        margins.setdefault(a, []).append(m)
+        margins.setdefault(b, []).append(-m)
+    avg_margin = {t: sum(ms) / len(ms) for t, ms in margins.items()}
+    ratings = dict.fromkeys(opponents, 0.0)
+    for _ in range(max_iter):
+        new = {t: 0.5 * ratings[t] + 0.5 * (avg_margin[t] + sum(ratings[o] for o in opps) / len(opps))
+               for t, opps in opponents.items()}
+        mean = sum(new.values()) / len(new)
+        new = {t: r - mean for t, r in new.items()}
+        delta = max(abs(new[t] - ratings[t]) for t in new)
+        ratings = new
+        if delta < tol:
+            break
+    return ratings
+
+
+def main():
+    for n_teams in (64, 320, 960):
+        games = schedule(n_teams)
+        legacy_s, legacy = timeit(iterative_ratings, games, repeat=1)
+        new_s, new = timeit(rt.team_ratings, games, 0)
+        assert max(abs(legacy[t] - new[t]) for t in legacy) < 1e-6
+        report(f"{n_teams} teams, {len(games)} games", legacy_s, new_s)
+        ridge_s, _ = timeit(rt.team_ratings, games)
+        print(f"  ridge={rt.RIDGE} solve {ridge_s * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
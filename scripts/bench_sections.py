@@ -0,0 +1,87 @@
+"""Benchmark: interaction latency per top-level tab of hub_app.
+
+A widget outside the sections (category filter, navigation) reruns the
+whole script; a widget inside a section reruns only that section's
+fragment. Before the sections were fragments, every widget cost a full
+rerun. For each tab this reports the warm full-script rerun ("legacy")
+against the section's own render time ("new"), which is what a fragment
+rerun costs. The hub records the latter in ``st.session_state.section_ms``
+when HUB_SECTION_TIMING=1.
+
+The app runs against a synthetic tournament built from the repo's
+schedule. It is written to a scratch copy of the working tree (symlinks
+plus a generated data/processed/data.json), so a real data.json is never
+read or touched:
+
+    python scripts/bench_sections.py [TAB ...]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+from bench_data import ROOT, synthetic_tournament, report
+
+from streamlit.testing.v1 import AppTest
+
+TABS = ["HOME", "SCHEDULE", "STANDINGS", "BRACKET", "MATCH DASHBOARD", "TOP PERFORMANCES",
+        "TOURNAMENT STATS", "LEADERBOARDS", "PLAYER PROFILE", "COMPARISON"]
+APP = os.path.join(ROOT, "src", "hub_app.py")
+DATA_JSON = os.path.join("data", "processed", "data.json")
+
+
+def _mirror(src, dst, skip):
+    """Symlink every entry of ``src`` into ``dst``, recursing into the dirs on ``skip``'s path."""
+    os.makedirs(dst, exist_ok=True)
+    head, _, rest = skip.partition(os.sep)
+    for name in os.listdir(src):
+        if name == head and rest:
+            _mirror(os.path.join(src, name), os.path.join(dst, name), rest)
+        elif name != head:
+            os.symlink(os.path.join(src, name), os.path.join(dst, name))
+
+
+def sandbox(matches):
+    """Scratch copy of the tree whose data.json holds ``matches``."""
+    tmp = tempfile.TemporaryDirectory(prefix="bench_sections_")
+    _mirror(ROOT, tmp.name, DATA_JSON)
+    with open(os.path.join(tmp.name, DATA_JSON), "w") as f:
+        json.dump(matches, f)
+    return tmp
+
+
+def measure(tab, repeat=3):
+    """(best warm full-rerun s, section render s or None) for one tab."""
+    at = AppTest.from_file(APP, default_timeout=300)
+    at.session_state["active_tab"] = tab
+    at.run()  # cold: fills the caches
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        at.run()
+        best = min(best, time.perf_counter() - t0)
+    if at.exception:
+        print(f"  {tab}: {at.exception[0].value}")
+    section_ms = at.session_state["section_ms"].get(tab) if "section_ms" in at.session_state else None
+    return best, section_ms / 1000 if section_ms is not None else None
+
+
+def main():
+    os.environ["HUB_SECTION_TIMING"] = "1"
+    matches = synthetic_tournament()
+    with sandbox(matches) as tmp:
+        os.chdir(tmp)
+        print(f"synthetic tournament: {len(matches)} box scores")
+        print("legacy = full rerun (any widget, before fragments); new = fragment rerun (widget inside the tab)")
+        for tab in sys.argv[1:] or TABS:
+            full_s, section_s = measure(tab)
+            if section_s is None:
+                print(f"{tab:<40} full rerun {full_s * 1000:9.2f} ms   (no section time recorded)")
+            else:
+                report(tab, full_s, section_s)
+        os.chdir(ROOT)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Benchmark: cost of one cache hit on the tournament aggregates.
+
+st.cache_data unpickles the stored frames on every hit; shared_frames
+hands out shallow copy-on-write copies of one process-wide frame.
+
+    python scripts/bench_shared_frames.py
+"""
+import pickle
+
+import pandas as pd
+
+from bench_data import synthetic_matches, timeit, report
+from src.core import fact_table as ft
+from src.core import shared_frames as sf
+from src.metrics_engine import MetricsEngine
+
+
+# Box-score columns MetricsEngine aggregates that synthetic_matches leaves out
+EXTRA_STATS = ["FD", "Mins", "OffPTS", "DefPTS", "TmPoss", "OppPoss"]
+
+
+def engine_matches(n_matches):
+    matches = synthetic_matches(n_matches)
+    for m in matches:
+        for rows in [m["PlayerStats"], *m["PeriodStats"].values()]:
+            for row in rows.values():
+                for stat in EXTRA_STATS:
+                    row.setdefault(stat, 0)
+    return matches
+
+
+def main():
+    pd.set_option("mode.copy_on_write", True)
+    for n_matches in (200, 800):
+        matches = engine_matches(n_matches)
+        facts = ft.build_player_game_table(matches)
+        prepared = MetricsEngine._prepare(matches, "Full Game", facts)
+        frames = (MetricsEngine._player_aggregates(*prepared),) + MetricsEngine._team_aggregates(*prepared, "Full Game")
+        pickled = pickle.dumps(frames)
+        frozen = sf.freeze(tuple(f.copy() for f in frames))
+
+        legacy_s, legacy = timeit(pickle.loads, pickled, repeat=20)
+        new_s, new = timeit(sf.thaw, frozen, repeat=20)
+        for a, b in zip(legacy, new):
+            pd.testing.assert_frame_equal(a, b, check_dtype=False)
+        per_session = sum(f.memory_usage(deep=True).sum() for f in legacy) / 1e6
+        report(f"{n_matches} matches / {len(frames[0])} players", legacy_s, new_s)
+        print(f"  per-session copy with cache_data: {per_session:.1f} MB, with shared_frames: ~0 MB")
+
+        # A view that writes to its copy must not leak into the shared frame
+        view = sf.thaw(frozen)[0]
+        view.loc[view.index[0], "PTS"] = -1
+        assert frozen[0]["PTS"].iloc[0] != -1
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Benchmark: "players like X" top-k search, pairwise loop vs one matrix product.
+
+The loop is the straightforward version (distance to every player in
+Python); SimilarityIndex answers with one product against its cached
+standardized matrix.
+
+    python scripts/bench_similarity.py
+"""
+import numpy as np
+import pandas as pd
+
+from bench_data import timeit, report
+from src.core import similarity as sim
+
+
+def synthetic_players(n_players, seed=7):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({"Player": [f"Player {i}" for i in range(n_players)],
+                       "Team": [f"Team {i % 300}" for i in range(n_players)],
+                       "Category": np.where(rng.random(n_players) < 0.5, "Men", "Women"),
+                       "GP": rng.integers(1, 9, n_players), "MIN_CALC": rng.uniform(0, 250, n_players)})
+    for stat in sim.PER_36_STATS:
+        df[stat] = rng.integers(0, 80, n_players)
+    return df
+
+
+def pairwise_loop(index, pos, k):
+    q = index.matrix[pos]
+    dists = []
+    for other in range(len(index.matrix)):
+        if other != pos and index.categories[other] == index.categories[pos]:
+            dists.append((float(np.sqrt(((index.matrix[other] - q) ** 2).sum())), other))
+    return [other for _, other in sorted(dists)[:k]]
+
+
+def main():
+    for n_players in (1_000, 10_000, 100_000):
+        df = synthetic_players(n_players)
+        build_s, index = timeit(sim.SimilarityIndex, df, repeat=1)
+        pos = index.position("Player 5")
+        legacy_s, legacy = timeit(pairwise_loop, index, pos, 10, repeat=1)
+        new_s, new = timeit(index.neighbours, pos, 10, "euclidean", repeat=10)
+        assert new["Player"].tolist() == index.players["Player"].iloc[legacy].tolist()
+        report(f"{len(index.matrix)} qualified players, top 10", legacy_s, new_s)
+        print(f"  index build (once per data version) {build_s * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Micro-benchmark: minutes-weighted USG% per player at 10k players.
+
+    python scripts/bench_usg.py
+"""
+import numpy as np
+
+from bench_data import synthetic_player_games, timeit, report
+
+
+def legacy_weighted_usg(df_merged):
+    """groupby.apply + np.average, as MetricsEngine did before."""
+    def weighted_usg(x):
+        m = x["MIN_DEC"]
+        u = x.get("USG%_Daily", 0)
+        if m.sum() > 0:
+            return np.average(u, weights=m)
+        else:
+            return 0.0
+    return df_merged.groupby("P_KEY").apply(weighted_usg)
+
+
+def grouped_weighted_usg(df_merged):
+    """sum(u*m) / sum(m) in the same groupby as the other sums (MetricsEngine._player_aggregates)."""
+    df = df_merged.assign(USG_x_MIN=df_merged["USG%_Daily"] * df_merged["MIN_DEC"])
+    sums = df.groupby("P_KEY").agg({"PTS": "sum", "MIN_DEC": "sum", "USG_x_MIN": "sum"})
+    return (sums["USG_x_MIN"] / sums["MIN_DEC"].where(sums["MIN_DEC"] > 0)).fillna(0.0)
+
+
+def main():
+    for n_players in (1_000, 10_000):
+        df = synthetic_player_games(n_players)
+        legacy_s, legacy = timeit(legacy_weighted_usg, df, repeat=3)
+        new_s, new = timeit(grouped_weighted_usg, df)
+        assert np.allclose(legacy.sort_index().to_numpy(), new.sort_index().to_numpy())
+        report(f"{n_players} players / {len(df)} player-games", legacy_s, new_s)
+
+
+if __name__ == "__main__":
+    import warnings
+    warnings.simplefilter("ignore", DeprecationWarning)  # groupby.apply on grouping columns
+    main()
@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+from src.core import fact_table as ft
 
 def round_half_up(series, decimals=0):
     """
@@ -595,70 +596,27 @@ def generate_match_narrative(match_data):
     except Exception as e:
         return ""
 
-def get_daily_stats(match_list, period="Full Game"):
-    """Flat-map all player performances from a list of matches with date context."""
-    if not match_list: return pd.DataFrame()
-    
-    records = []
-    for m in match_list:
-        meta = m.get("Metadata", {})
-        date = meta.get("MatchDate", "Unknown")
-        cat = m.get("Category", "Unknown")
-        teams = m.get("Teams", {})
-        match_id = m.get("MatchID", "Unknown")
-        
-        # Determine which stats to use based on period
-        if period == "Full Game":
-            stats_dict = m.get("PlayerStats", {})
-        elif period in ["Q1", "Q2", "Q3", "Q4"]:
-            # Get period-specific stats (Q1, Q2, Q3, Q4)
-            # PeriodStats structure: { "Q1": { "Player Name": {stats}, ... }, "Q2": {...}, ... }
-            period_stats = m.get("PeriodStats", {})
-            stats_dict = period_stats.get(period, {})
-        elif period == "1st Half":
-            # Combine Q1 + Q2
-            period_stats = m.get("PeriodStats", {})
-            q1_stats = period_stats.get("Q1", {})
-            q2_stats = period_stats.get("Q2", {})
-            stats_dict = combine_period_stats([q1_stats, q2_stats])
-        elif period == "2nd Half":
-            # Combine Q3 + Q4
-            period_stats = m.get("PeriodStats", {})
-            q3_stats = period_stats.get("Q3", {})
-            q4_stats = period_stats.get("Q4", {})
-            stats_dict = combine_period_stats([q3_stats, q4_stats])
-        else:
-            stats_dict = {}
-        
-        for p_name, s in stats_dict.items():
-            # Check if player has any recorded stats (PTS, REB, AST, etc.)
-            # This ensures we include players who played but have 0 minutes recorded (common in partial data)
-            has_stats = False
-            check_cols = ["PTS", "REB", "AST", "STL", "BLK", "TOV", "FGM", "FGA", "3PM", "3PA", "FTM", "FTA", "MIN_DEC", "MIN_CALC", "Mins"]
-            
-            for k in check_cols:
-                val = s.get(k, 0)
-                try:
-                    # Handle numbers and strings
-                    if val and float(val) > 0:
-                        has_stats = True
-                        break
-                except (ValueError, TypeError):
-                    continue
-            
-            # DEBUG: KEEP ALL PLAYERS
-            if True:
-                row = s.copy()
-                row["Date"] = date
-                row["Category"] = cat
-                row["Match"] = f"{teams.get('t1')} vs {teams.get('t2')}"
-                row["Opponent"] = teams.get("t2") if s.get("Team") == teams.get("t1") else teams.get("t1")
-                row["MatchID"] = match_id
-                records.append(row)
+def get_daily_stats(match_list, period="Full Game", player_games=None, period_cube=None):
+    """Flat-map all player performances from a list of matches with date context.
+
+    When ``player_games`` (the fact table from ``build_player_game_table``) is
+    passed, the rows for ``match_list`` are sliced from it instead of
+    re-flattening every match dict; halves and quarters are summed from
+    ``period_cube`` (``build_period_cube``) when given. With ``player_games``,
+    ``match_list`` may also be the MatchIDs picked by ``ft.select_match_ids``.
+    """
+    if match_list is None or len(match_list) == 0: return pd.DataFrame()
+    
+    if player_games is None:
+        periods = ft.HALVES.get(period, [period])
+        player_games = ft.build_player_game_table(match_list, periods=periods)
+        df = ft.player_game_rows(player_games, period)
+    else:
+        df = ft.player_game_rows(player_games, period, match_list=match_list, cube=period_cube)
                 
-    if not records: return pd.DataFrame()
+    if df.empty: return pd.DataFrame()
     
-    df = pd.DataFrame(records)
+    df = df.drop(columns=["PlayerKey"] + ft.STAGE_COLS, errors="ignore")
     df = normalize_stats(df)
     df = calculate_derived_stats(df)
     return df
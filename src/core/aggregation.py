@@ -1,27 +1,39 @@
 """Tournament-level data aggregation for players and teams."""
-import streamlit as st
 import pandas as pd
 import numpy as np
 from src import analytics as ant
+from src import data_manager as dm
+from src.core import fact_table as ft
+from src.core.shared_frames import shared_frames
 
 
-@st.cache_data
-def get_tournament_aggregates_v12(match_list):
-    """Aggregate stats across all matches for Players and Teams."""
+def get_tournament_aggregates_v12(match_list, _player_games=None, data_key=None):
+    """Aggregate stats across all matches for Players and Teams.
+
+    Player rows come from the fact table (``_player_games``, built on the fly
+    when not supplied); only team totals are still read from the match dicts.
+    Cached on ``data_key`` (``dm.data_key(match_list)`` when not given)
+    rather than on the match dicts.
+    """
+    if data_key is None:
+        data_key = dm.data_key(match_list)
+    return _tournament_aggregates(data_key, match_list, _player_games)
+
+
+@shared_frames
+def _tournament_aggregates(data_key, _match_list, _player_games):
+    match_list = _match_list  # not hashed; data_key identifies it
     if not match_list:
         return pd.DataFrame(), pd.DataFrame()
     
-    p_recs, t_recs = [], []
+    if _player_games is None:
+        _player_games = ft.build_player_game_table(match_list, periods=["Full Game"])
+    df_p = ft.player_game_rows(_player_games, "Full Game", match_list=match_list)
+    
+    t_recs = []
     
     for m in match_list:
         mid = m.get("MatchID")
-        # Player Stats
-        for p, s in m.get('PlayerStats', {}).items():
-            r = s.copy()
-            r['Player'] = p
-            r['MatchID'] = mid
-            p_recs.append(r)
-            
         # Team Stats (Enriched with Tm/Opp context for Advanced Stats)
         ts = m.get('TeamStats', {})
         tn = m.get('Teams', {})
@@ -58,8 +70,10 @@ def get_tournament_aggregates_v12(match_list):
             t_recs.append(s2)
             
     # Process Players
-    if p_recs:
-        df_p = pd.DataFrame(p_recs)
+    if not df_p.empty:
+        # Match context columns are not part of the per-player sums
+        df_p["Player"] = df_p["PlayerKey"]
+        df_p = df_p.drop(columns=["PlayerKey", "Date", "Category", "Match", "Opponent"] + ft.STAGE_COLS, errors="ignore")
         
         # Ensure standard columns are numeric BEFORE aggregation
         numeric_targets = ["PTS", "FGM", "FGA", "3PM", "3PA", "FTM", "FTA", "2PM", "2PA", 
@@ -0,0 +1,320 @@
+"""Columnar player-game-period fact table built once from data.json."""
+import pandas as pd
+import numpy as np
+from src.core import match_index as mi
+from src.core import stages as stg
+
+# Period axis of the fact table. Halves are derived from the quarter rows.
+PERIODS = ["Full Game", "Q1", "Q2", "Q3", "Q4"]
+QUARTERS = ["Q1", "Q2", "Q3", "Q4"]
+HALVES = {"1st Half": ["Q1", "Q2"], "2nd Half": ["Q3", "Q4"]}
+# Periods that can be answered from the quarter cube
+QUARTER_SETS = {**{q: [q] for q in QUARTERS}, **HALVES}
+
+# Label columns stored as categoricals (low cardinality, repeated per row)
+CATEGORICAL_COLS = ["Player", "PlayerKey", "Team", "Category", "Opponent", "Match", "Date", "Period", "Stage", "Round"]
+
+# Per-match stage columns (see add_stage); dropped from per-player outputs
+STAGE_COLS = stg.STAGE_COLS
+
+# Raw fields kept exactly as scraped (jersey numbers, "MM:SS" minute strings)
+PASSTHROUGH_COLS = ["No", "Jersey", "Mins"]
+
+# Rate stats are recalculated downstream, never summed across periods
+RATE_STATS = ["OFFRTG", "DEFRTG", "NETRTG", "USG%", "AST%", "OREB%", "DREB%", "REB%",
+              "TS%", "eFG%", "Eff", "GmScr", "PIE", "AST/TO"]
+
+
+def _period_dicts(m, periods):
+    """Yield (period, {player: stats}) for the requested periods of a match."""
+    period_stats = m.get("PeriodStats", {})
+    for period in periods:
+        if period == "Full Game":
+            yield period, m.get("PlayerStats", {})
+        elif period in period_stats:
+            yield period, period_stats[period]
+
+
+def build_player_game_table(match_list, periods=None):
+    """Flatten every PlayerStats / PeriodStats entry into one typed frame.
+
+    One row per (match, period, player); ``PlayerKey`` is the name the
+    player is keyed under in the match dict. MatchID is stored as int64 when every
+    ID is numeric, counting stats as float32 and labels as categoricals, so the
+    whole tournament fits in a few MB and is walked exactly once per load.
+    ``periods`` restricts the build to a subset of ``PERIODS``.
+    """
+    if not match_list:
+        return pd.DataFrame()
+    periods = periods or PERIODS
+
+    records = []
+    for m in match_list:
+        meta = m.get("Metadata", {})
+        date = meta.get("MatchDate", "Unknown")
+        cat = m.get("Category", "Unknown")
+        teams = m.get("Teams", {})
+        match_id = m.get("MatchID", "Unknown")
+        match_label = f"{teams.get('t1')} vs {teams.get('t2')}"
+
+        for period, stats_dict in _period_dicts(m, periods):
+            for p_name, s in stats_dict.items():
+                row = dict(s)
+                row.setdefault("Player", p_name)
+                row["PlayerKey"] = p_name
+                row["Date"] = date
+                row["Category"] = cat
+                row["Match"] = match_label
+                row["Opponent"] = teams.get("t2") if s.get("Team") == teams.get("t1") else teams.get("t1")
+                row["MatchID"] = match_id
+                row["Period"] = period
+                records.append(row)
+
+    if not records:
+        return pd.DataFrame()
+
+    return _apply_schema(pd.DataFrame(records))
+
+
+def _apply_schema(df):
+    """Cast a freshly flattened frame to the compact fact-table dtypes."""
+    ids = pd.to_numeric(df["MatchID"], errors="coerce")
+    if not ids.isna().any():
+        df["MatchID"] = ids.astype("int64")
+    else:
+        df["MatchID"] = df["MatchID"].astype(str)
+
+    for col in df.columns:
+        if col == "MatchID" or col in PASSTHROUGH_COLS:
+            continue
+        if col in CATEGORICAL_COLS:
+            df[col] = df[col].astype("category")
+        elif pd.api.types.is_bool_dtype(df[col]):
+            continue
+        elif pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = df[col].astype("float32")
+        else:
+            # Mixed object columns: keep only if every present value is numeric
+            as_num = pd.to_numeric(df[col], errors="coerce")
+            if as_num.notna().sum() == df[col].notna().sum():
+                df[col] = as_num.astype("float32")
+    return df
+
+
+def add_stage(facts, stages):
+    """Attach each match's Stage / Round / Knockout (``dm.load_stage_table()``)."""
+    if facts is None or facts.empty:
+        return facts
+    ids = pd.unique(facts["MatchID"])
+    rows = {i: stages.get(mi.canon_match_id(i), {}) for i in ids}
+    facts["Stage"] = facts["MatchID"].map({i: r.get("Stage") for i, r in rows.items()}).astype("category")
+    facts["Round"] = facts["MatchID"].map({i: r.get("Round") for i, r in rows.items()}).astype("category")
+    facts["Knockout"] = facts["MatchID"].map({i: bool(r.get("Knockout")) for i, r in rows.items()}).astype(bool)
+    return facts
+
+
+def select_match_ids(facts, category=None, knockout=None, match_ids=None):
+    """MatchIDs whose rows pass the filters, as boolean masks over the fact table.
+
+    category: Category value (None for all); knockout: True / False to keep
+    only knockout / non-knockout matches (see ``add_stage``); match_ids:
+    restrict to these IDs (any dtype).
+    """
+    if facts is None or facts.empty:
+        return np.array([])
+    mask = np.ones(len(facts), dtype=bool)
+    if category is not None:
+        mask &= (facts["Category"] == category).to_numpy()
+    if knockout is not None:
+        flags = facts["Knockout"].to_numpy() if "Knockout" in facts.columns else np.zeros(len(facts), dtype=bool)
+        mask &= flags == knockout
+    if match_ids is not None:
+        mask &= facts["MatchID"].isin(_match_id_values(facts, match_ids)).to_numpy()
+    return pd.unique(facts["MatchID"].to_numpy()[mask])
+
+
+def row_index(facts, col):
+    """{label: row positions} for one label column (Player, Team...), positions ascending.
+
+    Lets a view take one entity's rows with ``df.iloc[positions]`` instead
+    of scanning the whole table; works on any frame derived from the fact
+    table, categorical labels or not.
+    """
+    if facts is None or facts.empty or col not in facts.columns:
+        return {}
+    return facts.groupby(col, observed=True, sort=False).indices
+
+
+def _match_id_values(facts, match_list):
+    """Convert the IDs of a match list (match dicts or bare IDs) to the dtype used in ``facts``."""
+    ids = [m.get("MatchID", "Unknown") if isinstance(m, dict) else m for m in match_list]
+    if pd.api.types.is_integer_dtype(facts["MatchID"]):
+        return pd.to_numeric(pd.Series(ids), errors="coerce").dropna().astype("int64").unique()
+    return pd.Series(ids).astype(str).unique()
+
+
+def materialize(df):
+    """Return a plain pandas frame (object labels, float64/int64 stats).
+
+    Downstream analytics group on Team/Player and expect integer box-score
+    counts, so categoricals are decoded and float32 columns are upcast. The
+    upcast rounds to 4 decimals, which recovers the scraped decimal values
+    (e.g. MIN_DEC 23.45) exactly.
+    """
+    out = df.copy()
+    for col in out.columns:
+        dtype = out[col].dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            out[col] = out[col].astype(object)
+        elif dtype == np.float32:
+            vals = np.round(out[col].to_numpy(dtype="float64"), 4)
+            if not np.isnan(vals).any() and (vals % 1 == 0).all():
+                out[col] = vals.astype("int64")
+            else:
+                out[col] = vals
+    return out
+
+
+def _is_summed(col, series):
+    """Counting stats are summed across quarters; rates, labels and raw fields are not."""
+    return (pd.api.types.is_numeric_dtype(series) and col not in PASSTHROUGH_COLS
+            and not col.endswith("%") and col not in RATE_STATS and col not in STAGE_COLS)
+
+
+def build_period_cube(facts):
+    """Stack the quarter rows of the fact table on a period axis.
+
+    One slot per (quarter, player-game) so any set of quarters is a sum
+    over axis 0 instead of a groupby. Returns a dict, or None without
+    quarter rows:
+      keys      MatchID / PlayerKey per player-game (first-appearance order)
+      columns   fact-table column order (minus Period)
+      num_cols  numeric columns, in ``values``
+      summed    per num_col: True for counting stats, False for rates
+      values    float64 (quarter, player-game, num_col), NaN where absent
+      labels    {col: object (quarter, player-game)} for the other columns
+      label_null  {col: bool (quarter, player-game)}, missing label values
+      present   bool (quarter, player-game)
+      order     row position in the fact table, for groupby(sort=False) order
+    """
+    if facts is None or facts.empty:
+        return None
+    rows = facts[facts["Period"].isin(QUARTERS)]
+    if rows.empty:
+        return None
+
+    q = pd.Categorical(rows["Period"], categories=QUARTERS).codes
+    rows = materialize(rows.drop(columns="Period")).reset_index(drop=True)
+    keys = ["MatchID", "PlayerKey"]
+    g = rows.groupby(keys, sort=False).ngroup().to_numpy()
+    n = g.max() + 1
+
+    num_cols = [c for c in rows.columns
+                if c not in keys and c not in PASSTHROUGH_COLS and pd.api.types.is_numeric_dtype(rows[c])]
+    label_cols = [c for c in rows.columns if c not in keys and c not in num_cols]
+
+    values = np.full((len(QUARTERS), n, len(num_cols)), np.nan)
+    values[q, g] = rows[num_cols].to_numpy(dtype="float64")
+    present = np.zeros((len(QUARTERS), n), dtype=bool)
+    present[q, g] = True
+    order = np.full((len(QUARTERS), n), len(rows))
+    order[q, g] = np.arange(len(rows))
+    labels, label_null = {}, {}
+    for col in label_cols:
+        arr = np.full((len(QUARTERS), n), None, dtype=object)
+        arr[q, g] = rows[col].to_numpy(dtype=object)
+        labels[col] = arr
+        label_null[col] = pd.isna(arr)
+
+    return {
+        "keys": rows[keys].drop_duplicates().reset_index(drop=True),
+        "columns": list(rows.columns),
+        "num_cols": num_cols,
+        "summed": np.array([_is_summed(c, rows[c]) for c in num_cols], dtype=bool),
+        "values": values,
+        "labels": labels,
+        "label_null": label_null,
+        "present": present,
+        "order": order,
+    }
+
+
+def cube_rows(cube, quarters, match_list=None):
+    """Player-game rows for a set of quarters, summed over the period cube.
+
+    Counting stats are summed (NaN only when absent in every selected
+    quarter); rate stats and labels keep the first selected quarter's
+    value, as in ``analytics.combine_period_stats``. Rows and dtypes match
+    a groupby over the selected quarter rows of the fact table.
+    """
+    if cube is None:
+        return pd.DataFrame()
+    qi = [QUARTERS.index(q) for q in QUARTERS if q in quarters]
+    if not qi:
+        return pd.DataFrame()
+
+    present = cube["present"][qi]
+    rows = present.any(axis=0)
+    if match_list is not None:
+        rows &= cube["keys"]["MatchID"].isin(_match_id_values(cube["keys"], match_list)).to_numpy()
+    if not rows.any():
+        return pd.DataFrame()
+    first_seen = cube["order"][qi][:, rows].min(axis=0)
+    idx = np.flatnonzero(rows)[np.argsort(first_seen, kind="stable")]
+    present = present[:, idx]
+
+    vals = cube["values"][np.ix_(qi, idx)]
+    missing = np.isnan(vals)
+    summed = np.where(missing, 0.0, vals).sum(axis=0)
+    summed[missing.all(axis=0)] = np.nan
+    first = np.take_along_axis(vals, (~missing).argmax(axis=0)[None], axis=0)[0]
+    out_vals = np.where(cube["summed"], summed, first)
+
+    # Integer columns stay integer when every selected quarter row is a whole number
+    # (NaN != trunc(NaN), so a missing value also keeps the column float)
+    as_int = ~((np.trunc(vals) != vals) & present[..., None]).any(axis=(0, 1))
+
+    keys = cube["keys"].iloc[idx]
+    cols = {col: keys[col].to_numpy() for col in keys.columns}
+    for j, col in enumerate(cube["num_cols"]):
+        if as_int[j]:
+            cols[col] = out_vals[:, j].astype("int64")
+        elif not missing[:, :, j].all():
+            cols[col] = out_vals[:, j]
+    pos = np.arange(len(idx))
+    for col, arr in cube["labels"].items():
+        valid = ~cube["label_null"][col][np.ix_(qi, idx)]
+        if valid.any():
+            cols[col] = pd.Series(arr[np.ix_(qi, idx)][valid.argmax(axis=0), pos]).infer_objects()
+    return pd.DataFrame({col: cols[col] for col in cube["columns"] if col in cols})
+
+
+def player_game_rows(facts, period="Full Game", match_list=None, cube=None):
+    """Select the rows of one period (optionally for a subset of matches).
+
+    ``match_list`` may be match dicts or MatchIDs (see ``select_match_ids``).
+
+    "1st Half" / "2nd Half" (and single quarters, when a ``cube`` from
+    ``build_period_cube`` is passed) are summed over the quarter cube; see
+    ``cube_rows``.
+    """
+    if cube is not None and period in QUARTER_SETS:
+        return cube_rows(cube, QUARTER_SETS[period], match_list)
+
+    if facts is None or facts.empty:
+        return pd.DataFrame()
+
+    if match_list is not None:
+        facts = facts[facts["MatchID"].isin(_match_id_values(facts, match_list))]
+
+    if period in HALVES:
+        return cube_rows(build_period_cube(facts), HALVES[period])
+
+    if period not in PERIODS:
+        return pd.DataFrame()
+
+    rows = facts[facts["Period"] == period]
+    if rows.empty:
+        return pd.DataFrame()
+    rows = rows.drop(columns="Period").dropna(axis=1, how="all")
+    return materialize(rows).reset_index(drop=True)
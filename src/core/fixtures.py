@@ -0,0 +1,123 @@
+"""Materialized schedule <-> scraped stats <-> manual score join ("fixtures")."""
+import re
+import pandas as pd
+from src.core import match_index as mi
+
+# Score sources in priority order
+SOURCE_STATS = "stats"
+SOURCE_MANUAL = "manual"
+SOURCE_SCHEDULE = "schedule"
+
+_SCORE_RE = re.compile(r"^\s*(\d+)\s*[-–—]\s*(\d+)\s*$")
+_ORDINAL_RE = re.compile(r"(\d+)(st|nd|rd|th)\b", re.IGNORECASE)
+
+
+def parse_schedule_dates(dates):
+    """Parse the schedule's mixed Date formats ("4th January 2026", "05-01-2026", "05-Jan-2026")."""
+    cleaned = dates.astype(str).str.strip().str.replace(_ORDINAL_RE, r"\1", regex=True)
+    return pd.to_datetime(cleaned, format="mixed", dayfirst=True, errors="coerce")
+
+
+def add_fixture_keys(fx):
+    """Add canonical TeamKeyA/TeamKeyB, Division (Title-case gender) and parsed MatchDate."""
+    fx['TeamKeyA'] = [mi.canon_team(t) if not pd.isna(t) else None for t in fx['Team A']]
+    fx['TeamKeyB'] = [mi.canon_team(t) if not pd.isna(t) else None for t in fx['Team B']]
+    fx['Division'] = [mi.canon_category(g) for g in fx['Gender']]
+    fx['MatchDate'] = parse_schedule_dates(fx['Date']) if 'Date' in fx.columns else pd.NaT
+    return fx
+
+
+def parse_score(text):
+    """Parse a schedule Score cell ("54-88" or "54–88") into (s1, s2)."""
+    if text is None or (isinstance(text, float) and pd.isna(text)):
+        return None
+    m = _SCORE_RE.match(str(text))
+    if not m:
+        return None
+    return int(m.group(1)), int(m.group(2))
+
+
+def manual_score(manual_scores, team_a, team_b, gender):
+    """Look up ``T1_VS_T2_GENDER`` (then the reverse key) oriented to team_a."""
+    a, b, g = mi.canon_team(team_a), mi.canon_team(team_b), str(gender).strip().upper()
+    fwd = manual_scores.get(f"{a}_VS_{b}_{g}")
+    if fwd:
+        return fwd['s1'], fwd['s2']
+    rev = manual_scores.get(f"{b}_VS_{a}_{g}")
+    if rev:
+        return rev['s2'], rev['s1']
+    return None
+
+
+def stats_score(m, team_a):
+    """Final score of a scraped match oriented to the schedule's Team A."""
+    s1 = m['TeamStats']['t1']['PTS']
+    s2 = m['TeamStats']['t2']['PTS']
+    if mi.canon_team(m['Teams']['t2']) == mi.canon_team(team_a):
+        s1, s2 = s2, s1
+    return s1, s2
+
+
+def build_fixtures(schedule_df, match_list, manual_scores):
+    """Join every schedule row to its scraped match and final score.
+
+    Returns the schedule (same index and columns) plus:
+      DataMatchID  canonical MatchID of the scraped match, or None
+      S1, S2       final score oriented to Team A / Team B (nullable ints)
+      ScoreSource  "stats", "manual", "schedule" or None when unplayed
+      Stage        schedule Group (A, B, Quarterfinal...), else its Stage
+      TeamKeyA/B, Division, MatchDate  canonical keys (see add_fixture_keys)
+    Scraped stats win over manual scores, which win over the Score column.
+    """
+    if schedule_df is None or schedule_df.empty:
+        return pd.DataFrame()
+
+    fx = schedule_df.copy()
+    index = mi.build_match_index(match_list)
+    manual_scores = manual_scores or {}
+    genius = fx['Genius Match ID'] if 'Genius Match ID' in fx.columns else pd.Series(None, index=fx.index)
+    score_col = fx['Score'] if 'Score' in fx.columns else pd.Series(None, index=fx.index)
+
+    data_ids, s1s, s2s, sources = [], [], [], []
+    for team_a, team_b, gender, gid, score_txt in zip(fx['Team A'], fx['Team B'], fx['Gender'], genius, score_col):
+        data_id, score, source = None, None, None
+        if not pd.isna(team_a):
+            m = mi.lookup(index, team_a, team_b, gender, gid)
+            if m:
+                data_id = mi.canon_match_id(m.get("MatchID"))
+                score, source = stats_score(m, team_a), SOURCE_STATS
+            else:
+                score = manual_score(manual_scores, team_a, team_b, gender)
+                source = SOURCE_MANUAL
+                if score is None:
+                    score, source = parse_score(score_txt), SOURCE_SCHEDULE
+            if score is None:
+                source = None
+        data_ids.append(data_id)
+        s1s.append(score[0] if score else None)
+        s2s.append(score[1] if score else None)
+        sources.append(source)
+
+    fx['DataMatchID'] = data_ids
+    fx['S1'] = pd.array(s1s, dtype="Int64")
+    fx['S2'] = pd.array(s2s, dtype="Int64")
+    fx['ScoreSource'] = sources
+    group = fx['Group'] if 'Group' in fx.columns else pd.Series(None, index=fx.index)
+    stage = fx['Stage'] if 'Stage' in fx.columns else pd.Series(None, index=fx.index)
+    fx['Stage'] = group.where(group.notna(), stage)
+    return add_fixture_keys(fx)
+
+
+def stage_by_match_id(fixtures):
+    """{canonical data MatchID: stage} for fixtures that resolved to stats."""
+    if fixtures is None or fixtures.empty:
+        return {}
+    linked = fixtures[fixtures['DataMatchID'].notna()]
+    stages = dict(zip(linked['DataMatchID'], linked['Stage']))
+    # Schedule rows whose match hasn't been linked still carry a Genius ID
+    if 'Genius Match ID' in fixtures.columns:
+        for gid, stg in zip(fixtures['Genius Match ID'], fixtures['Stage']):
+            key = mi.canon_match_id(gid)
+            if key is not None:
+                stages.setdefault(key, stg)
+    return stages
@@ -1,5 +1,13 @@
 """Data formatting and styling utilities for display."""
 import pandas as pd
+from src.core import tables as tbl
+
+# Cells at or above these are highlighted by format_df
+EXCEPTIONAL_THRESHOLDS = {
+    "Pts": 20, "PTS": 20, "REB": 10, "Reb": 10, "REB%": 10, "AST": 6, "STL": 4, "BLK": 3,
+    "PIE": 15, "GmScr": 15, "FIC": 15, "Eff": 20, "EFF": 20,
+    "FG%": 50.0, "2P%": 50.0, "3P%": 40.0, "FT%": 80.0,
+}
 
 
 def format_df(df, precision=0):
@@ -10,7 +18,8 @@ def format_df(df, precision=0):
         precision: Decimal places for count stats (0 for totals, 1 for averages)
     
     Returns:
-        Styled DataFrame with conditional formatting
+        Cached (values, text, mask) display table (see src.core.tables);
+        render it with src.ui.display.render_table(..., highlight_css=EXCEPTIONAL_CSS)
     """
     df = df.copy()
     
@@ -42,36 +51,6 @@ def format_df(df, precision=0):
     if 'GP' in df.columns:
         df['GP'] = pd.to_numeric(df['GP'], errors='coerce').fillna(0).astype(int)
             
-    # Conditional Formatting Logic
-    def highlight_exceptional(s):
-        is_high = pd.Series(data=False, index=s.index)
-        col = s.name
-        
-        # Thresholds
-        try:
-            # Count Stats
-            if col in ["Pts", "PTS"]: is_high = s >= 20
-            elif col in ["REB", "Reb", "REB%"]: is_high = s >= 10
-            elif col in ["AST"]: is_high = s >= 6
-            elif col in ["STL"]: is_high = s >= 4
-            elif col in ["BLK"]: is_high = s >= 3
-            
-            # Advanced / Composite
-            elif col in ["PIE"]: is_high = s >= 15
-            elif col in ["GmScr"]: is_high = s >= 15
-            elif col in ["FIC"]: is_high = s >= 15
-            elif col in ["Eff", "EFF"]: is_high = s >= 20
-            
-            # Percentages
-            elif col in ["FG%", "2P%"]: is_high = s >= 50.0
-            elif col in ["3P%"]: is_high = s >= 40.0
-            elif col in ["FT%"]: is_high = s >= 80.0
-            
-        except:
-            pass # Handle comparison errors
-        
-        return ['background-color: #1a472a; color: white; font-weight: bold' if v else '' for v in is_high]
-    
     # Create a format dictionary to avoid .0 on integers
     format_dict = {}
     for col in df.columns:
@@ -87,19 +66,7 @@ def format_df(df, precision=0):
         elif pd.api.types.is_numeric_dtype(df[col]):
             format_dict[col] = f"{{:.{precision}f}}"
 
-    # Styler Definition
-    styler = df.style.format(format_dict, na_rep="-")\
-                     .set_properties(**{'text-align': 'center', 'vertical-align': 'middle'})\
-                     .set_table_styles([
-                         {'selector': 'th', 'props': [('text-align', 'center'), ('vertical-align', 'middle'), ('font-weight', 'bold')]},
-                         {'selector': 'td', 'props': [('text-align', 'center'), ('vertical-align', 'middle')]}
-                     ])
+    # Highlight exceptional performances (render with src.ui.display.EXCEPTIONAL_CSS)
+    highlight = {col: t for col, t in EXCEPTIONAL_THRESHOLDS.items() if col in df.columns}
 
-    # Apply Highlight
-    target_cols = ["Pts", "PTS", "REB", "AST", "STL", "BLK", "PIE", "GmScr", "FIC", "Eff", "FG%", "2P%", "3P%", "FT%"]
-    existing_cols = [c for c in target_cols if c in df.columns]
-    
-    if existing_cols:
-        styler.apply(highlight_exceptional, subset=existing_cols)
-        
-    return styler
+    return tbl.display_table(df, format_dict, highlight)
@@ -0,0 +1,72 @@
+"""Top-k leaderboard index: leader cards as lookups instead of sorts.
+
+A ``Leaderboard`` holds the top ``k`` rows of one stat frame for each
+leader stat, overall and per group (Category for season aggregates, Date
+for single-game highs). Order matches ``df.nlargest(k, stat)``: highest
+first, ties in row order, NaN rows last. ``leaderboard`` caches one per
+data key for the process, so a rerun only slices it.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+LEADER_STATS = ("PTS", "REB", "AST", "STL", "BLK", "GmScr")
+TOP_K = 10
+
+
+def top_positions(values, k):
+    """Positions of the ``k`` largest values, in nlargest(keep="first") order.
+
+    O(n): a partition finds the k-th largest value, and only the rows at or
+    above it (ties included) are sorted.
+    """
+    values = np.asarray(values, dtype=float)
+    missing = np.isnan(values)
+    valid = np.flatnonzero(~missing)
+    if len(valid) > k:
+        kth = np.partition(values[valid], len(valid) - k)[len(valid) - k]
+        valid = valid[values[valid] >= kth]
+    # Descending value, then original position; nlargest pads with NaN rows
+    top = valid[np.lexsort((valid, -values[valid]))][:k]
+    if len(top) < k:
+        top = np.concatenate([top, np.flatnonzero(missing)[:k - len(top)]])
+    return top
+
+
+class Leaderboard:
+    """Top-k rows per leader stat of one frame, overall and per ``group_col`` value."""
+
+    def __init__(self, df, stats=LEADER_STATS, k=TOP_K, group_col=None):
+        df = df.reset_index(drop=True)
+        self.columns = df.columns
+        self.k = k
+        self._top = {}
+        groups = [(None, np.arange(len(df)))]
+        if group_col is not None and group_col in df.columns:
+            groups += list(df.groupby(group_col, sort=False).indices.items())
+        for stat in stats:
+            if stat not in df.columns:
+                continue
+            values = pd.to_numeric(df[stat], errors="coerce").to_numpy(dtype=float)
+            for group, rows in groups:
+                self._top[(stat, group)] = df.iloc[rows[top_positions(values[rows], k)]]
+
+    def __contains__(self, stat):
+        return (stat, None) in self._top
+
+    def top(self, stat, n=5, group=None):
+        """The top ``n`` (<= k) rows for ``stat``, highest first; empty if the stat or group is unknown."""
+        rows = self._top.get((stat, group))
+        if rows is None:
+            return pd.DataFrame(columns=self.columns)
+        return rows.head(n).reset_index(drop=True)
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def leaderboard(_df, key, stats=LEADER_STATS, k=TOP_K, group_col=None):
+    """Process-wide Leaderboard for ``_df``; ``key`` identifies it (data key plus view filters).
+
+    The frame itself is not hashed, so ``key`` must change whenever its
+    contents would.
+    """
+    return Leaderboard(_df, stats, k, group_col)
@@ -0,0 +1,54 @@
+"""Constant-time lookup of scraped matches from schedule rows."""
+import pandas as pd
+
+
+def canon_team(name):
+    """Canonical team key: trimmed, single-spaced, upper case."""
+    return " ".join(str(name).split()).upper()
+
+
+def canon_category(cat):
+    return str(cat).strip().title()
+
+
+def pair_key(category, team_a, team_b):
+    """(category, unordered team pair) key, so A vs B == B vs A."""
+    return (canon_category(category), frozenset((canon_team(team_a), canon_team(team_b))))
+
+
+def canon_match_id(mid):
+    """Normalise IDs read as 2797383, "2797383" or 2797383.0 to one string."""
+    if mid is None or (isinstance(mid, float) and pd.isna(mid)):
+        return None
+    s = str(mid).strip()
+    if s.endswith(".0"):
+        s = s[:-2]
+    return s or None
+
+
+def build_match_index(match_list):
+    """Index matches by MatchID and by (category, team pair).
+
+    When several matches share a pairing the first one in ``match_list``
+    wins, matching the old linear scan.
+    """
+    by_id, by_pair = {}, {}
+    for m in match_list or []:
+        mid = canon_match_id(m.get("MatchID"))
+        if mid is not None:
+            by_id.setdefault(mid, m)
+        teams = m.get("Teams", {})
+        by_pair.setdefault(pair_key(m.get("Category", ""), teams.get("t1"), teams.get("t2")), m)
+    return {"by_id": by_id, "by_pair": by_pair}
+
+
+def lookup(index, team_a, team_b, category, match_id=None):
+    """Return the match dict for a fixture, or None.
+
+    ``match_id`` (the schedule's Genius Match ID) is tried first, then the
+    category + team pair.
+    """
+    mid = canon_match_id(match_id)
+    if mid is not None and mid in index["by_id"]:
+        return index["by_id"][mid]
+    return index["by_pair"].get(pair_key(category, team_a, team_b))
@@ -0,0 +1,110 @@
+"""Percentile ranks and z-scores of every player x stat, for the comparison view.
+
+``comparison_matrix`` is built once per data version and minutes
+qualifier, and returns four aligned frames (one row per player):
+
+  values  the player aggregates with derived stats (GP > 0)
+  units   each stat as the comparison shows it: per game for counting
+          stats, as-is for rates and ratings
+  pct     percentile rank 0-100 within the player's Category
+  z       z-score within the player's Category
+
+The reference pool is the players of the same Category averaging at least
+``min_mpg`` minutes; everyone is ranked against it, qualified or not.
+Both scores are oriented so that higher is better (TOV, PF and DEFRTG are
+flipped).
+"""
+import numpy as np
+import pandas as pd
+
+from src import analytics as ant
+from src.core.shared_frames import shared_frames
+
+# Counting stats compared per game
+PER_GAME_STATS = ["PTS", "REB", "OREB", "DREB", "AST", "STL", "BLK", "TOV", "PF",
+                  "FGM", "FGA", "2PM", "2PA", "3PM", "3PA", "FTM", "FTA",
+                  "FIC", "GmScr", "+/-"]
+# Stats on a 0-100 scale
+PERCENT_STATS = ["FG%", "2P%", "3P%", "FT%", "eFG%", "TS%", "AST%", "USG%"]
+LOWER_IS_BETTER = ["TOV", "PF", "DEFRTG"]
+
+
+def stat_units(df, stats):
+    """Stats in comparison units: per game for PER_GAME_STATS, unchanged otherwise."""
+    gp = df["GP"].where(df["GP"] > 0)
+    units = pd.DataFrame(index=df.index)
+    for stat in stats:
+        col = pd.to_numeric(df[stat], errors="coerce")
+        units[stat] = (col / gp) if stat in PER_GAME_STATS else col
+    return units
+
+
+def _group_scores(values, pool):
+    """(percentile, z) of ``values`` against the non-NaN ``pool`` values."""
+    pool = np.sort(pool[~np.isnan(pool)])
+    if len(pool) == 0:
+        return np.full(len(values), np.nan), np.full(len(values), np.nan)
+    # Mid-rank percentile: ties count half, so a pool of equal values sits at 50
+    below = np.searchsorted(pool, values, side="left")
+    at_or_below = np.searchsorted(pool, values, side="right")
+    pct = 100.0 * (below + at_or_below) / (2 * len(pool))
+    std = pool.std()
+    z = (values - pool.mean()) / std if std > 0 else np.zeros(len(values))
+    missing = np.isnan(values)
+    pct[missing] = np.nan
+    z[missing] = np.nan
+    return pct, z
+
+
+def percentile_matrix(units, qualified, groups):
+    """(pct, z) frames for ``units`` ranked within each group's qualified rows."""
+    vals = units.to_numpy(dtype=float)
+    pct = np.full(vals.shape, np.nan)
+    z = np.full(vals.shape, np.nan)
+    for rows in pd.Series(groups).groupby(groups, sort=False).indices.values():
+        pool_rows = rows[qualified[rows]]
+        for i, stat in enumerate(units.columns):
+            p, s = _group_scores(vals[rows, i], vals[pool_rows, i])
+            if stat in LOWER_IS_BETTER:
+                p, s = 100.0 - p, -s
+            pct[rows, i] = p
+            z[rows, i] = s
+    return (pd.DataFrame(pct, index=units.index, columns=units.columns),
+            pd.DataFrame(z, index=units.index, columns=units.columns))
+
+
+@shared_frames(max_entries=16)
+def comparison_matrix(_df_players, data_key, stats, min_mpg=0.0):
+    """(values, units, pct, z) for the comparison view (see module docstring).
+
+    ``_df_players`` is MetricsEngine's player aggregate for ``data_key``;
+    ``stats`` is a tuple of the stat columns to score.
+    """
+    values = ant.calculate_derived_stats(_df_players)
+    values = values[values["GP"] > 0].reset_index(drop=True)
+    stats = [s for s in stats if s in values.columns]
+    units = stat_units(values, stats)
+    mpg = values["MIN_CALC"] / values["GP"] if "MIN_CALC" in values.columns else pd.Series(np.inf, index=values.index)
+    qualified = (mpg >= min_mpg).to_numpy()
+    groups = values["Category"].astype(str).to_numpy() if "Category" in values.columns else np.zeros(len(values))
+    pct, z = percentile_matrix(units, qualified, groups)
+    return values, units, pct, z
+
+
+def relative_scale(units, stats):
+    """Radar values 0-100 relative to the selected players (the original radar scale).
+
+    Percentages are out of 100; other stats out of 1.5x the selection's
+    highest value (at least 1 for per-game stats, 10 for the rest).
+    """
+    scaled = pd.DataFrame(index=units.index)
+    for stat in stats:
+        col = units[stat].fillna(0)
+        if stat in PERCENT_STATS:
+            top = 100
+        elif stat in PER_GAME_STATS:
+            top = max(max(col.max(), 0) * 1.5, 1)
+        else:
+            top = max(max(col.abs().max(), 0) * 1.5, 10)
+        scaled[stat] = col / top * 100
+    return scaled
@@ -0,0 +1,305 @@
+"""Power rankings: full build plus incremental updates when a single result lands."""
+import pandas as pd
+from src.core import match_index as mi
+from src.core import ratings as rt
+from src.core import stages as stg
+
+# --- MASTER GROUP MAPPING (USER DEFINED) ---
+# Forces teams into correct groups regardless of schedule data (A1->A, etc.)
+MAPPING_LIST = [
+        ("Tamil Nadu", "Men", "A"), ("Karnataka", "Men", "A"), ("Services", "Men", "A"), ("Rajasthan", "Men", "A"), ("Gujarat", "Men", "A"),
+        ("Punjab", "Men", "B"), ("Indian Railways", "Men", "B"), ("Delhi", "Men", "B"), ("Uttar Pradesh", "Men", "B"), ("Chandigarh", "Men", "B"),
+        ("Kerala", "Men", "C"), ("Jammu & Kashmir", "Men", "C"), ("Jharkhand", "Men", "C"), ("West Bengal", "Men", "C"),
+        ("Madhya Pradesh", "Men", "D"), ("Goa", "Men", "D"), ("Maharashtra", "Men", "D"), ("Uttarakhand", "Men", "D"),
+        ("Haryana", "Men", "E"), ("Chhattisgarh", "Men", "E"), ("Meghalaya", "Men", "E"), ("Tripura", "Men", "E"),
+        ("Himachal Pradesh", "Men", "F"), ("Bihar", "Men", "F"), ("Mizoram", "Men", "F"), ("Telangana", "Men", "F"),
+        ("Andaman & Nicobar", "Men", "G"), ("Assam", "Men", "G"), ("Nagaland", "Men", "G"), ("Sikkim", "Men", "G"),
+        ("Andhra Pradesh", "Men", "H"), ("Arunachal Pradesh", "Men", "H"), ("Odisha", "Men", "H"), ("Puducherry", "Men", "H"),
+        # WOMEN
+        ("Indian Railways", "Women", "A"), ("Delhi", "Women", "A"), ("Chhattisgarh", "Women", "A"), ("Maharashtra", "Women", "A"), ("Karnataka", "Women", "A"),
+        ("Kerala", "Women", "B"), ("Tamil Nadu", "Women", "B"), ("Madhya Pradesh", "Women", "B"), ("Gujarat", "Women", "B"), ("West Bengal", "Women", "B"),
+        ("Punjab", "Women", "C"), ("Goa", "Women", "C"), ("Haryana", "Women", "C"), ("Tripura", "Women", "C"), ("Uttarakhand", "Women", "C"),
+        ("Uttar Pradesh", "Women", "D"), ("Chandigarh", "Women", "D"), ("Jammu & Kashmir", "Women", "D"), ("Telangana", "Women", "D"),
+        ("Rajasthan", "Women", "E"), ("Bihar", "Women", "E"), ("Jharkhand", "Women", "E"), ("Sikkim", "Women", "E"),
+        ("Himachal Pradesh", "Women", "F"), ("Arunachal Pradesh", "Women", "F"), ("Manipur", "Women", "F"), ("Puducherry", "Women", "F"),
+        ("Andhra Pradesh", "Women", "G"), ("Assam", "Women", "G"), ("Meghalaya", "Women", "G"), ("Odisha", "Women", "G")
+]
+
+# (Team, Gender) -> Group
+MASTER_MAP = {(t, g): grp for t, g, grp in MAPPING_LIST}
+
+# More new results than this in one rerun -> full rebuild instead of incremental updates
+INCREMENTAL_LIMIT = 4
+
+# Group codes of placeholder pools that never appear in the rankings
+PLACEHOLDER_GROUPS = ["A1", "B1", "A2", "B2"]
+
+
+def group_stage_fixtures(fixtures):
+    """Drop knockout rounds; the rankings only use group-stage results."""
+    if fixtures.empty:
+        return fixtures
+    # Placing games still count; only elimination-bracket rounds are dropped
+    if 'Round' in fixtures.columns:
+        return fixtures[~fixtures['Round'].map(stg.is_bracket_round)]
+    if 'Group' not in fixtures.columns:
+        return fixtures
+    return fixtures[~fixtures['Group'].map(stg.stage_round).map(stg.is_bracket_round)]
+
+
+def adv_lookup(df_adv):
+    """{Team: first advanced-stats row} - the first T_KEY wins, as before."""
+    if df_adv is None or df_adv.empty:
+        return {}
+    out = {}
+    for rec in df_adv.to_dict("records"):
+        out.setdefault(rec['Team'], rec)
+    return out
+
+
+def ranking_row(rec, adv, ratings=None):
+    """Score one standings row ({Team, Gender, Group, GP, W, L, PF, PA, PD, PTS}).
+
+    ``ratings`` is {(Team, Gender): SRS} from ``scored_games``; teams
+    without games rate 0.
+    """
+    team = rec['Team']
+    gender = rec['Gender']
+
+    # Mapping keys are Title Case (e.g. "Tamil Nadu"), but data might be uppercase ("TAMIL NADU")
+    assigned_group = MASTER_MAP.get((team.title(), gender), MASTER_MAP.get((team, gender), rec['Group']))
+
+    # Base Metric (Win % + PD Factor)
+    win_pct = rec['W'] / rec['GP'] if rec['GP'] > 0 else 0
+    pd_norm = rec['PD'] / rec['GP'] if rec['GP'] > 0 else 0
+    # Normalize PD: assume max PD is ~50.
+    pd_score = min(max(pd_norm / 50.0, -1.0), 1.0) * 20 # +/- 20 points impact
+
+    base_score = (win_pct * 60) + 20 + pd_score # 0-80 range approx
+
+    # Advanced Metric Bonus
+    adv_bonus = 0
+    adv_row = adv.get(team)
+    has_stats = adv_row is not None
+
+    if has_stats:
+        # Net Rating (-30 to +30 range approx) -> +/- 10
+        net = adv_row.get('NetRtg', 0)
+        net_score = min(max(net / 30.0, -1.0), 1.0) * 10
+
+        # PIE is % (e.g. 50%) -> +/- 10
+        pie = adv_row.get('PIE', 50)
+        pie_score = ((pie - 50) / 20) * 10
+
+        # Sanity cap
+        adv_bonus = min(max(net_score + pie_score, -15), 15)
+
+    final_score = base_score + adv_bonus
+
+    return {
+        "Team": team.title(), # Normalize to Title Case
+        "Category": gender,
+        "Group": assigned_group,
+        "Record": f"{rec['W']}-{rec['L']}",
+        "GP": rec['GP'],
+        "W": rec['W'],
+        "L": rec['L'],
+        "Diff": rec['PD'],
+        "PD": rec['PD'],
+        "PF": rec.get('PF', 0),
+        "PA": rec.get('PA', 0),
+        "PTS": rec.get('PTS', 0),
+        "Score": round(final_score, 1),
+        "SRS": round((ratings or {}).get((team, gender), 0.0), 1),
+        "HasStats": has_stats,
+        "Trend": 0 # Placeholder
+    }
+
+
+def _empty_row(team_name, team_gender, group_code):
+    return {"Team": team_name, "Category": team_gender, "Group": group_code, "Record": "0-0",
+            "GP": 0, "W": 0, "L": 0, "Diff": 0, "PD": 0, "PF": 0, "PA": 0, "PTS": 0,
+            "Score": 0.0, "SRS": 0.0, "HasStats": False, "Trend": 0}
+
+
+def _keep(row):
+    # Filter out "W/O" placeholders or invalid teams
+    return "W/O" not in row['Team'] and row['Group'] not in PLACEHOLDER_GROUPS
+
+
+def rank_rows(rows):
+    """Order by Category then Score (desc), ties by Team, and number teams within each category."""
+    df_rank = pd.DataFrame(rows)
+    if not df_rank.empty:
+        df_rank = df_rank.sort_values(['Category', 'Score', 'Team'], ascending=[True, False, True], kind="stable")
+        df_rank['Rank'] = df_rank.groupby('Category').cumcount() + 1
+    return df_rank
+
+
+def build_rankings(df_unified, df_adv, ratings=None):
+    """Full power-rankings table from unified standings, team advanced stats and SRS ratings."""
+    adv = adv_lookup(df_adv)
+    rankings = [ranking_row(rec, adv, ratings) for rec in df_unified.to_dict("records")]
+
+    # --- INJECT MISSING TEAMS FROM MAP ---
+    # Ensure all User-Defined teams appear even if they have 0 games
+    existing_teams = {(r['Team'].strip().title(), r['Category']) for r in rankings}
+    for (team_name, team_gender), group_code in MASTER_MAP.items():
+        if (team_name.strip().title(), team_gender) not in existing_teams:
+            rankings.append(_empty_row(team_name, team_gender, group_code))
+
+    return rank_rows([r for r in rankings if _keep(r)])
+
+
+class RankingState:
+    """Standings + rankings kept between reruns so one new result is a local update.
+
+    ``results`` maps each counted fixture (Match ID, Division) to its
+    (S1, S2); ``match_ids`` is the set of scraped matches behind ``df_adv``;
+    ``games`` holds the same fixtures as SRS equations (see scored_games).
+    """
+
+    def __init__(self, standings, df_adv, rankings, results, match_ids, games, ratings):
+        # Standings rows keyed by (Team, Gender) for direct updates
+        self.standings = {(r['Team'], r['Gender']): r for r in standings.to_dict("records")}
+        self.df_adv = df_adv
+        self.adv = adv_lookup(df_adv)
+        self.rankings = rankings
+        self.results = results
+        self.match_ids = match_ids
+        self.games = games
+        self.ratings = ratings
+
+    @classmethod
+    def build(cls, fixtures, df_unified, df_adv, match_ids):
+        games = scored_games(fixtures)
+        ratings = rt.team_ratings(games.values())
+        return cls(df_unified, df_adv, build_rankings(df_unified, df_adv, ratings),
+                   scored_results(fixtures), set(match_ids), games, ratings)
+
+    def apply_result(self, fixture):
+        """Fold one new scored fixture into its two team rows and re-rank that category."""
+        gender = fixture['Division']
+        s1, s2 = int(fixture['S1']), int(fixture['S2'])
+        touched = []
+        for team, pf, pa in ((fixture['TeamKeyA'], s1, s2), (fixture['TeamKeyB'], s2, s1)):
+            rec = self.standings.get((team, gender))
+            if rec is None:
+                return False
+            rec['GP'] += 1
+            rec['PF'] += pf
+            rec['PA'] += pa
+            if pf > pa:
+                rec['W'] += 1
+                rec['PTS'] += 2
+            else:
+                rec['L'] += 1
+                rec['PTS'] += 1
+            rec['PD'] = rec['PF'] - rec['PA']
+            touched.append(rec)
+
+        self.results[fixture_key(fixture)] = (s1, s2)
+        # One result moves the SRS of every team connected to it, so re-solve and refresh the column
+        self.games[fixture_key(fixture)] = _game(fixture)
+        self.ratings = rt.team_ratings(self.games.values())
+        if not self._rerank(touched):
+            return False
+        srs = {(team.title(), gender): round(r, 1) for (team, gender), r in self.ratings.items()}
+        self.rankings['SRS'] = [srs.get(k, 0.0) for k in zip(self.rankings['Team'], self.rankings['Category'])]
+        return True
+
+    def refresh_adv(self, adv_rows):
+        """Swap in fresh MetricsEngine Teams rows (by T_KEY) and re-score those teams."""
+        if adv_rows is None or adv_rows.empty:
+            return True
+        keys = set(adv_rows['T_KEY'])
+        kept = self.df_adv[~self.df_adv['T_KEY'].isin(keys)] if not self.df_adv.empty else self.df_adv
+        self.df_adv = pd.concat([kept, adv_rows], ignore_index=True).sort_values("T_KEY", kind="stable")
+        self.adv = adv_lookup(self.df_adv)
+        # Advanced stats are looked up by team name, so re-score every row sharing it
+        names = set(adv_rows['Team'])
+        return self._rerank([r for r in self.standings.values() if r['Team'] in names])
+
+    def _rerank(self, recs):
+        """Replace the ranking rows of ``recs`` and re-order only their categories; False means rebuild."""
+        df = self.rankings
+        categories = set()
+        for rec in recs:
+            row = ranking_row(rec, self.adv, self.ratings)
+            hit = (df['Team'] == row['Team']) & (df['Category'] == row['Category'])
+            if not hit.any() or not _keep(row):
+                return False
+            for col, val in row.items():
+                df.loc[hit, col] = val
+            categories.add(row['Category'])
+
+        for cat in categories:
+            block = df[df['Category'] == cat].sort_values(['Score', 'Team'], ascending=[False, True], kind="stable")
+            block['Rank'] = range(1, len(block) + 1)
+            df = pd.concat([df[df['Category'] < cat], block, df[df['Category'] > cat]])
+        self.rankings = df
+        return True
+
+
+def fixture_key(fixture):
+    return (str(fixture['Match ID']), fixture['Division'])
+
+
+def _scored(fixtures):
+    # Same fixtures compute_standings counts: both teams known and both scores in
+    return fixtures[fixtures['TeamKeyA'].notna() & fixtures['TeamKeyB'].notna()
+                    & fixtures['S1'].notna() & fixtures['S2'].notna()]
+
+
+def scored_results(fixtures):
+    """{(Match ID, Division): (S1, S2)} for every counted fixture, first row per fixture wins."""
+    out = {}
+    for fixture in _scored(fixtures).to_dict("records"):
+        out.setdefault(fixture_key(fixture), (int(fixture['S1']), int(fixture['S2'])))
+    return out
+
+
+def _game(fixture):
+    division = fixture['Division']
+    return ((fixture['TeamKeyA'], division), (fixture['TeamKeyB'], division),
+            float(fixture['S1']) - float(fixture['S2']))
+
+
+def scored_games(fixtures):
+    """{(Match ID, Division): ((TeamKeyA, Division), (TeamKeyB, Division), S1 - S2)}, as scored_results."""
+    out = {}
+    for fixture in _scored(fixtures).to_dict("records"):
+        out.setdefault(fixture_key(fixture), _game(fixture))
+    return out
+
+
+def pending_results(state, fixtures, match_ids):
+    """New fixtures not yet folded into ``state``, or None if a full rebuild is needed.
+
+    A rebuild is needed when a counted score changed or disappeared, or a
+    scraped match was removed (box scores behind the advanced stats changed).
+    """
+    current = scored_results(fixtures)
+    if any(current.get(k) != v for k, v in state.results.items()):
+        return None
+    if not state.match_ids <= set(match_ids):
+        return None
+    new_keys = [k for k in current if k not in state.results]
+    if not new_keys:
+        return []
+    by_key = {}
+    for fixture in _scored(fixtures).to_dict("records"):
+        by_key.setdefault(fixture_key(fixture), fixture)
+    return [by_key[k] for k in new_keys]
+
+
+def match_ids_of(match_list):
+    return [mi.canon_match_id(m.get("MatchID")) for m in match_list]
+
+
+def team_adv_rows(df_teams, team_keys, division):
+    """MetricsEngine Teams rows of the given canonical teams in one division."""
+    if df_teams is None or df_teams.empty:
+        return df_teams
+    hit = df_teams['Team'].map(mi.canon_team).isin(team_keys) & (df_teams['Category'].astype(str) == division)
+    return df_teams[hit]
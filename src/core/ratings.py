@@ -0,0 +1,67 @@
+"""Opponent-adjusted team ratings (SRS) as one least-squares system.
+
+Every scored game is one equation, rating(A) - rating(B) = S1 - S2, so a
+team's rating is its average margin corrected for the strength of the
+opponents it played, in points per game. All games are solved together:
+the normal matrix XᵀX of the team-game design matrix X (+1 for A, -1 for
+B) is the teams x teams game-count matrix, built straight from the index
+arrays with ``np.bincount``/``np.add.at`` without forming X, then one
+dense solve. Hundreds of teams take a few milliseconds.
+
+``ridge`` adds a multiple of the identity, i.e. a phantom scoreless game
+against an average opponent per unit: it pulls teams with few games
+toward 0 and keeps the system solvable when the schedule splits into
+pools that never meet (the divisions). With ``ridge=0`` the ratings are
+pinned to average 0 within each such pool instead, like classic SRS.
+"""
+import numpy as np
+
+# Phantom 0-margin games per team (see module docstring)
+RIDGE = 1.0
+
+
+def _pools(team_a, team_b, n_teams):
+    """Connected-component label of each team (the smallest team index in it)."""
+    labels = np.arange(n_teams)
+    while True:
+        low = np.minimum(labels[team_a], labels[team_b])
+        new = labels.copy()
+        np.minimum.at(new, team_a, low)
+        np.minimum.at(new, team_b, low)
+        new = new[new]
+        if np.array_equal(new, labels):
+            return labels
+        labels = new
+
+
+def solve_ratings(team_a, team_b, margin, n_teams, ridge=RIDGE):
+    """Ratings of teams 0..n_teams-1 from games ``team_a`` vs ``team_b`` won by ``margin``."""
+    team_a = np.asarray(team_a, dtype=np.intp)
+    team_b = np.asarray(team_b, dtype=np.intp)
+    margin = np.asarray(margin, dtype=float)
+    games = np.bincount(team_a, minlength=n_teams) + np.bincount(team_b, minlength=n_teams)
+    normal = np.diag(games.astype(float) + ridge)
+    np.add.at(normal, (team_a, team_b), -1.0)
+    np.add.at(normal, (team_b, team_a), -1.0)
+    rhs = np.bincount(team_a, margin, n_teams) - np.bincount(team_b, margin, n_teams)
+    if ridge <= 0:
+        # XᵀX is singular once per pool; adding each pool's mean as an equation
+        # (the pool's margins sum to 0) fixes that mean at 0 without moving the fit
+        pools = _pools(team_a, team_b, n_teams)
+        size = np.bincount(pools, minlength=n_teams)[pools]
+        normal += (pools[:, None] == pools[None, :]) / size[:, None]
+    return np.linalg.solve(normal, rhs)
+
+
+def team_ratings(games, ridge=RIDGE):
+    """{team: rating} from ``(team_a, team_b, margin)`` games; teams are any hashable key."""
+    codes = {}
+    team_a, team_b, margin = [], [], []
+    for a, b, m in games:
+        team_a.append(codes.setdefault(a, len(codes)))
+        team_b.append(codes.setdefault(b, len(codes)))
+        margin.append(m)
+    if not codes:
+        return {}
+    ratings = solve_ratings(team_a, team_b, margin, len(codes), ridge)
+    return dict(zip(codes, ratings.tolist()))
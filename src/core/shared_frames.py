@@ -0,0 +1,72 @@
+"""Process-wide, read-only result frames.
+
+``st.cache_data`` pickles every DataFrame it returns, so each cache hit pays
+a full deserialisation and every session holds its own copy of the player
+and team aggregates. ``shared_frames`` caches with ``st.cache_resource``
+instead: the result is kept once per process, with string columns stored
+as Arrow strings, and each hit gets a shallow copy.
+
+With pandas copy-on-write enabled (hub_app turns it on) a shallow copy
+shares every column with the cached frame, and a view that mutates its
+frame copies only the columns it writes. Without copy-on-write a hit falls
+back to a deep copy, which is still cheaper than unpickling.
+"""
+import functools
+
+import pandas as pd
+import streamlit as st
+
+ARROW_STRING = pd.StringDtype("pyarrow")
+
+
+def _arrow_strings(df):
+    """Object columns holding only str values -> Arrow strings (no NaN, so no NA semantics change)."""
+    # Positional, since aggregate frames can carry duplicate column names
+    for i, dtype in enumerate(df.dtypes):
+        if dtype != object or df.empty:
+            continue
+        values = df.iloc[:, i]
+        if values.map(type).eq(str).all():
+            df.isetitem(i, values.astype(ARROW_STRING))
+    return df
+
+
+def freeze(result):
+    """Cached form of a DataFrame, or of a tuple / list of them."""
+    if isinstance(result, pd.DataFrame):
+        return _arrow_strings(result)
+    if isinstance(result, (tuple, list)):
+        return type(result)(freeze(r) for r in result)
+    return result
+
+
+def thaw(result):
+    """What a cache hit hands out: a copy the caller may mutate freely."""
+    if isinstance(result, pd.DataFrame):
+        return result.copy(deep=not pd.get_option("mode.copy_on_write"))
+    if isinstance(result, (tuple, list)):
+        return type(result)(thaw(r) for r in result)
+    return result
+
+
+def shared_frames(func=None, *, max_entries=None):
+    """Drop-in for ``@st.cache_data`` on functions returning DataFrames.
+
+    Parameters are hashed the same way (leading-underscore ones are
+    skipped), so existing data_key conventions carry over unchanged.
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        def build(*args, **kwargs):
+            return freeze(fn(*args, **kwargs))
+
+        cached = st.cache_resource(show_spinner=False, max_entries=max_entries)(build)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            return thaw(cached(*args, **kwargs))
+
+        wrapper.clear = cached.clear
+        return wrapper
+
+    return decorate(func) if func is not None else decorate
@@ -0,0 +1,102 @@
+"""Similar-player search: nearest neighbours over a standardized per-36 stat matrix.
+
+``SimilarityIndex`` turns MetricsEngine's player aggregates into one
+float32 matrix (players x stats): counting stats per 36 minutes plus
+TS% and three-point rate, each standardized to z-scores over the
+qualified players. A query is a single matrix-vector product against it,
+O(players x stats), so top-k neighbours come back in milliseconds even
+for tens of thousands of players; no players x players matrix is kept.
+``similarity_index`` caches one per data version.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# Counting stats compared per 36 minutes
+PER_36_STATS = ["PTS", "OREB", "DREB", "AST", "STL", "BLK", "TOV", "PF", "FGA", "3PA", "FTA"]
+# Below this many total minutes, per-36 rates are too noisy to compare
+MIN_MINUTES = 20.0
+METRICS = ("cosine", "euclidean")
+
+
+def _feature_frame(df):
+    """Per-36 counting stats plus TS% and 3PA rate, one row per player."""
+    minutes = df["MIN_CALC"].to_numpy(dtype=float)
+    feats = {}
+    for stat in PER_36_STATS:
+        if stat in df.columns:
+            feats[stat] = df[stat].to_numpy(dtype=float) / minutes * 36.0
+    if {"PTS", "FGA", "FTA"} <= set(df.columns):
+        tsa = 2.0 * (df["FGA"].to_numpy(dtype=float) + 0.44 * df["FTA"].to_numpy(dtype=float))
+        feats["TS%"] = np.divide(df["PTS"].to_numpy(dtype=float), tsa, out=np.zeros(len(df)), where=tsa > 0)
+    if {"3PA", "FGA"} <= set(df.columns):
+        fga = df["FGA"].to_numpy(dtype=float)
+        feats["3PAr"] = np.divide(df["3PA"].to_numpy(dtype=float), fga, out=np.zeros(len(df)), where=fga > 0)
+    return pd.DataFrame(feats, index=df.index)
+
+
+class SimilarityIndex:
+    """Standardized stat matrix of the qualified players, queried by row position."""
+
+    def __init__(self, df_players, min_minutes=MIN_MINUTES):
+        df = df_players
+        if "MIN_CALC" in df.columns and "GP" in df.columns:
+            df = df[(df["GP"] > 0) & (df["MIN_CALC"] >= min_minutes)]
+        else:
+            df = df.iloc[:0]
+        df = df.reset_index(drop=True)
+        self.players = df[[c for c in ("Player", "Team", "Category", "GP", "MIN_CALC") if c in df.columns]]
+        feats = _feature_frame(df) if not df.empty else pd.DataFrame()
+        self.stats = list(feats.columns)
+        x = np.nan_to_num(feats.to_numpy(dtype=float))
+        if len(x):
+            std = x.std(axis=0)
+            x = (x - x.mean(axis=0)) / np.where(std > 0, std, 1.0)
+        self.matrix = x.astype(np.float32)
+        norms = np.linalg.norm(self.matrix, axis=1, keepdims=True)
+        self.unit = self.matrix / np.where(norms > 0, norms, 1.0)
+        self.sq_norms = (self.matrix ** 2).sum(axis=1)
+        self.categories = (self.players["Category"].astype(str).to_numpy()
+                           if "Category" in self.players.columns else np.zeros(len(df), dtype=str))
+        self._positions = {}
+        names = self.players["Player"].astype(str).tolist() if "Player" in self.players.columns else []
+        teams = self.players["Team"].astype(str).tolist() if "Team" in self.players.columns else [""] * len(names)
+        for pos, (name, team) in enumerate(zip(names, teams)):
+            self._positions.setdefault((name, team), pos)
+            self._positions.setdefault((name, None), pos)
+
+    def position(self, player, team=None):
+        """Row of ``player`` (first match, like the profile page), or None if not qualified."""
+        return self._positions.get((str(player), None if team is None else str(team)))
+
+    def neighbours(self, pos, k=10, metric="cosine", same_category=True):
+        """The ``k`` players most like row ``pos``, most similar first.
+
+        cosine: Similarity is 100 x the cosine of the standardized profiles.
+        euclidean: Distance between them (lower is closer).
+        """
+        if metric == "cosine":
+            score = self.unit @ self.unit[pos]
+        else:
+            # |a - b|^2 = |a|^2 + |b|^2 - 2 a.b, from the same one product
+            score = -(self.sq_norms + self.sq_norms[pos] - 2.0 * (self.matrix @ self.matrix[pos]))
+        score = score.astype(float)
+        score[pos] = -np.inf
+        if same_category:
+            score[self.categories != self.categories[pos]] = -np.inf
+        candidates = np.flatnonzero(np.isfinite(score))
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-score[candidates], k - 1)[:k]]
+        order = candidates[np.argsort(-score[candidates], kind="stable")]
+        out = self.players.iloc[order].reset_index(drop=True)
+        if metric == "cosine":
+            out["Similarity"] = np.round(score[order] * 100.0, 1)
+        else:
+            out["Distance"] = np.round(np.sqrt(np.maximum(-score[order], 0.0)), 2)
+        return out
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def similarity_index(_df_players, data_key, min_minutes=MIN_MINUTES):
+    """Process-wide SimilarityIndex for ``data_key``; the frame itself is not hashed."""
+    return SimilarityIndex(_df_players, min_minutes)
@@ -0,0 +1,121 @@
+"""Single stage classification for every match and schedule row.
+
+Each match gets a Stage (display name: group letter, "Quarterfinal",
+"Placing 5-6"...), a Round (``GROUP_ROUND``, ``PLACING_ROUND``,
+``KNOCKOUT_ROUND`` or one of ``KNOCKOUT_ROUNDS``) and a Knockout flag (any
+post-group game, placing games included when game_categorization.json says
+so). Sources, highest precedence first:
+
+  1. ``LEAGUE_OVERRIDES`` - hand-categorised league games
+  2. game_categorization.json ``knockouts`` / ``league_stage`` lists
+  3. the schedule row linked through the fixtures join
+  4. ``DEFAULT_STAGE`` (group stage)
+"""
+import pandas as pd
+from src.core import match_index as mi
+from src.core import fixtures as fxt
+
+KNOCKOUT_ROUNDS = ["PQF", "Quarterfinal", "Semifinal", "Final", "LKO Final"]
+STAGE_ALIASES = {"QF": "Quarterfinal", "SF": "Semifinal"}
+GROUP_ROUND = "Group"
+PLACING_ROUND = "Placing"
+# Knockout match known only from game_categorization.json (no round given)
+KNOCKOUT_ROUND = "Knockout"
+DEFAULT_STAGE = "Group Stage"
+
+# Services-Karnataka (ID "31") and 2797633 are league games the categorization misses
+LEAGUE_OVERRIDES = ["31", "2797633"]
+
+STAGE_COLS = ["Stage", "Round", "Knockout"]
+
+
+def _present(value):
+    return value is not None and not (not isinstance(value, str) and pd.isna(value))
+
+
+def stage_round(stage):
+    """Round of a schedule stage: a knockout round, "Placing" or "Group"."""
+    if not _present(stage):
+        return GROUP_ROUND
+    name = str(stage).strip()
+    name = STAGE_ALIASES.get(name, name)
+    if name in KNOCKOUT_ROUNDS:
+        return name
+    if name.startswith("Placing"):
+        return PLACING_ROUND
+    return GROUP_ROUND
+
+
+def explicit_stages(cat_map):
+    """{canonical MatchID: (stage or None, knockout)} from game_categorization.json."""
+    if not isinstance(cat_map, dict):
+        return {}
+    details = cat_map.get("details", {})
+    out = {}
+    for mid in cat_map.get("league_stage", []):
+        out[mi.canon_match_id(mid)] = (None, False)
+    for d in details.get("league", []):
+        out[mi.canon_match_id(d.get("MatchID"))] = (d.get("Group"), False)
+    for mid in cat_map.get("knockouts", []):
+        out[mi.canon_match_id(mid)] = (None, True)
+    for d in details.get("knockouts", []):
+        out[mi.canon_match_id(d.get("MatchID"))] = (d.get("Stage"), True)
+    for mid in LEAGUE_OVERRIDES:
+        out[mi.canon_match_id(mid)] = (None, False)
+    out.pop(None, None)
+    return out
+
+
+def classify(schedule_stage=None, explicit=None):
+    """(Stage, Round, Knockout) from an ``explicit_stages`` entry and/or the schedule stage."""
+    if explicit is None:
+        if _present(schedule_stage):
+            rnd = stage_round(schedule_stage)
+            return schedule_stage, rnd, rnd in KNOCKOUT_ROUNDS
+        return DEFAULT_STAGE, GROUP_ROUND, False
+
+    stage, knockout = explicit
+    if stage is None and _present(schedule_stage):
+        stage = schedule_stage
+    rnd = stage_round(stage)
+    # The explicit category wins when the schedule disagrees
+    if knockout and rnd == GROUP_ROUND:
+        return KNOCKOUT_ROUND, KNOCKOUT_ROUND, True
+    if not knockout and rnd in KNOCKOUT_ROUNDS:
+        return DEFAULT_STAGE, GROUP_ROUND, False
+    return (stage if _present(stage) else DEFAULT_STAGE), rnd, knockout
+
+
+def is_bracket_round(rnd):
+    """Elimination-bracket rounds (PQF...Final, LKO Final); placing games are not."""
+    return rnd in KNOCKOUT_ROUNDS or rnd == KNOCKOUT_ROUND
+
+
+def classify_fixtures(fixtures, cat_map):
+    """Add Round and Knockout to the fixtures table (Stage stays the schedule's)."""
+    if fixtures is None or fixtures.empty:
+        return fixtures
+    explicit = explicit_stages(cat_map)
+    genius = fixtures['Genius Match ID'] if 'Genius Match ID' in fixtures.columns else pd.Series(None, index=fixtures.index)
+    rounds, knockouts = [], []
+    for stage, data_id, gid in zip(fixtures['Stage'], fixtures['DataMatchID'], genius):
+        key = data_id if data_id is not None else mi.canon_match_id(gid)
+        _, rnd, ko = classify(stage, explicit.get(key))
+        rounds.append(rnd)
+        knockouts.append(ko)
+    fixtures['Round'] = rounds
+    fixtures['Knockout'] = knockouts
+    return fixtures
+
+
+def stage_table(match_ids, fixtures, cat_map):
+    """{canonical MatchID: {"Stage", "Round", "Knockout"}} for every match in ``match_ids``."""
+    schedule = fxt.stage_by_match_id(fixtures)
+    explicit = explicit_stages(cat_map)
+    table = {}
+    for mid in match_ids:
+        key = mi.canon_match_id(mid)
+        if key is None or key in table:
+            continue
+        table[key] = dict(zip(STAGE_COLS, classify(schedule.get(key), explicit.get(key))))
+    return table
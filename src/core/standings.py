@@ -0,0 +1,79 @@
+"""Vectorized standings over the fixtures table (see src.core.fixtures)."""
+import numpy as np
+import pandas as pd
+from src.core import fixtures as fxt
+
+STANDINGS_COLS = ["Team", "Gender", "Group", "GP", "W", "L", "PF", "PA", "PD", "PTS"]
+
+def _interleave(a, b):
+    """[a0, b0, a1, b1, ...] - one slot per (fixture, side) in schedule order."""
+    out = np.empty(2 * len(a), dtype=np.result_type(a, b))
+    out[0::2] = a
+    out[1::2] = b
+    return out
+
+
+def compute_standings(fixtures, by="division", as_of=None):
+    """W/L table per team from scored fixtures.
+
+    by: "division" keys teams on (Team, Gender), reporting the group of
+        their first fixture; "group" keys on (Team, Gender, Group) so a
+        team gets one row per group it played in.
+    as_of: optional date; only fixtures on or before it are counted (every
+        scheduled team is still listed).
+
+    A win is 2 points and a loss 1; a fixture (Match ID + Gender) is only
+    counted once, and one missing either team (TBD, bye) not at all. Rows come out in order of each team's first appearance.
+    Teams are factorized once and every column is a single ``np.bincount``.
+    """
+    if fixtures is None or fixtures.empty:
+        return pd.DataFrame(columns=STANDINGS_COLS)
+
+    if 'TeamKeyA' not in fixtures.columns:
+        fixtures = fxt.add_fixture_keys(fixtures.copy())
+    # Both sides must be known; a TBD or bye slot has no team to credit
+    valid = (fixtures['Team A'].notna() & fixtures['Team B'].notna()).to_numpy()
+    if not valid.any():
+        return pd.DataFrame(columns=STANDINGS_COLS)
+
+    def col(name, dtype=object):
+        return fixtures[name].to_numpy(dtype=dtype)[valid]
+
+    gender = col('Division')
+    group = col('Group') if 'Group' in fixtures.columns else np.full(int(valid.sum()), None, dtype=object)
+    team = _interleave(col('TeamKeyA'), col('TeamKeyB'))
+    gender2, group2 = np.repeat(gender, 2), np.repeat(group, 2)
+
+    # Team keys in order of first appearance
+    key = team + "|" + gender2
+    if by == "group":
+        key = key + "|" + group2.astype(str)
+    codes, uniques = pd.factorize(key)
+    first = np.unique(codes, return_index=True)[1]
+    n_teams = len(uniques)
+
+    s1 = fixtures['S1'].to_numpy(dtype="float64", na_value=np.nan)[valid]
+    s2 = fixtures['S2'].to_numpy(dtype="float64", na_value=np.nan)[valid]
+    scored = ~np.isnan(s1) & ~np.isnan(s2)
+    if as_of is not None:
+        scored &= (fixtures['MatchDate'] <= pd.Timestamp(as_of)).to_numpy()[valid]
+    # Count each fixture once (first scored row per Match ID + Gender)
+    fixture_codes, _ = pd.factorize(col('Match ID', str).astype(object) + "|" + gender)
+    scored_rows = np.flatnonzero(scored)
+    scored[:] = False
+    scored[scored_rows[np.unique(fixture_codes[scored_rows], return_index=True)[1]]] = True
+
+    played = np.repeat(scored, 2)
+    c = codes[played]
+    pf = _interleave(s1, s2)[played]
+    pa = _interleave(s2, s1)[played]
+    gp = np.bincount(c, minlength=n_teams)
+    w = np.bincount(c, weights=pf > pa, minlength=n_teams).astype("int64")
+    pf_tot = np.bincount(c, weights=pf, minlength=n_teams).astype("int64")
+    pa_tot = np.bincount(c, weights=pa, minlength=n_teams).astype("int64")
+
+    return pd.DataFrame({
+        "Team": team[first], "Gender": gender2[first], "Group": group2[first],
+        "GP": gp, "W": w, "L": gp - w, "PF": pf_tot, "PA": pa_tot,
+        "PD": pf_tot - pa_tot, "PTS": 2 * w + (gp - w),
+    })
@@ -0,0 +1,71 @@
+"""Display frames for stat tables: formatted text and highlight masks, built once.
+
+A pandas Styler re-runs its per-column ``apply`` and ``format`` callbacks on
+every render, cell by cell, and cannot be cached. ``display_table`` does
+that work once per (table, formats, highlight rules) and caches the result
+as three aligned frames:
+
+  values  the numbers as given (what sorting orders by)
+  text    each cell formatted, NaN as ``na_rep``
+  mask    True where the cell is highlighted
+
+``sort_table`` reorders all three together, so a re-sort never re-formats.
+Rendering lives in src.ui.display.
+"""
+import numpy as np
+import pandas as pd
+
+from src.core.shared_frames import shared_frames
+
+
+def _default_text(value):
+    """Styler's default display: floats at styler.format.precision, everything else str()."""
+    if isinstance(value, (float, np.floating)):
+        return f"{value:.{pd.get_option('styler.format.precision')}f}"
+    return str(value)
+
+
+def _format_column(values, fmt, na_rep):
+    na = pd.isna(values).tolist()
+    if fmt is None:
+        return [na_rep if n else _default_text(v) for v, n in zip(values.tolist(), na)]
+    return [na_rep if n else fmt.format(v) for v, n in zip(values.tolist(), na)]
+
+
+def _highlight_column(values, rule):
+    """"max" marks the column maximum, a number marks cells >= it."""
+    try:
+        if rule == "max":
+            return (values == values.max()).to_numpy(dtype=bool)
+        return (values >= rule).to_numpy(dtype=bool)
+    except Exception:
+        # Non-comparable cells are never highlighted
+        return np.zeros(len(values), dtype=bool)
+
+
+@shared_frames(max_entries=64)
+def display_table(df, formats=None, highlight=None, na_rep="-"):
+    """(values, text, mask) for ``df``; cached on its contents and the options.
+
+    formats: {col: "{:.1f}"-style format string}; other columns use the
+    Styler defaults. highlight: {col: "max" or threshold}.
+    """
+    formats = formats or {}
+    highlight = highlight or {}
+    values = df.reset_index(drop=True)
+    text = pd.DataFrame({col: _format_column(values[col], formats.get(col), na_rep) for col in values.columns},
+                        index=values.index, columns=values.columns)
+    mask = pd.DataFrame(False, index=values.index, columns=values.columns)
+    for col, rule in highlight.items():
+        if col in values.columns:
+            mask[col] = _highlight_column(values[col], rule)
+    return values, text, mask
+
+
+def sort_table(table, by, ascending=False):
+    """Reorder a display_table result by one column's values; NaN last."""
+    values, text, mask = table
+    if by not in values.columns:
+        return table
+    order = values[by].sort_values(ascending=ascending, kind="stable", na_position="last").index
+    return values.loc[order], text.loc[order], mask.loc[order]
@@ -4,104 +4,306 @@ import json
 import pandas as pd
 from datetime import datetime
 import os
+import hashlib
+import functools
+from src import analytics as ant
+from src.core import fact_table as ft
+from src.core import fixtures as fx
+from src.core import match_index as mi
+from src.core import stages as stg
 
-@st.cache_data(show_spinner=False)
-def load_data(json_path=None):
-    """Load the main JSON data. Trust data.json as source of truth."""
+# Local development fallback for every data file
+STAGING_ROOT = r"h:\VIBE CODE\ind basketball\2staging"
+
+_hash_memo = {}
+
+def _resolve_path(*candidates):
+    """Return the first existing path among candidates, or None."""
+    for path in candidates:
+        if path and os.path.exists(path):
+            return path
+    return None
+
+def file_version(path):
+    """Data-version token for a file: mtime, size and a content hash.
+
+    The hash is only recomputed when mtime/size change, so checking the
+    version on every rerun costs a single ``os.stat``.
+    """
+    if not path:
+        return "missing"
     try:
-        # Use relative path for cloud deployment, fallback to absolute for local
-        if json_path:
-            actual_path = json_path
-        else:
-            # Try relative path first (for Streamlit Cloud)
-            relative_path = "data/processed/data.json"
-            # Fallback to staging absolute path for local development
-            staging_path = r"h:\VIBE CODE\ind basketball\2staging\data\processed\data.json"
-            
-            if os.path.exists(relative_path):
-                actual_path = relative_path
-            elif os.path.exists(staging_path):
-                actual_path = staging_path
-            else:
-                raise FileNotFoundError(f"data.json not found at {relative_path} or {staging_path}")
-
-        with open(actual_path, "r", encoding='utf-8-sig') as f:
-            data = json.load(f)
-            
-        # Placeholder for total_games and last_updated
-        if isinstance(data, dict):
-            # Check for wrapped structure first
-            if "Matches" in data:
-                total_games = len(data["Matches"])
-            elif "matches" in data:
-                total_games = len(data["matches"])
-            else:
-                # Assume dict keys are match IDs (production structure)
-                total_games = len(data)
+        st_res = os.stat(path)
+    except OSError:
+        return "missing"
+    stat_key = (path, st_res.st_mtime_ns, st_res.st_size)
+    digest = _hash_memo.get(stat_key)
+    if digest is None:
+        h = hashlib.sha1()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        digest = h.hexdigest()[:16]
+        _hash_memo[stat_key] = digest
+    return f"{st_res.st_mtime_ns}-{st_res.st_size}-{digest}"
+
+def _data_json_path(json_path=None):
+    if json_path:
+        return json_path
+    # Try relative path first (for Streamlit Cloud), then staging for local development
+    return _resolve_path("data/processed/data.json",
+                         os.path.join(STAGING_ROOT, "data", "processed", "data.json"))
+
+def data_version(json_path=None):
+    """Version token of the data.json currently on disk."""
+    return file_version(_data_json_path(json_path))
+
+def data_key(match_list, **filters):
+    """Compact cache key for a (filtered) list of match dicts.
+
+    ``match_list`` may be match dicts or bare MatchIDs. Cached analytics
+    take this instead of hashing the nested match dicts:
+    the data.json and category-map versions, the filter descriptor
+    (``stage="Knockouts"``, ``category="Men"``...) and a digest of the
+    MatchIDs in the list, so two different lists never share a key.
+    """
+    match_list = [] if match_list is None else match_list
+    ids = "|".join(str(m.get("MatchID") if isinstance(m, dict) else m) for m in match_list)
+    digest = hashlib.sha1(ids.encode("utf-8")).hexdigest()[:16]
+    return (data_version(), file_version(_category_map_path()),
+            tuple(sorted(filters.items())), len(match_list), digest)
+
+@st.cache_data(show_spinner=False)
+def _read_data(actual_path, version):
+    """Parse data.json. ``version`` only keys the cache."""
+    with open(actual_path, "r", encoding='utf-8-sig') as f:
+        data = json.load(f)
+
+    if isinstance(data, dict):
+        # Check for wrapped structure first
+        if "Matches" in data:
+            total_games = len(data["Matches"])
+        elif "matches" in data:
+            total_games = len(data["matches"])
         else:
-            # Plain list structure
+            # Assume dict keys are match IDs (production structure)
             total_games = len(data)
-            
-        last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        return data, total_games, last_updated
+    else:
+        # Plain list structure
+        total_games = len(data)
+
+    last_updated = datetime.fromtimestamp(os.path.getmtime(actual_path)).strftime("%Y-%m-%d %H:%M:%S")
+    return data, total_games, last_updated
+
+def load_data(json_path=None):
+    """Load the main JSON data. Trust data.json as source of truth.
+
+    Cached on the file's version token, so a new data.json is picked up on
+    the next rerun and ``last_updated`` is the file's modification time.
+    """
+    try:
+        actual_path = _data_json_path(json_path)
+        if not actual_path:
+            raise FileNotFoundError("data.json not found at data/processed/data.json or staging")
+        return _read_data(actual_path, file_version(actual_path))
     except Exception as e:
         st.error(f"Error loading data: {e}")
         return [], 0, "N/A"
 
-@st.cache_data  
+def unwrap_matches(data, cat_map=None, stages=None):
+    """Return the list of match dicts from any data.json layout.
+
+    Category is injected from the categorization map (only "Men"/"Women"
+    values, to avoid the "Knockout" issue), and Stage / Round / Knockout
+    from ``stages`` (``load_stage_table()``) when given.
+    """
+    if isinstance(data, list):
+        matches = data
+    elif "Matches" in data:
+        matches = data["Matches"]
+    elif "matches" in data:
+        matches = data["matches"]
+    else:
+        # Production structure: dict with match IDs as keys
+        matches = list(data.values())
+
+    if matches and cat_map:
+        for m in matches:
+            mid = str(m.get("MatchID"))
+            if mid in cat_map and cat_map[mid] in ["Men", "Women"]:
+                m['Category'] = cat_map[mid]
+    if matches and stages:
+        for m in matches:
+            m.update(stages.get(mi.canon_match_id(m.get("MatchID")), {}))
+    return matches
+
+def _fact_versions(json_path=None):
+    """Versions of every file the fact table is derived from."""
+    return (data_version(json_path), file_version(_category_map_path()),
+            file_version(_schedule_path()), file_version(_manual_scores_path()))
+
+@st.cache_data(show_spinner=False)
+def _build_player_game_table(json_path, versions):
+    data, _, _ = load_data(json_path)
+    matches = unwrap_matches(data, load_category_map())
+    facts = ft.build_player_game_table(matches)
+    return ft.add_stage(facts, load_stage_table(json_path))
+
+def load_player_game_table(json_path=None):
+    """Build the player-game-period fact table once per data version.
+
+    Each row carries its match's Category, Date, Stage, Round and Knockout
+    flag, so stage/category filters are masks over the table
+    (ft.select_match_ids).
+    """
+    return _build_player_game_table(json_path, _fact_versions(json_path))
+
+@st.cache_data(show_spinner=False)
+def _build_stage_table(json_path, versions):
+    data, _, _ = load_data(json_path)
+    matches = unwrap_matches(data, load_category_map())
+    return stg.stage_table([m.get("MatchID") for m in matches], load_fixtures(), load_category_map())
+
+def load_stage_table(json_path=None):
+    """{canonical MatchID: {Stage, Round, Knockout}} - the one stage classification (see core.stages)."""
+    return _build_stage_table(json_path, _fact_versions(json_path))
+
+@st.cache_data(show_spinner=False)
+def _build_period_cube(json_path, versions):
+    return ft.build_period_cube(_build_player_game_table(json_path, versions))
+
+def load_period_cube(json_path=None):
+    """Quarter cube over the fact table (see fact_table.build_period_cube)."""
+    return _build_period_cube(json_path, _fact_versions(json_path))
+
+def _category_map_path():
+    # Relative path usually works from root
+    return _resolve_path("data/processed/game_categorization.json",
+                         os.path.join(STAGING_ROOT, "data", "processed", "game_categorization.json"))
+
+@st.cache_data(show_spinner=False)
+def _read_json(path, version, encoding="utf-8"):
+    """Parse a JSON file. ``version`` only keys the cache."""
+    with open(path, "r", encoding=encoding) as f:
+        return json.load(f)
+
 def load_category_map():
     """Load category map"""
     try:
-        # Try both relative and absolute paths if needed, but relative usually works from root
-        path = "data/processed/game_categorization.json"
-        if not os.path.exists(path):
-             path = r"h:\VIBE CODE\ind basketball\2staging\data\processed\game_categorization.json"
-             
-        with open(path, "r", encoding='utf-8-sig') as f:
-            return json.load(f)
+        path = _category_map_path()
+        return _read_json(path, file_version(path), encoding='utf-8-sig')
     except:
         return {}
 
-@st.cache_data
 def load_logos():
     try:
-        path = "data/logos.json"
-        if not os.path.exists(path):
-             # Try prod path
-             path = r"h:\VIBE CODE\ind basketball\2staging\data\logos.json" # Staging location
-             if not os.path.exists(path):
-                 path = r"h:\VIBE CODE\ind basketball\data\logos.json"
-
-        with open(path, "r") as f:
-            return json.load(f)
+        path = _resolve_path("data/logos.json",
+                             os.path.join(STAGING_ROOT, "data", "logos.json"),  # Staging location
+                             r"h:\VIBE CODE\ind basketball\data\logos.json")
+        return _read_json(path, file_version(path))
     except:
         return {}
 
+def _manual_scores_path():
+    return _resolve_path("data/processed/manual_scores.json",
+                         os.path.join(STAGING_ROOT, "data", "processed", "manual_scores.json"))
+
 def load_manual_scores():
     try:
-        path = "data/processed/manual_scores.json"
-        if not os.path.exists(path):
-            path = r"h:\VIBE CODE\ind basketball\2staging\data\processed\manual_scores.json"
-            
-        with open(path, "r") as f:
-            return json.load(f)
+        path = _manual_scores_path()
+        return _read_json(path, file_version(path))
     except:
         return {}
 
+def _schedule_path():
+    # Try relative path first (for Streamlit Cloud), then staging for local development
+    return _resolve_path("compiled_schedule.csv", os.path.join(STAGING_ROOT, "compiled_schedule.csv"))
+
+@st.cache_data(show_spinner=False)
+def _read_schedule(path, version):
+    return pd.read_csv(path)
+
 def load_schedule():
-    """Load the compiled schedule CSV"""
+    """Load the compiled schedule CSV (cached per file version)"""
     try:
-        # Try relative path first (for Streamlit Cloud)
-        relative_path = "compiled_schedule.csv"
-        # Fallback to staging absolute path for local development
-        staging_path = r"h:\VIBE CODE\ind basketball\2staging\compiled_schedule.csv"
-        
-        if os.path.exists(relative_path):
-            df = pd.read_csv(relative_path)
-        elif os.path.exists(staging_path):
-            df = pd.read_csv(staging_path)
-        else:
+        path = _schedule_path()
+        if not path:
             return pd.DataFrame()
-        return df
+        return _read_schedule(path, file_version(path))
     except:
         return pd.DataFrame()
+
+@st.cache_data(show_spinner=False)
+def _build_fixtures(schedule_version, data_ver, manual_version, cat_version):
+    data, _, _ = load_data()
+    matches = unwrap_matches(data, load_category_map())
+    fixtures = fx.build_fixtures(load_schedule(), matches, load_manual_scores())
+    return stg.classify_fixtures(fixtures, load_category_map())
+
+def load_fixtures():
+    """Schedule joined to scraped matches and final scores (see fixtures.build_fixtures).
+
+    Rebuilt only when the schedule, data.json, manual scores or category
+    map change on disk.
+    """
+    return _build_fixtures(file_version(_schedule_path()), data_version(),
+                           file_version(_manual_scores_path()), file_version(_category_map_path()))
+
+class TournamentStore:
+    """Everything derived from the data files, built once per data version.
+
+    One instance is shared by every session and rerun (``load_store``), so
+    it is read-only: filter into new lists / frames, never mutate the match
+    dicts or tables in place.
+    """
+
+    def __init__(self, json_path=None, versions=None):
+        self.versions = versions
+        data, self.total_games, self.last_updated = load_data(json_path)
+        self.stages = load_stage_table(json_path)
+        self.matches = unwrap_matches(data, load_category_map(), self.stages)
+        self.by_category = {}
+        for m in self.matches:
+            self.by_category.setdefault(m.get("Category"), []).append(m)
+        self.match_index = mi.build_match_index(self.matches)
+        self.player_games = load_player_game_table(json_path)
+        self.period_cube = load_period_cube(json_path)
+        self.fixtures = load_fixtures()
+
+    def matches_in(self, category=None):
+        """Matches of one category ("Men" / "Women"), or all of them for None / "All"."""
+        if category in (None, "All"):
+            return self.matches
+        return self.by_category.get(category, [])
+
+    @functools.cached_property
+    def game_log(self):
+        """Every full-game performance with derived stats (ant.get_daily_stats), built on first use."""
+        return ant.get_daily_stats(self.matches, period="Full Game", player_games=self.player_games)
+
+    @functools.cached_property
+    def player_rows(self):
+        """{Player: row positions in game_log}."""
+        return ft.row_index(self.game_log, "Player")
+
+    def player_log(self, player, category=None):
+        """One player's game log; only that player's rows are touched."""
+        rows = self.player_rows.get(player)
+        if rows is None or len(rows) == 0:
+            return self.game_log.iloc[:0]
+        log = self.game_log.iloc[rows]
+        if category not in (None, "All"):
+            log = log[log["Category"] == category]
+        return log
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _build_store(json_path, versions):
+    return TournamentStore(json_path, versions)
+
+def load_store(json_path=None):
+    """Process-wide TournamentStore for the data files currently on disk.
+
+    Sessions share one store per ``_fact_versions``; a rerun only stats the
+    files, so no ingestion happens per session.
+    """
+    return _build_store(json_path, _fact_versions(json_path))
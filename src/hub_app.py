@@ -26,21 +26,40 @@ try:
 except Exception as e:
     st.error(f"Critical Startup Error: {e}")
 
-# Imports AFTER page config to prevent "set_page_config not first" errors
+# Imports AFTER page config to prevent "set_page_config not first" errors.
+# plotly is imported inside the sections that draw charts, so a cold start
+# does not pay for it before the first render (scripts/bench_imports.py).
 import pandas as pd
 import json
-import altair as alt
-import plotly.graph_objects as go
 import numpy as np
+import threading
+import time
+
+# Cached result frames are shared across sessions (src.core.shared_frames):
+# copy-on-write keeps a view's edits out of the shared copy
+pd.set_option("mode.copy_on_write", True)
 try:
     import re
     import importlib
     import src.analytics as ant
     import src.ui.social_generator as sg
     import src.data_manager as dm
+    import src.core.match_index as mi
+    import src.core.fixtures as fx
+    import src.core.standings as stn
+    import src.core.power_rankings as pr
+    import src.core.fact_table as ft
+    import src.core.formatters as fmt
+    import src.core.tables as tbl
+    import src.core.leaderboards as lb
+    import src.core.percentiles as pm
+    import src.core.similarity as sim
     from src.metrics_engine import MetricsEngine
     import src.ui.enhanced_components as ec
+    import src.ui.display as dsp
+    import src.ui.assets as assets
     from datetime import datetime
+    from urllib.parse import quote
 except ImportError as e:
     st.error(f"Failed to import modules: {e}")
     st.stop()
@@ -51,238 +70,89 @@ if 'ec' in locals():
 
 # Data Loading functions moved to src.data_manager
 
-def get_match_obj(row, raw_data_list):
-    t1_s = str(row['Team A']).strip().upper()
-    t2_s = str(row['Team B']).strip().upper()
-    cat_s = row['Gender']
-    
-    for m_data in raw_data_list:
-        t1_d = str(m_data['Teams']['t1']).strip().upper()
-        t2_d = str(m_data['Teams']['t2']).strip().upper()
-        cat_d = m_data.get('Category', '')
-        
-        if cat_d == cat_s:
-            if (t1_s == t1_d and t2_s == t2_d) or (t1_s == t2_d and t2_s == t1_d):
-                return m_data
-    return None
-
-def calculate_unified_standings(schedule_df, manual_scores, raw_data_list):
-    # Initialize Teams
-    teams = {} # Key: "TeamName_Gender", Value: {GP, W, L, PF, PA, Gender, Group}
-    
-    # 1. Initialize from Schedule (to ensure all teams exist)
-    for _, row in schedule_df.iterrows():
-        if pd.isna(row['Team A']): continue
-        t1 = str(row['Team A']).strip().upper()
-        t2 = str(row['Team B']).strip().upper()
-        gender = str(row['Gender']).strip().title() # Normalize to Title Case (Men/Women)
-        grp = row['Group']
-        
-        for t in [t1, t2]:
-            key = f"{t}_{gender}"
-            if key not in teams:
-                teams[key] = {
-                    "Team": t,
-                    "Gender": gender,
-                    "Group": grp,
-                    "GP": 0, "W": 0, "L": 0, 
-                    "PF": 0, "PA": 0, "PD": 0, "PTS": 0
-                }
-    
-    # 2. Process Matches
-    processed_matches = set()
-    
-    for idx, row in schedule_df.iterrows():
-        if pd.isna(row['Team A']): continue
-        
-        mid = row['Match ID']
-        if mid in processed_matches: continue
-        
-        t1 = str(row['Team A']).strip().upper()
-        t2 = str(row['Team B']).strip().upper()
-        gender = str(row['Gender']).strip().title()
-        
-        # Keys for Stats
-        k_t1 = f"{t1}_{gender}"
-        k_t2 = f"{t2}_{gender}"
+def calculate_unified_standings(fixtures_df, as_of=None):
+    """GP/W/L/PF/PA/PD/PTS per (Team, Gender) from the fixtures table."""
+    return stn.compute_standings(fixtures_df, by="division", as_of=as_of)
 
-        # Check for Score
-        s1, s2 = None, None
-        
-        # A. Check Detailed Stats
-        m_found = get_match_obj(row, raw_data_list)
-        if m_found:
-            s1 = m_found['TeamStats']['t1']['PTS']
-            s2 = m_found['TeamStats']['t2']['PTS']
-        else:
-            # B. Check Manual Scores
-            # Manual Scores keys use UPPER gender
-            g_upper = gender.upper()
-            
-            # Try Forward Key
-            k1 = f"{t1}_VS_{t2}_{g_upper}"
-            if manual_scores.get(k1):
-                s1 = manual_scores[k1]['s1']
-                s2 = manual_scores[k1]['s2']
-            else:
-                # Try Reverse Key
-                k2 = f"{t2}_VS_{t1}_{g_upper}"
-                if manual_scores.get(k2):
-                    s1 = manual_scores[k2]['s2']
-                    s2 = manual_scores[k2]['s1']
-        
-        if s1 is not None and s2 is not None:
-            # Update Stats
-            processed_matches.add(mid)
-            
-            # Team 1
-            if k_t1 in teams:
-                teams[k_t1]['GP'] += 1
-                teams[k_t1]['PF'] += s1
-                teams[k_t1]['PA'] += s2
-                if s1 > s2: 
-                    teams[k_t1]['W'] += 1
-                    teams[k_t1]['PTS'] += 2
-                else: 
-                    teams[k_t1]['L'] += 1
-                    teams[k_t1]['PTS'] += 1
-            
-            # Team 2
-            if k_t2 in teams:
-                teams[k_t2]['GP'] += 1
-                teams[k_t2]['PF'] += s2
-                teams[k_t2]['PA'] += s1
-                if s2 > s1: 
-                    teams[k_t2]['W'] += 1
-                    teams[k_t2]['PTS'] += 2
-                else: 
-                    teams[k_t2]['L'] += 1
-                    teams[k_t2]['PTS'] += 1
-                    
-        # Update PD
-        for t_key in [k_t1, k_t2]:
-             if t_key in teams:
-                 teams[t_key]['PD'] = teams[t_key]['PF'] - teams[t_key]['PA']
-
-    return list(teams.values())
-
-def get_mvp_simple(m):
-    # Find player with max GmScr
-    best_p, max_v = None, -999
-    for p, s in m.get('PlayerStats', {}).items():
-        v = s.get("GmScr", 0)
-        if v > max_v:
-            max_v = v
-            best_p = p
-    return best_p, max_v
-
-def render_match_row(row, m_found, idx, key_prefix="sch"):
-    if pd.isna(row['Team A']):
-        st.markdown(f"<div style='background: rgba(255,255,255,0.05); padding: 10px; border-radius: 8px; text-align: center; margin-bottom: 20px; font-weight: bold; color: var(--tappa-orange); text-transform: uppercase; letter-spacing: 0.2rem; filter: drop-shadow(0 0 5px var(--tappa-orange-glow));'>{row['Court']} - {row['Match ID']}</div>", unsafe_allow_html=True)
-        return
+SCHEDULE_PAGE_SIZE = 50
 
-    logos = dm.load_logos()
-    manual_scores = dm.load_manual_scores()
-    match_id = str(m_found['MatchID']) if m_found else None
-    
-    # Extract Team Details
+def _schedule_row_html(row, m_found):
     t1_name, t2_name = str(row['Team A']).strip(), str(row['Team B']).strip()
-    t1_logo = logos.get(t1_name, "")
-    t2_logo = logos.get(t2_name, "")
-    
-    # Check manual scores if not found in scraped data
-    m_score = None
-    if not m_found:
-        m_key = f"{t1_name.upper()}_VS_{t2_name.upper()}_{row['Gender'].upper()}"
-        m_score = manual_scores.get(m_key)
-        # Try reverse key too
-        if not m_score:
-            m_key_rev = f"{t2_name.upper()}_VS_{t1_name.upper()}_{row['Gender'].upper()}"
-            m_score = manual_scores.get(m_key_rev)
-            if m_score:
-                # Swap scores if reversed
-                m_score = {'s1': m_score['s2'], 's2': m_score['s1'], 'id': m_score['id']}
-
-    # TV Scoreboard Style
-    with st.container():
-        # Outer Card
-        is_indoor = "INDOOR" in str(row['Court']).upper()
-        has_score = (m_found is not None) or (m_score is not None)
-        
-        card_bg = "rgba(255, 255, 255, 0.03)" if not has_score else ("linear-gradient(135deg, rgba(255, 133, 51, 0.1) 0%, rgba(0,0,0,0.4) 100%)" if is_indoor else "linear-gradient(135deg, rgba(255,255,255,0.08) 0%, rgba(0,0,0,0.4) 100%)")
-        border_color = "rgba(255, 255, 255, 0.1)" if not has_score else ("#ffc107" if is_indoor else "var(--tappa-orange)")
-        border_width = "1px" if not has_score else "2px"
-        glow = "box-shadow: 0 0 15px rgba(255, 193, 7, 0.2);" if is_indoor and has_score else ("box-shadow: 0 0 15px rgba(255, 133, 51, 0.2);" if has_score else "")
-        
-        mvp_section = ""
-        if m_found:
-            mvp_name, mvp_val = get_mvp_simple(m_found)
-            if mvp_name:
-                import textwrap
-                mvp_section = f"""<div style='margin-top: 15px; padding-top: 10px; border-top: 1px solid rgba(255,255,255,0.05); display: flex; justify-content: space-between; align-items: center;'>
-<span style='font-size: 0.65rem; color: #888; text-transform: uppercase; letter-spacing: 0.05em;'>Player of the Match</span>
-<span style='font-size: 0.8rem; font-weight: 700; color: #fff;'>{mvp_name} <span style='color: var(--tappa-orange); margin-left: 5px;'>{mvp_val:.1f}</span></span>
-</div>"""
-        elif m_score:
-             import textwrap
-             mvp_section = f"""<div style='margin-top: 15px; padding-top: 10px; border-top: 1px solid rgba(255,255,255,0.05); text-align: center;'>
-<span style='font-size: 0.65rem; color: #666; text-transform: uppercase; letter-spacing: 0.05em;'>Full Statistics Not Available</span>
-</div>"""
-
-        # Score formatting
-        if m_found:
-            score_html = f"<span style='font-family: \"Outfit\", sans-serif; font-weight: 900; font-size: 2.2rem; color: var(--tappa-orange); letter-spacing: 0.05em;'>{m_found['TeamStats']['t1']['PTS']} - {m_found['TeamStats']['t2']['PTS']}</span>"
-        elif m_score:
-            score_html = f"<span style='font-family: \"Outfit\", sans-serif; font-weight: 900; font-size: 2.2rem; color: var(--tappa-orange); letter-spacing: 0.05em;'>{m_score['s1']} - {m_score['s2']}</span>"
+
+    # Time Logic
+    t_val = row['Time']
+    if pd.isna(t_val) or str(t_val).lower() == 'nan' or str(t_val).strip() == '':
+        t_val = "TBD"
+
+    # Score Logic
+    score_text = "VS"
+    status_color = "#666"
+    status_text = "SCHEDULED"
+
+    if pd.notna(row['ScoreSource']):
+        score_text = f"{row['S1']} - {row['S2']}"
+        if row['ScoreSource'] == fx.SOURCE_STATS:
+            status_text = "FINAL (STATS)"
+            status_color = "#4CAF50"
         else:
-            score_html = "<span style='color: #444; font-size: 1.2rem; font-weight: 800; font-family: \"Montserrat\", sans-serif;'>VS</span>"
-
-        import textwrap
-        st.markdown(f"""<div style='background: {card_bg}; border: {border_width} solid {border_color}; border-radius: 16px; padding: 20px; margin-bottom: 20px; transition: transform 0.3s cubic-bezier(0.175, 0.885, 0.32, 1.275); {glow}'>
-<div style='display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 15px;'>
-<div style='display: flex; flex-direction: column;'>
-<span style='font-size: 0.7rem; color: #aaa; text-transform: uppercase; letter-spacing: 0.1em; margin-bottom: 4px;'>{row['Time']} • {row['Court']}</span>
-<span style='font-size: 0.6rem; color: #666;'>ID: {row['Match ID']} | GROUP {row['Group']}</span>
-</div>
-<div style='background: rgba(255,255,255,0.05); padding: 4px 10px; border-radius: 4px; font-size: 0.65rem; font-weight: 700; color: #aaa; border: 1px solid rgba(255,255,255,0.1);'>
-{row['Gender'].upper()}
-</div>
-</div>
-<div style='display: flex; align-items: center; justify-content: center; gap: 30px;'>
-<div style='flex: 1; display: flex; flex-direction: column; align-items: center; text-align: center;'>
-<img src='{t1_logo}' style='width: 48px; height: 48px; object-fit: contain; margin-bottom: 8px; filter: drop-shadow(0 4px 8px rgba(0,0,0,0.3));' />
-<span style='font-family: "Montserrat", sans-serif; font-weight: 700; font-size: 0.9rem; color: #fff;'>{t1_name}</span>
-</div>
-<div style='display: flex; flex-direction: column; align-items: center; min-width: 100px;'>
-{score_html}
-</div>
-<div style='flex: 1; display: flex; flex-direction: column; align-items: center; text-align: center;'>
-<img src='{t2_logo}' style='width: 48px; height: 48px; object-fit: contain; margin-bottom: 8px; filter: drop-shadow(0 4px 8px rgba(0,0,0,0.3));' />
-<span style='font-family: "Montserrat", sans-serif; font-weight: 700; font-size: 0.9rem; color: #fff;'>{t2_name}</span>
-</div>
-</div>
-{mvp_section}
-</div>""", unsafe_allow_html=True)
+            status_text = "FINAL"
+            status_color = "#FF9800"
 
-        if match_id:
-            # Use a clever column layout for the button to make it look part of the card
-            _, btn_col, _ = st.columns([0.3, 0.4, 0.3])
-            with btn_col:
-                if st.button("📊 View Full Analytics", key=f"{key_prefix}_{row['Match ID']}_{idx}", use_container_width=True):
-                    st.session_state.active_tab = "MATCH DASHBOARD"
-                    st.session_state.jump_to_match = match_id
-                    st.rerun()
+    # Stats jump: a query-param link read at the top of the script, not a per-row button
+    if m_found:
+        action = f"<a class='sch-link' href='?match={quote(str(row['DataMatchID']))}' target='_self'>📊 Stats</a>"
+    else:
+        action = "<span style='color:#444; font-size:0.7rem;'>-</span>"
+
+    # One line per row: indented lines would render as markdown code blocks
+    return (
+        "<div class='sch-row'>"
+        f"<div class='sch-cell' style='font-family:\"Outfit\"; font-weight:700; color:#555;'>{row['Match ID']}</div>"
+        "<div class='sch-cell sch-stack'>"
+        f"<div style='font-size: 0.85rem; font-weight: 600;'>{t_val}</div>"
+        f"<div style='font-size: 0.65rem; color: #888;'>{row['Court']}</div></div>"
+        "<div class='sch-cell sch-stack'><div style='display: flex; align-items: center; gap: 8px;'>"
+        f"<span style='font-weight: 700; font-size: 0.9rem; color: #fff;'>{t1_name}</span>"
+        "<span style='color: #444; font-size: 0.65rem; font-weight: 900;'>VS</span>"
+        f"<span style='font-weight: 700; font-size: 0.9rem; color: #fff;'>{t2_name}</span></div>"
+        f"<div style='font-size: 0.65rem; color: #666; text-transform: uppercase;'>{row['Gender']} Division</div></div>"
+        f"<div class='sch-cell' style='color:#aaa; font-size:0.8rem;'>{row['Group']}</div>"
+        "<div class='sch-cell sch-stack'>"
+        f"<div style='font-family:\"Outfit\"; font-weight:900; color:var(--tappa-orange); font-size:1.1rem;'>{score_text}</div>"
+        f"<div style='font-size:0.6rem; color:{status_color}; font-weight:700;'>{status_text}</div></div>"
+        f"<div class='sch-cell'>{action}</div>"
+        "</div>"
+    )
 
-def render_schedule_table(filtered_sch, raw_data_all, key_prefix="sch"):
-    if filtered_sch.empty:
+def render_schedule_table(filtered_sch, match_index, key_prefix="sch"):
+    """Schedule as one scrollable HTML block, paged by SCHEDULE_PAGE_SIZE.
+
+    The element count does not grow with the number of fixtures: one style
+    block, one table and (for long schedules) one page selector.
+    """
+    rows = filtered_sch[filtered_sch['Team A'].notna()]
+    if rows.empty:
         st.info("No matches match the selected filters.")
         return
 
-    import textwrap
-    
+    n_pages = -(-len(rows) // SCHEDULE_PAGE_SIZE)
+    if n_pages > 1:
+        page = st.selectbox("Page", range(1, n_pages + 1), key=f"{key_prefix}_page",
+                            format_func=lambda p: f"Page {p} of {n_pages}", label_visibility="collapsed")
+        rows = rows.iloc[(page - 1) * SCHEDULE_PAGE_SIZE:page * SCHEDULE_PAGE_SIZE]
+
     # Custom CSS for the grid-based table
     st.markdown("""
     <style>
+    .sch-table {
+        max-height: 640px;
+        overflow-y: auto;
+    }
+    .sch-row, .sch-header {
+        display: grid;
+        grid-template-columns: 0.5fr 1.2fr 2.5fr 0.6fr 1.2fr 1fr;
+        gap: 1rem;
+    }
     .sch-row {
         background: rgba(255,255,255,0.03); 
         border-bottom: 1px solid rgba(255,255,255,0.05);
@@ -293,7 +163,10 @@ def render_schedule_table(filtered_sch, raw_data_all, key_prefix="sch"):
         background: rgba(255,255,255,0.06);
     }
     .sch-header {
-        background: rgba(255,133,51,0.08);
+        position: sticky;
+        top: 0;
+        z-index: 1;
+        background: #1a1a1a;
         border-bottom: 2px solid var(--tappa-orange);
         padding: 10px 0;
         font-weight: bold;
@@ -308,131 +181,32 @@ def render_schedule_table(filtered_sch, raw_data_all, key_prefix="sch"):
         height: 100%;
         padding-left: 10px;
     }
+    .sch-stack {
+        flex-direction: column;
+        align-items: flex-start;
+        justify-content: center;
+    }
+    .sch-link {
+        padding: 6px 12px;
+        border: 1px solid rgba(255,255,255,0.2);
+        border-radius: 8px;
+        color: #fff !important;
+        font-size: 0.8rem;
+        font-weight: 600;
+        text-decoration: none !important;
+        white-space: nowrap;
+    }
+    .sch-link:hover {
+        border-color: var(--tappa-orange);
+        color: var(--tappa-orange) !important;
+    }
     </style>
     """, unsafe_allow_html=True)
 
-    # Header Row
-    c1, c2, c3, c4, c5, c6 = st.columns([0.5, 1.2, 2.5, 0.6, 1.2, 1])
-    
-    with c1: st.markdown("<div class='sch-header' style='padding-left:10px;'>ID</div>", unsafe_allow_html=True)
-    with c2: st.markdown("<div class='sch-header'>Time / Court</div>", unsafe_allow_html=True)
-    with c3: st.markdown("<div class='sch-header'>Matchup</div>", unsafe_allow_html=True)
-    with c4: st.markdown("<div class='sch-header'>Group</div>", unsafe_allow_html=True)
-    with c5: st.markdown("<div class='sch-header'>Result</div>", unsafe_allow_html=True)
-    with c6: st.markdown("<div class='sch-header'>Action</div>", unsafe_allow_html=True)
-    
-    manual_scores = dm.load_manual_scores()
-    
-    # Data Rows
-    for idx, row in filtered_sch.iterrows():
-        if pd.isna(row['Team A']):
-            continue
-            
-        m_found = get_match_obj(row, raw_data_all)
-        t1_name, t2_name = str(row['Team A']).strip(), str(row['Team B']).strip()
-        
-        # Time Logic
-        t_val = row['Time']
-        if pd.isna(t_val) or str(t_val).lower() == 'nan' or str(t_val).strip() == '':
-            t_val = "TBD"
-        
-        # Score Logic
-        score_text = "VS"
-        status_color = "#666"
-        status_text = "SCHEDULED"
-        
-        if m_found:
-            score_text = f"{m_found['TeamStats']['t1']['PTS']} - {m_found['TeamStats']['t2']['PTS']}"
-            status_text = "FINAL (STATS)"
-            status_color = "#4CAF50"
-        else:
-            m_key = f"{t1_name.upper()}_VS_{t2_name.upper()}_{row['Gender'].upper()}"
-            m_score = manual_scores.get(m_key)
-            if not m_score:
-                m_key_rev = f"{t2_name.upper()}_VS_{t1_name.upper()}_{row['Gender'].upper()}"
-                m_score = manual_scores.get(m_key_rev)
-                if m_score:
-                    score_text = f"{m_score['s2']} - {m_score['s1']}"
-                    status_text = "FINAL"
-                    status_color = "#FF9800"
-            else:
-                score_text = f"{m_score['s1']} - {m_score['s2']}"
-                status_text = "FINAL"
-                status_color = "#FF9800"
-        
-        # Row Container
-        with st.container():
-            c1, c2, c3, c4, c5, c6 = st.columns([0.5, 1.2, 2.5, 0.6, 1.2, 1])
-            
-            # ID
-            with c1: 
-                st.markdown(f"<div class='sch-cell' style='font-family:\"Outfit\"; font-weight:700; color:#555;'>{row['Match ID']}</div>", unsafe_allow_html=True)
-            
-            # Time/Court
-            with c2:
-                st.markdown(f"""
-                <div class='sch-cell' style='display:flex; flex-direction:column; align-items:flex-start; justify-content:center;'>
-                    <div style='font-size: 0.85rem; font-weight: 600;'>{t_val}</div>
-                    <div style='font-size: 0.65rem; color: #888;'>{row['Court']}</div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            # Matchup
-            with c3:
-                st.markdown(f"""
-                <div class='sch-cell' style='display:flex; flex-direction:column; align-items:flex-start; justify-content:center;'>
-                     <div style='display: flex; align-items: center; gap: 8px;'>
-                        <span style='font-weight: 700; font-size: 0.9rem; color: #fff;'>{t1_name}</span>
-                        <span style='color: #444; font-size: 0.65rem; font-weight: 900;'>VS</span>
-                        <span style='font-weight: 700; font-size: 0.9rem; color: #fff;'>{t2_name}</span>
-                    </div>
-                    <div style='font-size: 0.65rem; color: #666; text-transform: uppercase;'>{row['Gender']} Division</div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            # Group
-            with c4:
-                st.markdown(f"<div class='sch-cell' style='color:#aaa; font-size:0.8rem;'>{row['Group']}</div>", unsafe_allow_html=True)
-            
-            # Result
-            with c5:
-                st.markdown(f"""
-                <div class='sch-cell' style='display:flex; flex-direction:column; align-items:flex-start; justify-content:center;'>
-                    <div style='font-family:\"Outfit\"; font-weight:900; color:var(--tappa-orange); font-size:1.1rem;'>{score_text}</div>
-                    <div style='font-size:0.6rem; color:{status_color}; font-weight:700;'>{status_text}</div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            # Action (Button)
-            with c6:
-                if m_found:
-                    st.markdown("<div style='height: 4px;'></div>", unsafe_allow_html=True) # Spacer
-                    if st.button("📊 Stats", key=f"{key_prefix}_btn_stats_{row['Match ID']}_{idx}", use_container_width=True):
-                        st.session_state.active_tab = "MATCH DASHBOARD"
-                        # Assuming m_found has 'MatchId' or similar from raw_data
-                        # raw_data matches usually have 'MatchId' at root or similar? 
-                        # Actually get_match_obj returns the FULL stats object. 
-                        # It should have 'MatchId' or we use the loop key?
-                        # Let's assume 'MatchId' exists in the object or use row['Match ID'] mapping if needed.
-                        # The existing code used `row['Match ID']` for jump_to_match primarily? 
-                        # No, previously it passed `match_id` variable which came from where?
-                        # Ah, the previous card implementation used `match_id` variable.
-                        # Let's check `get_match_obj` return structure if possible or just try to be safe.
-                        # Standard raw data usually has 'MatchId'.
-                        # If not, we can try to use the schedule ID but that needs mapping.
-                        # But `get_match_obj` returns the FULL stats object. 
-                        # To jump to it, we need the ID that the dashboard uses to look it up.
-                        # The dashboard uses `st.session_state.jump_to_match`.
-                        # Let's assume for now we pass the Schedule ID and the dashboard handles mapping?
-                        # Or we pass the ID from `m_found` if available.
-                        
-                        target_id = m_found.get('MatchId')
-                        st.session_state.jump_to_match = str(target_id) if target_id else str(row['Match ID'])
-                        st.rerun()
-                else:
-                    st.markdown("<div class='sch-cell' style='color:#444; font-size:0.7rem;'>-</div>", unsafe_allow_html=True)
-
-        st.markdown("<div style='border-bottom: 1px solid rgba(255,255,255,0.05);'></div>", unsafe_allow_html=True)
+    header = "".join(f"<div class='sch-cell'>{h}</div>" for h in ["ID", "Time / Court", "Matchup", "Group", "Result", "Action"])
+    body = "".join(_schedule_row_html(row, match_index["by_id"].get(row['DataMatchID']))
+                   for row in rows.to_dict("records"))
+    st.markdown(f"<div class='sch-table'><div class='sch-header'>{header}</div>{body}</div>", unsafe_allow_html=True)
 
 def style_rankings(df, title):
     if df.empty: return f"<div style='padding:10px;'>No {title} Data</div>"
@@ -441,360 +215,114 @@ def style_rankings(df, title):
     cols = ['Rank', 'Team', 'W', 'L']
     if 'Diff' in df.columns: cols.append('Diff')
     elif '+/-' in df.columns: cols.append('+/-')
+    if 'SRS' in df.columns: cols.append('SRS')
     
     disp = df[cols].copy()
-    disp.columns = ['#', 'Team', 'W', 'L', '+/-']
-    st.dataframe(disp, hide_index=True, use_container_width=True)
+    disp.columns = ['#', 'Team', 'W', 'L', '+/-'] + (['SRS'] if 'SRS' in cols else [])
+    st.dataframe(disp, hide_index=True, use_container_width=True,
+                 column_config={"SRS": st.column_config.NumberColumn(
+                     "SRS", format="%+.1f",
+                     help="Opponent-adjusted margin: points per game better than an average team")})
 
 
 
 
 # Aggregation Logic moved to src.metrics_engine.py
 
-def calculate_power_rankings_v2(raw_data_list):
+def calculate_power_rankings_v2(raw_data_list, player_games=None):
+    """Full rebuild: group-stage standings + team advanced stats -> power rankings."""
+    state = _build_rankings_state(raw_data_list, player_games)
+    return state.rankings if state else pd.DataFrame()
+
+def _build_rankings_state(raw_data_list, player_games=None):
     # 1. Get Unified Standings (Record, PD, etc. for ALL teams)
-    # Note: We need schedule_df and manual_scores here.
-    # Ideally, we should pass them in, but for backward compatibility, load them here if needed.
-    df_sch = dm.load_schedule()
-    
-    # --- FILTER: GROUP STAGE ONLY ---
+    # Schedule, scraped results and manual scores come pre-joined in the fixtures table.
     # User Request: "groupings have changed significantly we only need standing from the group stage"
-    if not df_sch.empty and 'Group' in df_sch.columns:
-        # Filter OUT Knockout Stages to keep all Group variations (A, A1, B, E, H, etc.)
-        # User defined exclusion is safer than inclusion if names vary
-        exclude_stages = ["PQF", "Quarterfinal", "Semifinal", "Final", "LKO Final", "QF", "SF"]
-        df_sch = df_sch[~df_sch['Group'].isin(exclude_stages)].copy()
-        
-    manual_scores = dm.load_manual_scores()
-    unified_standings = calculate_unified_standings(df_sch, manual_scores, raw_data_list)
-    df_unified = pd.DataFrame(unified_standings)
-    
+    df_sch = pr.group_stage_fixtures(store.fixtures)
+    df_unified = calculate_unified_standings(df_sch)
     if df_unified.empty:
-        return pd.DataFrame()
-
-    # 2. Get Advanced Stats for teams that have them
-    # We want Team Stats here (NetRtg, etc)
-    _, df_adv = MetricsEngine.get_tournament_stats(raw_data_list, "Full Game", entity_type="Teams")
-    
-    # 3. Merge
-    # We want a master list of all teams.
-    # df_unified has: Team, Gender, Group, GP, W, L, PF, PA, PD, PTS
-    # df_adv has: Team, NetRtg, PIE, TS%, etc.
-    
-    # Init Rankings List
-    rankings = []
-    
-    # --- MASTER GROUP MAPPING (USER DEFINED) ---
-    # Forces teams into correct groups regardless of schedule data
-    # --- MASTER GROUP MAPPING (USER DEFINED) ---
-    # Forces teams into correct groups regardless of schedule data (A1->A, etc.)
-
-
-    for _, row in df_unified.iterrows():
-        team = row['Team']
-        gender = row['Gender']
-        
-        assigned_group = row['Group'] # Default
-
-        # Look up in master map
-        # Note: keys in team_group_map are just team names. 
-        # But some teams (Indian Railways) are in both genders.
-        # So we must verify gender match or use a tuple key strategy if we changed the dictionary.
-        # But previous step used Team Name as key.
-        # FIX: The previous dictionary has duplicate keys if written literally in python dict construction!
-        # "Indian Railways" appears twice. The second one overwrites the first.
-        # We MUST use (Team, Gender) as key or separate dictionaries.
-        
-        # Let's fix the dictionary structure right now to be (Team, Gender) -> Group
-        pass
-
-    # --- CORRECTED DICTIONARY ---
-    # We will use a lookup function instead of a single dict to handle the content we just wrote.
-    # Actually, simpler: define the mapping list and iterate, as intended in previous step
-    
-    # RE-DEFINING MAPPING LIST WITHIN THE LOOP IS INEFFICIENT.
-    # Let's define the list once outside.
-    
-    mapping_list = [
-            ("Tamil Nadu", "Men", "A"), ("Karnataka", "Men", "A"), ("Services", "Men", "A"), ("Rajasthan", "Men", "A"), ("Gujarat", "Men", "A"),
-            ("Punjab", "Men", "B"), ("Indian Railways", "Men", "B"), ("Delhi", "Men", "B"), ("Uttar Pradesh", "Men", "B"), ("Chandigarh", "Men", "B"),
-            ("Kerala", "Men", "C"), ("Jammu & Kashmir", "Men", "C"), ("Jharkhand", "Men", "C"), ("West Bengal", "Men", "C"),
-            ("Madhya Pradesh", "Men", "D"), ("Goa", "Men", "D"), ("Maharashtra", "Men", "D"), ("Uttarakhand", "Men", "D"),
-            ("Haryana", "Men", "E"), ("Chhattisgarh", "Men", "E"), ("Meghalaya", "Men", "E"), ("Tripura", "Men", "E"),
-            ("Himachal Pradesh", "Men", "F"), ("Bihar", "Men", "F"), ("Mizoram", "Men", "F"), ("Telangana", "Men", "F"),
-            ("Andaman & Nicobar", "Men", "G"), ("Assam", "Men", "G"), ("Nagaland", "Men", "G"), ("Sikkim", "Men", "G"),
-            ("Andhra Pradesh", "Men", "H"), ("Arunachal Pradesh", "Men", "H"), ("Odisha", "Men", "H"), ("Puducherry", "Men", "H"),
-            # WOMEN
-            ("Indian Railways", "Women", "A"), ("Delhi", "Women", "A"), ("Chhattisgarh", "Women", "A"), ("Maharashtra", "Women", "A"), ("Karnataka", "Women", "A"),
-            ("Kerala", "Women", "B"), ("Tamil Nadu", "Women", "B"), ("Madhya Pradesh", "Women", "B"), ("Gujarat", "Women", "B"), ("West Bengal", "Women", "B"),
-            ("Punjab", "Women", "C"), ("Goa", "Women", "C"), ("Haryana", "Women", "C"), ("Tripura", "Women", "C"), ("Uttarakhand", "Women", "C"),
-            ("Uttar Pradesh", "Women", "D"), ("Chandigarh", "Women", "D"), ("Jammu & Kashmir", "Women", "D"), ("Telangana", "Women", "D"),
-            ("Rajasthan", "Women", "E"), ("Bihar", "Women", "E"), ("Jharkhand", "Women", "E"), ("Sikkim", "Women", "E"),
-            ("Himachal Pradesh", "Women", "F"), ("Arunachal Pradesh", "Women", "F"), ("Manipur", "Women", "F"), ("Puducherry", "Women", "F"),
-            ("Andhra Pradesh", "Women", "G"), ("Assam", "Women", "G"), ("Meghalaya", "Women", "G"), ("Odisha", "Women", "G")
-    ]
-    
-    # Convert to Dict for O(1) lookup: (Team, Gender) -> Group
-    # Normalize team names to title case or upper case to match data? 
-    # Data seems to be Title Case.
-    master_map = {(t, g): grp for t, g, grp in mapping_list}
-
-    for _, row in df_unified.iterrows():
-        team = row['Team']
-        gender = row['Gender']
-        
-        assigned_group = row['Group'] # Default
-        
-        # Override
-        # Mapping keys are Title Case (e.g. "Tamil Nadu"), but data might be uppercase ("TAMIL NADU")
-        lookup_team = team.title() 
-        # Handle special cases if title() messes up (e.g. "Idco" vs "IDCO", or "Services" vs "SERVICES")
-        # Generally title() is safe for these state names.
-        # But "Uttar Pradesh" -> "Uttar Pradesh". "UTTAR PRADESH" -> "Uttar Pradesh".
-        
-        if (lookup_team, gender) in master_map:
-             assigned_group = master_map[(lookup_team, gender)]
-        # Fallback: try direct match in case dictionary has some uppercase
-        elif (team, gender) in master_map:
-             assigned_group = master_map[(team, gender)]
-        
-        # Base Metric (Win % + PD Factor)
-        win_pct = row['W'] / row['GP'] if row['GP'] > 0 else 0
-        pd_norm = row['PD'] / row['GP'] if row['GP'] > 0 else 0
-        # Normalize PD: assume max PD is ~50.
-        pd_score = min(max(pd_norm / 50.0, -1.0), 1.0) * 20 # +/- 20 points impact
-        
-        base_score = (win_pct * 60) + 20 + pd_score # 0-80 range approx
-        
-        # Advanced Metric Bonus
-        adv_bonus = 0
-        has_stats = False
-        
-        if not df_adv.empty and team in df_adv['Team'].values:
-            has_stats = True
-            adv_row = df_adv[df_adv['Team'] == team].iloc[0]
-            
-            # Net Rating (-30 to +30 range approx) -> +/- 10
-            net = adv_row.get('NetRtg', 0)
-            net_score = min(max(net / 30.0, -1.0), 1.0) * 10
-            
-            # PIE (0 to 20 range approx, avg 10) -> +/- 5
-            # Actually PIE is % (e.g. 50%).
-            pie = adv_row.get('PIE', 50)
-            pie_score = ((pie - 50) / 20) * 10 # +/- 10
-            
-            adv_bonus = net_score + pie_score
-            
-            # Sanity cap
-            adv_bonus = min(max(adv_bonus, -15), 15)
-        
-        final_score = base_score + adv_bonus
-        
-        rankings.append({
-            "Team": team.title(), # Normalize to Title Case
-            "Category": row.get('Gender', 'Unknown'),
-            "Group": assigned_group,
-            "Record": f"{row['W']}-{row['L']}",
-            "GP": row['GP'],
-            "W": row['W'],
-            "L": row['L'],
-            "Diff": row['PD'],
-            "PD": row['PD'],
-            "PF": row.get('PF', 0),
-            "PA": row.get('PA', 0),
-            "PTS": row.get('PTS', 0),
-            "Score": round(final_score, 1),
-            "HasStats": has_stats,
-            "Trend": 0 # Placeholder
-        })
-
-    # --- INJECT MISSING TEAMS FROM MAP ---
-    # Ensure all User-Defined teams appear even if they have 0 games
-    existing_teams = {(r['Team'].strip().title(), r['Category']) for r in rankings}
-    
-    for (team_name, team_gender), group_code in master_map.items():
-        if (team_name.strip().title(), team_gender) not in existing_teams:
-            # Add with 0 stats
-             rankings.append({
-                "Team": team_name, # Use proper title case name from valid map
-                "Category": team_gender,
-                "Group": group_code,
-                "Record": "0-0",
-                "GP": 0,
-                "W": 0,
-                "L": 0,
-                "Diff": 0,
-                "PD": 0,
-                "PF": 0,
-                "PA": 0,
-                "PTS": 0,
-                "Score": 0.0,
-                "HasStats": False,
-                "Trend": 0
-            })
-            
-    # Filter out "W/O" placeholders or invalid teams
-    rankings = [r for r in rankings if "W/O" not in r['Team'] and r['Group'] not in ["A1", "B1", "A2", "B2"]]
+        return None
+
+    # 2. Get Advanced Stats for teams that have them (NetRtg, PIE)
+    _, df_adv = MetricsEngine.get_tournament_stats(raw_data_list, "Full Game", entity_type="Teams", _player_games=player_games)
+    return pr.RankingState.build(df_sch, df_unified, df_adv, pr.match_ids_of(raw_data_list))
+
+@st.cache_resource
+def _rankings_states():
+    # Ranking state per category scope, shared across reruns and sessions
+    return {"lock": threading.Lock(), "states": {}}
+
+def get_power_rankings(raw_data_list, player_games=None):
+    """Power rankings, updated in place when only a few new results have landed.
+
+    Each new group-stage result touches its two standings rows and re-ranks
+    that category; a new box score re-computes team stats for just the two
+    teams involved. Anything else (edited scores, removed matches, more than
+    a handful of new results) falls back to calculate_power_rankings_v2.
+    """
+    holder = _rankings_states()
+    scope = tuple(sorted({str(m.get('Category')) for m in raw_data_list}))
+    match_ids = pr.match_ids_of(raw_data_list)
+
+    with holder["lock"]:
+        state = holder["states"].get(scope)
+        fixtures = pr.group_stage_fixtures(store.fixtures)
+        pending = pr.pending_results(state, fixtures, match_ids) if state else None
+        new_ids = set(match_ids) - state.match_ids if state else set()
+
+        if (pending is not None and len(pending) + len(new_ids) <= pr.INCREMENTAL_LIMIT
+                and _apply_new_results(state, pending, new_ids, raw_data_list, player_games)):
+            state.match_ids = set(match_ids)
+        else:
+            state = _build_rankings_state(raw_data_list, player_games)
+            holder["states"][scope] = state
+        return state.rankings.copy() if state else pd.DataFrame()
+
+def _apply_new_results(state, pending, new_ids, raw_data_list, player_games=None):
+    """Fold new fixtures and box scores into ``state``; False means rebuild instead."""
+    if not all(state.apply_result(f) for f in pending):
+        return False
+    for m in raw_data_list:
+        if mi.canon_match_id(m.get("MatchID")) not in new_ids:
+            continue
+        # Team stats only depend on each team's own games, so re-run them for the two teams
+        teams = {mi.canon_team(m['Teams']['t1']), mi.canon_team(m['Teams']['t2'])}
+        team_matches = [x for x in raw_data_list
+                        if {mi.canon_team(x['Teams']['t1']), mi.canon_team(x['Teams']['t2'])} & teams]
+        _, df_t = MetricsEngine.get_tournament_stats(team_matches, "Full Game", entity_type="Teams", _player_games=player_games)
+        if not state.refresh_adv(pr.team_adv_rows(df_t, teams, mi.canon_category(m.get('Category', '')))):
+            return False
+    return True
 
-        
-    df_rank = pd.DataFrame(rankings)
-    if not df_rank.empty:
-        # Group sort by Category then Score to get Rank per category
-        # But wait, usually we filter by category later.
-        # So Rank should ideally be calculated per category?
-        # The old function returned a dict by category.
-        # Now we return one DF.
-        # If we calculate rank globally, it mixes Men and Women.
-        # We should calculate Rank per Category.
-        
-        df_rank = df_rank.sort_values(['Category', 'Score'], ascending=[True, False])
-        df_rank['Rank'] = df_rank.groupby('Category').cumcount() + 1
-        
-    return df_rank
 
+# Load Data: one read-only store per data version, shared by every session
+store = dm.load_store()
 
-# Load Data
-try:
-    raw_data_dict, total_games, last_updated = dm.load_data()
-    # Check if dict or list
-    if isinstance(raw_data_dict, list):
-        raw_data = raw_data_dict
-    else:
-        # Check for wrapped structure first
-        if "Matches" in raw_data_dict:
-            raw_data = raw_data_dict["Matches"]
-        elif "matches" in raw_data_dict:
-            raw_data = raw_data_dict["matches"]
-        else:
-            # Production structure: dict with match IDs as keys
-            raw_data = list(raw_data_dict.values())
-except NameError:
-    # Fallback if v12 unavailable (should not happen)
-    st.error("Data loader v12 not found. Please restart app.")
-    raw_data = []
+
+# --- HEADER & CATEGORY FILTERING ---
+logos = dm.load_logos()
+
+# Matches with Category and Stage already injected
+raw_data = store.matches
 
 if not raw_data:
     st.error("Data.json not found. Please run tournament_engine.py first.")
     st.stop()
 
+# Unfiltered data for player profiles (so game log shows all matches)
+raw_data_all = store.matches
 
-# --- HEADER & CATEGORY FILTERING ---
-# Load Maps
-cat_map = dm.load_category_map()
-logos = dm.load_logos()
-
-# Inject Category into raw_data
-if raw_data and cat_map:
-    for m in raw_data:
-        mid = str(m.get("MatchID"))
-        # Only overwrite if value is a valid Category (to avoid "Knockout" issue)
-        if mid in cat_map and cat_map[mid] in ["Men", "Women"]:
-            m['Category'] = cat_map[mid]
-
-# Store unfiltered data for player profiles (so game log shows all matches)
-raw_data_all = raw_data.copy()
+# Player-game-period fact table, flattened once per data load
+player_games = store.player_games
+# Per-quarter cube: halves, quarters and custom quarter sets are sums over it
+period_cube = store.period_cube
 
 
 
 # --- HELPER: FORMATTING ---
 def format_df(df, precision=0):
-    """Format dataframe values based on column types and apply styling"""
-    df = df.copy()
-    
-    # Percentage columns
-    pct_cols = [c for c in df.columns if '%' in c or c in ['TS%', 'eFG%', 'FG%', '2P%', '3P%', 'FT%', 'USG%', 'AST%', 'REB%', 'OREB%', 'DREB%', 'PIE']]
-    for c in pct_cols:
-        if c in df.columns:
-            df[c] = pd.to_numeric(df[c], errors='coerce').round(1)
-    
-    # Ratio columns
-    ratio_cols = [c for c in df.columns if 'Ratio' in c or 'RATIO' in c or c == 'AST/TO']
-    for c in ratio_cols:
-        if c in df.columns:
-            df[c] = pd.to_numeric(df[c], errors='coerce').round(2)
-    
-    # Count stats
-    count_cols = ['Pts', 'REB', 'AST', 'STL', 'BLK', 'TO', 'FGM', 'FGA', '3PM', '3PA', 'FTM', 'FTA', 'OFF', 'DEF', 'PTS', 'TOV', 'PF', 'FD', '2CP', 'BLKR', '+/-', 'Eff', 'EFF', 'FIC', 'GmScr']
-    # Add Opponent cols
-    opp_cols = [c for c in df.columns if c.startswith('Opp') or c.startswith('Tm')]
-    all_count = count_cols + opp_cols
-    
-    for c in all_count:
-        if c in df.columns:
-            if precision == 0:
-                df[c] = pd.to_numeric(df[c], errors='coerce').fillna(0).astype(int)
-            else:
-                df[c] = pd.to_numeric(df[c], errors='coerce').fillna(0).round(precision)
-                
-    if 'GP' in df.columns:
-        df['GP'] = pd.to_numeric(df['GP'], errors='coerce').fillna(0).astype(int)
-            
-    # Conditional Formatting Logic
-    def highlight_exceptional(s):
-        is_high = pd.Series(data=False, index=s.index)
-        col = s.name
-        
-        # Thresholds
-        try:
-            # Count Stats
-            if col in ["Pts", "PTS"]: is_high = s >= 20
-            elif col in ["REB", "Reb", "REB%"]: is_high = s >= 10
-            elif col in ["AST"]: is_high = s >= 6
-            elif col in ["STL"]: is_high = s >= 4
-            elif col in ["BLK"]: is_high = s >= 3
-            
-            # Advanced / Composite
-            elif col in ["PIE"]: is_high = s >= 15
-            elif col in ["GmScr"]: is_high = s >= 15
-            elif col in ["FIC"]: is_high = s >= 15
-            elif col in ["Eff", "EFF"]: is_high = s >= 20
-            
-            # Percentages
-            elif col in ["FG%", "2P%"]: is_high = s >= 50.0
-            elif col in ["3P%"]: is_high = s >= 40.0
-            elif col in ["FT%"]: is_high = s >= 80.0
-            # elif col in ["eFG%", "EFG%"]: is_high = s >= 55.0 # Optional
-            # elif col in ["TS%"]: is_high = s >= 60.0 # Optional
-            
-        except:
-            pass # Handle comparison errors
-        
-        return ['background-color: #1a472a; color: white; font-weight: bold' if v else '' for v in is_high]
-    
-    # Create a format dictionary to avoid .0 on integers
-    format_dict = {}
-    for col in df.columns:
-        if col in pct_cols:
-            format_dict[col] = "{:.1f}"
-        elif col in ratio_cols:
-            format_dict[col] = "{:.2f}"
-        elif col in all_count or col == 'GP':
-            # Check if the column actually contains floats that should be integers
-            # This is important if precision was 0 during initial processing
-            if pd.api.types.is_integer_dtype(df[col]):
-                format_dict[col] = "{:.0f}"
-            else: # If it's float (e.g., precision was not 0), format with the specified precision
-                format_dict[col] = f"{{:.{precision}f}}"
-        elif pd.api.types.is_numeric_dtype(df[col]):
-            # Default for other numeric columns, e.g., MIN_CALC
-            format_dict[col] = f"{{:.{precision}f}}"
-
-    # Styler Definition
-    styler = df.style.format(format_dict, na_rep="-")\
-                     .set_properties(**{'text-align': 'center', 'vertical-align': 'middle'})\
-                     .set_table_styles([
-                         {'selector': 'th', 'props': [('text-align', 'center'), ('vertical-align', 'middle'), ('font-weight', 'bold')]},
-                         {'selector': 'td', 'props': [('text-align', 'center'), ('vertical-align', 'middle')]}
-                     ])
-
-    # Apply Highlight
-    target_cols = ["Pts", "PTS", "REB", "AST", "STL", "BLK", "PIE", "GmScr", "FIC", "Eff", "FG%", "2P%", "3P%", "FT%"]
-    existing_cols = [c for c in target_cols if c in df.columns]
-    
-    if existing_cols:
-        styler.apply(highlight_exceptional, subset=existing_cols)
-        
-    return styler
+    """Cached display table for a stat frame (see src.core.formatters.format_df)."""
+    return fmt.format_df(df, precision)
 
 # --- MAIN LAYOUT ---
 c_title = st.container()
@@ -802,23 +330,6 @@ with c_title:
     col_title, col_filter = st.columns([0.7, 0.3])
     
     with col_title:
-        # Get logo paths for inline display
-        tappa_logo = os.path.join(os.path.dirname(os.path.dirname(__file__)), "web", "assets", "tappa", "logo.svg")
-        kev_logo = os.path.join(os.path.dirname(os.path.dirname(__file__)), "web", "assets", "tappa", "thekev circ.png")
-        
-        # Convert logos to base64 for inline display
-        import base64
-        tappa_b64 = ""
-        kev_b64 = ""
-        
-        if os.path.exists(tappa_logo):
-            with open(tappa_logo, "rb") as f:
-                tappa_b64 = base64.b64encode(f.read()).decode()
-        
-        if os.path.exists(kev_logo):
-            with open(kev_logo, "rb") as f:
-                kev_b64 = base64.b64encode(f.read()).decode()
-        
         st.markdown(f"""<div style='text-align: center; margin-top: 0px;'>
 <h1 style='margin: 0; font-family: "Space Grotesk", sans-serif; font-weight: 700; font-size: 2.2rem; letter-spacing: -0.04em; color: #ffffff !important;'>
 SN25 Stats by <span style='color: var(--tappa-orange);'>tappa.bb</span>
@@ -826,7 +337,7 @@ SN25 Stats by <span style='color: var(--tappa-orange);'>tappa.bb</span>
 <p style='color: var(--text-secondary); font-size: 0.8rem; margin: 4px 0 0 0; font-family: "Space Grotesk", sans-serif; display: flex; align-items: center; justify-content: center; gap: 8px;'>
 <span style='display: flex; align-items: center; gap: 4px;'>
 Powered by 
-<img src="data:image/svg+xml;base64,{tappa_b64}" style="height: 16px; vertical-align: middle;" />
+<img src="{assets.data_uri(assets.TAPPA_LOGO)}" style="height: 16px; vertical-align: middle;" />
 <a href="https://www.instagram.com/tappa.bb/" target="_blank" style='color: var(--tappa-orange); font-weight: 600; text-decoration: none; display: flex; align-items: center; gap: 3px;'>
 Tappa
 <svg xmlns="http://www.w3.org/2000/svg" width="12" height="12" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
@@ -839,7 +350,7 @@ Tappa
 <span style='color: rgba(255, 255, 255, 0.3);'>|</span>
 <span style='display: flex; align-items: center; gap: 4px;'>
 Made by 
-<img src="data:image/png;base64,{kev_b64}" style="height: 16px; vertical-align: middle; border-radius: 50%;" />
+<img src="{assets.data_uri(assets.KEV_LOGO)}" style="height: 16px; vertical-align: middle; border-radius: 50%;" />
 <a href="https://www.instagram.com/thekevmedia/" target="_blank" style='color: #ff3333; font-weight: 600; text-decoration: none; display: flex; align-items: center; gap: 3px;'>
 Kev Media
 <svg xmlns="http://www.w3.org/2000/svg" width="12" height="12" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
@@ -853,7 +364,7 @@ Kev Media
 <span style='display: flex; align-items: center; gap: 4px;'>
 Supported by 
 <a href="https://www.instagram.com/nolooknationind/" target="_blank" style='color: #87CEEB; font-weight: 600; text-decoration: none; display: flex; align-items: center; gap: 3px;'>
-<img src="data:image/svg+xml;base64,{ec.NNI_LOGO_B64}" style="height: 16px; vertical-align: middle;" />
+<img src="{assets.INLINE['nni']}" style="height: 16px; vertical-align: middle;" />
 NoLookNation
 <svg xmlns="http://www.w3.org/2000/svg" width="12" height="12" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
 <rect x="2" y="2" width="20" height="20" rx="5" ry="5"></rect>
@@ -872,10 +383,15 @@ NoLookNation
 
 # Apply category filter
 if cat_filter != "All":
-    raw_data = [m for m in raw_data if m.get("Category") == cat_filter]
+    raw_data = store.matches_in(cat_filter)
     if not raw_data:
         st.warning(f"No matches found for category: {cat_filter}")
 
+# Compact cache key for the filtered list, so cached stats never hash the match dicts
+raw_key = dm.data_key(raw_data, category=cat_filter)
+# The same filter as a fact-table mask (see ft.select_match_ids)
+cat_sel = None if cat_filter == "All" else cat_filter
+
 # Add divider below header
 st.markdown("<hr style='margin: 10px 0; border: none; border-top: 1px solid rgba(255, 255, 255, 0.1);'>", unsafe_allow_html=True)
 
@@ -904,6 +420,13 @@ if st.session_state.active_main_nav not in NAV_GROUPS:
     st.session_state.active_main_nav = "DASHBOARD"
     st.session_state.active_tab = "HOME"
 
+# Schedule "Stats" links open a match through ?match=<MatchID>
+if "match" in st.query_params:
+    st.session_state.active_main_nav = "GAME CENTRE"
+    st.session_state.active_tab = "MATCH DASHBOARD"
+    st.session_state.jump_to_match = st.query_params["match"]
+    del st.query_params["match"]
+
 # Custom CSS for Navigation
 st.markdown("""
     <style>
@@ -975,8 +498,32 @@ if len(active_group_tabs) > 1:
 
 st.markdown("<div style='height: 10px; border-bottom: 1px solid rgba(255,255,255,0.03); margin-bottom: 30px;'></div>", unsafe_allow_html=True)
 
+# --- SECTIONS ---
+# Each top-level tab is a fragment: widgets inside a tab rerun only that tab,
+# and only the active tab's data is ever computed.
+SECTIONS = {}
+# HUB_SECTION_TIMING=1 records each tab's render time in st.session_state.section_ms
+# (used by scripts/bench_sections.py)
+SECTION_TIMING = os.environ.get("HUB_SECTION_TIMING") == "1"
+
+def section(tab):
+    """Register a tab renderer as a fragment, timed when SECTION_TIMING is on."""
+    def register(render):
+        target = render
+        if SECTION_TIMING:
+            def timed():
+                t0 = time.perf_counter()
+                render()
+                st.session_state.setdefault("section_ms", {})[tab] = round((time.perf_counter() - t0) * 1000, 1)
+            timed.__name__ = timed.__qualname__ = render.__name__
+            target = timed
+        SECTIONS[tab] = st.fragment(target)
+        return render
+    return register
+
 # --- HOME DASHBOARD ---
-if st.session_state.active_tab == "HOME":
+@section("HOME")
+def render_home():
     # 1. Headline Stats / Leaders
     st.markdown("""<div style='text-align: center; margin-bottom: 30px;'>
 <h2 style='font-family: "Montserrat", sans-serif; font-weight: 900; font-size: 1.8rem; text-transform: uppercase; letter-spacing: 0.1em; background: -webkit-linear-gradient(45deg, #FF6B00, #ff9e42); -webkit-background-clip: text; -webkit-text-fill-color: transparent; margin: 0;'>
@@ -987,24 +534,20 @@ Tournament Overview
     
     # Calculate Data
 
-    rankings = calculate_power_rankings_v2(raw_data)
-    df_p, _ = MetricsEngine.get_tournament_stats(raw_data, period="Full Game", entity_type="Players")
+    rankings = get_power_rankings(raw_data, player_games)
+    df_p, _ = MetricsEngine.get_tournament_stats(raw_data, period="Full Game", entity_type="Players", _player_games=player_games, data_key=raw_key)
     
     if not df_p.empty:
-        # Separate by Category
-        df_men = df_p[df_p['Category'] == 'Men']
-        df_women = df_p[df_p['Category'] == 'Women']
-
-        def get_top_stat(df, col):
-            return df.sort_values(by=col, ascending=False).head(3)
+        # Top rows per Category from the cached leaderboard index
+        board = lb.leaderboard(df_p, ("home", raw_key), group_col="Category")
 
         # Men's Leaders
-        m_pts = get_top_stat(df_men, 'PTS')
-        m_reb = get_top_stat(df_men, 'REB')
+        m_pts = board.top('PTS', 3, 'Men')
+        m_reb = board.top('REB', 3, 'Men')
         
         # Women's Leaders
-        w_pts = get_top_stat(df_women, 'PTS')
-        w_reb = get_top_stat(df_women, 'REB')
+        w_pts = board.top('PTS', 3, 'Women')
+        w_reb = board.top('REB', 3, 'Women')
         
         def render_leader_card(title, rows, metric_key):
             # Use separate strings to avoid indentation issues in markdown
@@ -1046,7 +589,7 @@ Tournament Overview
     
     with col_home1:
         st.markdown("<h4 style='font-family: \"Space Grotesk\", sans-serif; color: var(--tappa-orange); text-transform: uppercase;'>Today's Schedule & Results</h4>", unsafe_allow_html=True)
-        df_sch = dm.load_schedule()
+        df_sch = store.fixtures.copy()
         if not df_sch.empty:
             # Filter for "Today" based on system date
             try:
@@ -1097,7 +640,7 @@ Tournament Overview
                             if subset.empty:
                                 st.info("No matches on this court.")
                             else:
-                                render_schedule_table(subset, raw_data_all, key_prefix=f"home_sch_{idx}")
+                                render_schedule_table(subset, store.match_index, key_prefix=f"home_sch_{idx}")
             
             st.markdown("<div style='height: 10px;'></div>", unsafe_allow_html=True)
             if st.button("View Full Schedule", use_container_width=True, key="view_full_sch"):
@@ -1166,7 +709,8 @@ Recent Results
 
 
 # --- STANDINGS DASHBOARD ---
-if st.session_state.active_tab == "STANDINGS":
+@section("STANDINGS")
+def render_standings():
     st.markdown("""<div style='text-align: center; margin-bottom: 30px;'>
     <h2 style='font-family: "Montserrat", sans-serif; font-weight: 900; font-size: 1.8rem; text-transform: uppercase; letter-spacing: 0.1em; background: -webkit-linear-gradient(45deg, #FF6B00, #ff9e42); -webkit-background-clip: text; -webkit-text-fill-color: transparent; margin: 0;'>
     Group Standings
@@ -1176,7 +720,7 @@ if st.session_state.active_tab == "STANDINGS":
     
     # Calculate Unified Standings
     # Calculate Unified Standings via Central Function
-    df_standings = calculate_power_rankings_v2(raw_data_all)
+    df_standings = get_power_rankings(raw_data_all, player_games)
     
     if df_standings.empty:
         st.info("No standings data available.")
@@ -1257,7 +801,8 @@ if st.session_state.active_tab == "STANDINGS":
 
 
 # --- SCHEDULE DASHBOARD ---
-if st.session_state.active_tab == "SCHEDULE":
+@section("SCHEDULE")
+def render_schedule():
     st.markdown("""<div style='text-align: center; margin-bottom: 30px;'>
 <h2 style='font-family: "Montserrat", sans-serif; font-weight: 900; font-size: 1.8rem; text-transform: uppercase; letter-spacing: 0.1em; background: -webkit-linear-gradient(45deg, #FF6B00, #ff9e42); -webkit-background-clip: text; -webkit-text-fill-color: transparent; margin: 0;'>
 Tournament Schedule
@@ -1265,14 +810,14 @@ Tournament Schedule
 <div style='height: 4px; width: 60px; background: var(--tappa-orange); margin: 8px auto; border-radius: 2px;'></div>
 </div>""", unsafe_allow_html=True)
 
-    df_schedule = dm.load_schedule()
+    df_schedule = store.fixtures
     
     if df_schedule.empty:
         st.warning("Schedule file not found.")
     else:
         # Daytime navigation strip
         st.markdown("<div style='margin-bottom: 20px;'>", unsafe_allow_html=True)
-        unique_days = sorted(df_schedule['Day'].unique().tolist())
+        unique_days = sorted(df_schedule['Day'].dropna().unique().tolist())
         day_cols = st.columns(len(unique_days) + 1)
         
         if 'selected_day' not in st.session_state:
@@ -1289,7 +834,7 @@ Tournament Schedule
         st.markdown("</div>", unsafe_allow_html=True)
 
         # Small filter for Court
-        courts = ["All Courts"] + sorted(df_schedule['Court'].unique().tolist())
+        courts = ["All Courts"] + sorted(df_schedule['Court'].dropna().unique().tolist())
         sel_court = st.selectbox("Court Filter", courts, label_visibility="collapsed")
 
         filtered_sch = df_schedule.copy()
@@ -1303,11 +848,12 @@ Tournament Schedule
             filtered_sch = filtered_sch[filtered_sch['Gender'] == cat_filter]
 
         # Display Schedule in Compact Table View
-        render_schedule_table(filtered_sch, raw_data_all)
+        render_schedule_table(filtered_sch, store.match_index)
 
 
 # --- MATCH DASHBOARD ---
-if st.session_state.active_tab == "MATCH DASHBOARD":
+@section("MATCH DASHBOARD")
+def render_match_dashboard():
     if not isinstance(raw_data, list):
         st.error("Invalid data format. Expected list of matches.")
         st.stop()
@@ -1441,17 +987,6 @@ Match Scoreboard
 </div>""", unsafe_allow_html=True)
     
     col_t1, col_vs, col_t2 = st.columns([1, 0.15, 1])
-    logo_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "web", "assets", "teams")
-    
-    import base64
-
-    # --- HELPER: IMAGE ENCODING ---
-    def get_image_base64(path):
-        """Read image file and render as base64 string"""
-        if os.path.exists(path):
-            with open(path, "rb") as image_file:
-                return base64.b64encode(image_file.read()).decode()
-        return ""
     
     with col_t1:
         winner_class = "winner-glow" if s1 > s2 else ""
@@ -1660,31 +1195,21 @@ Match Scoreboard
         if not q_curr:
             st.info("Select at least one period to view box scores.")
         else:
-            raw_recs = []
-            if set(q_curr) == {"Q1", "Q2", "Q3", "Q4"} and period_mode != "Custom":
+            if period_mode == "Full Game":
+                raw_recs = []
                 for p, s in m['PlayerStats'].items():
                     s_copy = s.copy()
                     s_copy['Player'] = p
                     raw_recs.append(s_copy)
+                df_active = pd.DataFrame(raw_recs)
             else:
-                for q in q_curr:
-                    q_data = m.get('PeriodStats', {}).get(q, {})
-                    for p, s in q_data.items():
-                        s_copy = s.copy()
-                        s_copy['Player'] = p
-                        raw_recs.append(s_copy)
-            
-            df_active = pd.DataFrame(raw_recs)
+                # Halves / custom quarter sets: summed over the period cube
+                df_active = ft.cube_rows(period_cube, q_curr, [m])
+                if not df_active.empty:
+                    df_active['Player'] = df_active['PlayerKey']
             if not df_active.empty:
                 if "MIN_DEC" in df_active.columns: df_active["MIN_CALC"] = df_active["MIN_DEC"]
                 df_active = ant.normalize_stats(df_active)
-                
-                if len(q_curr) != 4 or period_mode == "Custom":
-                    num_cols = df_active.select_dtypes(include=np.number).columns
-                    df_agg = df_active.groupby('Player')[num_cols].sum().reset_index()
-                    df_meta = df_active.groupby('Player')[["Team", "No"]].first().reset_index()
-                    df_active = pd.merge(df_agg, df_meta, on='Player')
-                
                 df_active = ant.calculate_derived_stats(df_active)
 
                 # --- OUTLIER & STAR PLAYER CALCULATION ---
@@ -1782,7 +1307,8 @@ Match Scoreboard
 
 
 # --- TOP PERFORMANCES ---
-elif st.session_state.active_tab == "TOP PERFORMANCES":
+@section("TOP PERFORMANCES")
+def render_top_performances():
     # UI Controls at top
     c_stage, c_date, c_period = st.columns([1, 1.5, 1.5])
     
@@ -1792,47 +1318,15 @@ elif st.session_state.active_tab == "TOP PERFORMANCES":
     with c_period:
         period_sel = st.radio("Time Segment", ["Full Game", "1st Half", "2nd Half", "Q1", "Q2", "Q3", "Q4"], horizontal=True, index=0)
     
-    # Apply stage filter to raw_data before aggregating
+    # Apply stage filter (Knockout flag from the stage classifier) before aggregating
     if stage_filter != "All Games":
-        knockout_stages = ["Quarterfinal", "Semifinal", "Final", "PQF", "QF", "SF"]
-        
-        # Load schedule with Genius Match IDs
-        filtered_matches = []
-        df_sch = dm.load_schedule()
-        
-        # Create lookup dict: Genius Match ID -> Group/Stage
-        if not df_sch.empty and 'Genius Match ID' in df_sch.columns:
-            # Filter out empty Genius IDs and create lookup
-            stage_lookup = df_sch[df_sch['Genius Match ID'].notna() & (df_sch['Genius Match ID'] != '')].set_index('Genius Match ID')['Group'].to_dict()
-            
-            for match in raw_data:
-                # Convert match ID to float to match the lookup dict keys
-                try:
-                    match_id = float(match.get("MatchID", 0))
-                except (ValueError, TypeError):
-                    match_id = None
-                
-                # Lookup stage using Genius Match ID
-                if match_id and match_id in stage_lookup:
-                    stage = stage_lookup[match_id]
-                    
-                    if stage_filter == "Knockouts":
-                        if stage in knockout_stages:
-                            filtered_matches.append(match)
-                    else:  # Group Stage
-                        if stage not in knockout_stages and stage not in ["LKO Final"]:
-                            filtered_matches.append(match)
-                else:
-                    # If not found in schedule, default to Group Stage
-                    if stage_filter == "Group Stage":
-                        filtered_matches.append(match)
-        
-        raw_data_filtered = filtered_matches if filtered_matches else raw_data
+        filtered_matches = ft.select_match_ids(player_games, category=cat_sel, knockout=(stage_filter == "Knockouts"))
+        raw_data_filtered = filtered_matches if len(filtered_matches) else raw_data
     else:
         raw_data_filtered = raw_data
     
     # Aggregate all daily stats with period filter
-    df_all_perfs = ant.get_daily_stats(raw_data_filtered, period=period_sel)
+    df_all_perfs = ant.get_daily_stats(raw_data_filtered, period=period_sel, player_games=player_games, period_cube=period_cube)
     
     if df_all_perfs.empty:
         if period_sel != "Full Game":
@@ -1845,6 +1339,11 @@ elif st.session_state.active_tab == "TOP PERFORMANCES":
         with c_date:
             sel_date = st.selectbox("Filter by Date (Optional)", ["Whole Tournament"] + dates)
         
+        # Single-game highs per date, indexed once per data version and period
+        perf_key = (dm.data_key(raw_data_filtered, category=cat_filter, stage=stage_filter), period_sel)
+        board = lb.leaderboard(df_all_perfs, ("top_perf", perf_key), group_col="Date")
+        date_group = None if sel_date == "Whole Tournament" else sel_date
+
         # Apply date filter and determine if we should show dates in cards
         if sel_date != "Whole Tournament":
             df_view = df_all_perfs[df_all_perfs['Date'] == sel_date].copy()
@@ -1868,26 +1367,26 @@ elif st.session_state.active_tab == "TOP PERFORMANCES":
                 # Top Highs Grid (2x3)
                 r1_c1, r1_c2, r1_c3 = st.columns(3)
                 with r1_c1:
-                    ec.create_leader_board(df_view, "PTS", "Single Game Points", top_n=5, show_date=show_date_in_cards)
+                    ec.create_leader_board(board.top("PTS", 5, date_group), "PTS", "Single Game Points", top_n=5, show_date=show_date_in_cards)
                 with r1_c2:
-                    if "REB" in df_view.columns:
-                        ec.create_leader_board(df_view, "REB", "Single Game Boards", top_n=5, show_date=show_date_in_cards)
+                    if "REB" in board:
+                        ec.create_leader_board(board.top("REB", 5, date_group), "REB", "Single Game Boards", top_n=5, show_date=show_date_in_cards)
                 with r1_c3:
-                    if "AST" in df_view.columns:
-                        ec.create_leader_board(df_view, "AST", "Single Game Assists", top_n=5, show_date=show_date_in_cards)
+                    if "AST" in board:
+                        ec.create_leader_board(board.top("AST", 5, date_group), "AST", "Single Game Assists", top_n=5, show_date=show_date_in_cards)
                 
                 st.markdown("<div style='height: 10px;'></div>", unsafe_allow_html=True)
                 
                 r2_c1, r2_c2, r2_c3 = st.columns(3)
                 with r2_c1:
-                    if "STL" in df_view.columns:
-                        ec.create_leader_board(df_view, "STL", "Single Game Steals", top_n=5, show_date=show_date_in_cards)
+                    if "STL" in board:
+                        ec.create_leader_board(board.top("STL", 5, date_group), "STL", "Single Game Steals", top_n=5, show_date=show_date_in_cards)
                 with r2_c2:
-                    if "BLK" in df_view.columns:
-                        ec.create_leader_board(df_view, "BLK", "Single Game Blocks", top_n=5, show_date=show_date_in_cards)
+                    if "BLK" in board:
+                        ec.create_leader_board(board.top("BLK", 5, date_group), "BLK", "Single Game Blocks", top_n=5, show_date=show_date_in_cards)
                 with r2_c3:
-                    if "GmScr" in df_view.columns:
-                        ec.create_leader_board(df_view, "GmScr", "Impact (GmScr)", top_n=5, show_date=show_date_in_cards)
+                    if "GmScr" in board:
+                        ec.create_leader_board(board.top("GmScr", 5, date_group), "GmScr", "Impact (GmScr)", top_n=5, show_date=show_date_in_cards)
 
             # TAB 2: STANDARD STATS (Table)
             with tab_std:
@@ -1912,13 +1411,8 @@ elif st.session_state.active_tab == "TOP PERFORMANCES":
                 # Apply universal rounding (totals mode for box scores)
                 df_std = ant.apply_stat_rounding(df_std, mode="totals")
                 
-                # Apply styling to highlight max values
-                def highlight_max(s):
-                    """Highlight the maximum in a Series."""
-                    if s.name in ["PTS", "REB", "AST", "STL", "BLK", "FGM", "3PM", "FTM"]:
-                        is_max = s == s.max()
-                        return ['background-color: rgba(255, 133, 51, 0.3); font-weight: bold' if v else '' for v in is_max]
-                    return ['' for _ in s]
+                # Highlight the column leaders
+                highlight = {c: "max" for c in ["PTS", "REB", "AST", "STL", "BLK", "FGM", "3PM", "FTM"]}
                 
                 # Create format dict for percentage columns
                 pct_cols = ["FG%", "3P%", "FT%", "Min", "GmScr"]
@@ -1927,15 +1421,9 @@ elif st.session_state.active_tab == "TOP PERFORMANCES":
                     if col in df_std.columns:
                         format_dict[col] = "{:.1f}"
                 
-                styled_df = df_std.style.apply(highlight_max).format(format_dict, na_rep="-")
-                
-                # Display dataframe without selection
-                st.dataframe(
-                    styled_df,
-                    use_container_width=True,
-                    hide_index=True,
-                    height=600
-                )
+                # Cached display table; re-sorting reuses its formatted text
+                dsp.render_table(tbl.display_table(df_std, format_dict, highlight), key="top_perf_std",
+                                 sortable=list(df_std.select_dtypes("number").columns), height=600)
 
             # TAB 3: ADVANCED STATS (Table)
             with tab_adv:
@@ -1960,13 +1448,8 @@ elif st.session_state.active_tab == "TOP PERFORMANCES":
                 # Apply universal rounding (totals mode for box scores)
                 df_adv = ant.apply_stat_rounding(df_adv, mode="totals")
                 
-                # Apply styling to highlight max values
-                def highlight_max(s):
-                    """Highlight the maximum in a Series."""
-                    if s.name in ["PIE", "OFFRTG", "NETRTG", "TS%", "eFG%"]:
-                        is_max = s == s.max()
-                        return ['background-color: rgba(255, 133, 51, 0.3); font-weight: bold' if v else '' for v in is_max]
-                    return ['' for _ in s]
+                # Highlight the column leaders
+                highlight = {c: "max" for c in ["PIE", "OFFRTG", "NETRTG", "TS%", "eFG%"]}
                 
                 # Create format dict for numeric columns
                 numeric_cols = ["OFFRTG", "DEFRTG", "NETRTG", "AST%", "AST/TO", "AST RATIO", "OREB%", "DREB%", "REB%", 
@@ -1976,15 +1459,9 @@ elif st.session_state.active_tab == "TOP PERFORMANCES":
                     if col in df_adv.columns:
                         format_dict[col] = "{:.1f}"
                 
-                styled_df = df_adv.style.apply(highlight_max).format(format_dict, na_rep="-")
-                
-                # Display dataframe without selection
-                st.dataframe(
-                    styled_df,
-                    use_container_width=True,
-                    hide_index=True,
-                    height=600
-                )
+                # Cached display table; re-sorting reuses its formatted text
+                dsp.render_table(tbl.display_table(df_adv, format_dict, highlight), key="top_perf_adv",
+                                 sortable=list(df_adv.select_dtypes("number").columns), height=600)
 
             # TAB 4: USG (Table)
             with tab_usg:
@@ -2172,7 +1649,8 @@ elif st.session_state.active_tab == "TOP PERFORMANCES":
 
 
 # --- TOURNAMENT STATS ---
-elif st.session_state.active_tab == "TOURNAMENT STATS":
+@section("TOURNAMENT STATS")
+def render_tournament_stats():
     # UI Header with Stats Mode and Period Controls
     st.markdown("<h3 style='font-family: \"Space Grotesk\", sans-serif; text-transform: uppercase; letter-spacing: 0.1em; margin-bottom: 16px;'>Tournament Statistics</h3>", unsafe_allow_html=True)
     
@@ -2185,63 +1663,10 @@ elif st.session_state.active_tab == "TOURNAMENT STATS":
         entity_type = st.radio("Entity", ["Players", "Teams"], horizontal=True)
         period_sel = st.radio("Time Segment", ["Full Game", "Q1", "Q2", "Q3", "Q4", "1st Half", "2nd Half"], horizontal=True, index=0)
     
-    # Apply stage filter to raw_data
+    # Apply stage filter (Knockout flag from the stage classifier)
     if stage_filter != "All Games":
-        knockout_stages = ["Quarterfinal", "Semifinal", "Final", "PQF", "QF", "SF"]
-        
-        # Load categorization map (Source of Truth)
-        cat_map = dm.load_category_map()
-        league_ids = set(cat_map.get("league_stage", []))
-        knockout_ids = set(cat_map.get("knockouts", []))
-        
-        # Hardcoded fix for ID "31" (Services-Karnataka) -> Is League
-        league_ids.add("31")
-        league_ids.add("2797633")
-
-        filtered_matches = []
-        for match in raw_data:
-            match_id = str(match.get("MatchID", ""))
-            
-            # 1. Check Explicit Categorization First
-            if stage_filter == "Knockouts":
-                if match_id in knockout_ids:
-                    filtered_matches.append(match)
-            else: # Group Stage
-                if match_id in league_ids:
-                    filtered_matches.append(match)
-                elif match_id not in knockout_ids:
-                    # Fallback Logic: Only include if explicitly NOT knockout
-                    # And maybe check schedule CSV for "Group" column as backup?
-                    # For now, if it's not in knockouts list, and not explicitly League,
-                    # We risk including it. But we just patched the JSON to include ALL games.
-                    # So unknowns effectively don't exist if our patch was good.
-                    # However, to be safe, if it's NOT in Knockouts, we typically assume Group.
-                    # BUT "Placing" games might not be in either if we missed some.
-                    # Given we patched 56/56 games, this safe.
-                    pass
-        
-        # Double check fallback for safety if categorization failed
-        if not filtered_matches and not cat_map:
-             # Fallback to old schedule logic if JSON load failed
-             df_sch = dm.load_schedule()
-             stage_lookup = df_sch[df_sch['Genius Match ID'].notna() & (df_sch['Genius Match ID'] != '')].set_index('Genius Match ID')['Group'].to_dict()
-             
-             for match in raw_data:
-                try:
-                    mid_f = float(match.get("MatchID", 0))
-                except: mid_f = 0
-                
-                # Check schedule
-                if mid_f in stage_lookup:
-                    stg = stage_lookup[mid_f]
-                    if stage_filter == "Knockouts" and stg in knockout_stages:
-                        filtered_matches.append(match)
-                    elif stage_filter == "Group Stage" and stg not in knockout_stages:
-                        filtered_matches.append(match)
-                elif stage_filter == "Group Stage":
-                    filtered_matches.append(match)
-        
-        raw_data_filtered = filtered_matches if filtered_matches else raw_data
+        filtered_matches = ft.select_match_ids(player_games, category=cat_sel, knockout=(stage_filter == "Knockouts"))
+        raw_data_filtered = filtered_matches if len(filtered_matches) else raw_data
     else:
         raw_data_filtered = raw_data
         
@@ -2253,8 +1678,9 @@ elif st.session_state.active_tab == "TOURNAMENT STATS":
 
     # --- AGGREGATION ---
     # --- AGGREGATION ---
-    df_p_all, _ = MetricsEngine.get_tournament_stats(raw_data_filtered, period=period_sel, entity_type="Players")
-    _, df_t_all = MetricsEngine.get_tournament_stats(raw_data_filtered, period=period_sel, entity_type="Teams")
+    filtered_key = dm.data_key(raw_data_filtered, category=cat_filter, stage=stage_filter)
+    df_p_all, df_t_all, _ = MetricsEngine.get_tournament_stats_all(raw_data_filtered, period=period_sel, _player_games=player_games,
+                                                                  _period_cube=period_cube, data_key=filtered_key)
     
     if df_p_all.empty:
         st.warning("No matched processed yet.")
@@ -2338,34 +1764,35 @@ elif st.session_state.active_tab == "TOURNAMENT STATS":
                 
                 # Filter for Leaders (Min 3 Games)
                 # This ensures players with 1-2 good games don't skew the top lists
-                df_leaders = df_display.copy()
+                df_leaders = df_display
                 if "GP" in df_leaders.columns:
                     df_leaders = df_leaders[df_leaders["GP"] >= 3]
+                board = lb.leaderboard(df_leaders, ("tournament_stats", filtered_key, period_sel, stat_mode))
                 
                 # Row 1: Primary Stats
                 r1_c1, r1_c2, r1_c3 = st.columns(3)
                 with r1_c1:
-                    ec.create_leader_board(df_leaders, "PTS", "Scoring Leaders", top_n=5)
+                    ec.create_leader_board(board.top("PTS", 5), "PTS", "Scoring Leaders", top_n=5)
                 with r1_c2:
-                    if "REB" in df_leaders.columns:
-                        ec.create_leader_board(df_leaders, "REB", "Rebound Leaders", top_n=5)
+                    if "REB" in board:
+                        ec.create_leader_board(board.top("REB", 5), "REB", "Rebound Leaders", top_n=5)
                 with r1_c3:
-                    if "AST" in df_leaders.columns:
-                        ec.create_leader_board(df_leaders, "AST", "Assist Leaders", top_n=5)
+                    if "AST" in board:
+                        ec.create_leader_board(board.top("AST", 5), "AST", "Assist Leaders", top_n=5)
                 
                 st.markdown("<div style='height: 10px;'></div>", unsafe_allow_html=True)
                 
                 # Row 2: Secondary/Impact Stats
                 r2_c1, r2_c2, r2_c3 = st.columns(3)
                 with r2_c1:
-                    if "STL" in df_leaders.columns:
-                        ec.create_leader_board(df_leaders, "STL", "Steal Leaders", top_n=5)
+                    if "STL" in board:
+                        ec.create_leader_board(board.top("STL", 5), "STL", "Steal Leaders", top_n=5)
                 with r2_c2:
-                    if "BLK" in df_leaders.columns:
-                        ec.create_leader_board(df_leaders, "BLK", "Block Leaders", top_n=5)
+                    if "BLK" in board:
+                        ec.create_leader_board(board.top("BLK", 5), "BLK", "Block Leaders", top_n=5)
                 with r2_c3:
-                    if "GmScr" in df_leaders.columns:
-                        ec.create_leader_board(df_leaders, "GmScr", "Impact (GmScr)", top_n=5)
+                    if "GmScr" in board:
+                        ec.create_leader_board(board.top("GmScr", 5), "GmScr", "Impact (GmScr)", top_n=5)
             else:
                 st.info("Leader boards available for Players view only")
         
@@ -2403,13 +1830,8 @@ elif st.session_state.active_tab == "TOURNAMENT STATS":
                           "OREB", "DREB", "REB", "AST", "TOV", "STL", "BLK",
                           "PF", "FD", "DD2", "TD3"]
                           
-            # Apply styling to highlight max values
-            def highlight_max(s):
-                """Highlight the maximum in a Series."""
-                if s.name in count_cols: # Use predefined count_cols instead of hardcoded list
-                    is_max = s == s.max()
-                    return ['background-color: rgba(255, 133, 51, 0.3); font-weight: bold' if v else '' for v in is_max]
-                return ['' for _ in s]
+            # Highlight the column leaders
+            highlight = {c: "max" for c in count_cols}
             
             # Create format dict for percentage columns
             pct_cols = ["FG%", "3P%", "FT%", "eFG%", "TS%", "USG%", "AST%", 
@@ -2431,15 +1853,9 @@ elif st.session_state.active_tab == "TOURNAMENT STATS":
                     if col in df_std.columns and col != "+/-":  # +/- can be negative, keep as int
                         format_dict[col] = "{:.0f}"
             
-            styled_df = df_std.style.apply(highlight_max).format(format_dict, na_rep="-")
-            
-            # Display dataframe without selection
-            st.dataframe(
-                styled_df,
-                use_container_width=True,
-                hide_index=True,
-                height=600
-            )
+            # Cached display table; re-sorting reuses its formatted text
+            dsp.render_table(tbl.display_table(df_std, format_dict, highlight), key="ts_std",
+                             sortable=list(df_std.select_dtypes("number").columns), height=600)
             
         with ts2:
             # Use same detailed columns as Top Performance
@@ -2466,13 +1882,8 @@ elif st.session_state.active_tab == "TOURNAMENT STATS":
             # Apply universal rounding (use totals mode for advanced stats)
             df_adv = ant.apply_stat_rounding(df_adv, mode="totals")
             
-            # Apply styling to highlight max values
-            def highlight_max(s):
-                """Highlight the maximum in a Series."""
-                if s.name in ["PIE", "OFFRTG", "NETRTG", "TS%", "eFG%"]:
-                    is_max = s == s.max()
-                    return ['background-color: rgba(255, 133, 51, 0.3); font-weight: bold' if v else '' for v in is_max]
-                return ['' for _ in s]
+            # Highlight the column leaders
+            highlight = {c: "max" for c in ["PIE", "OFFRTG", "NETRTG", "TS%", "eFG%"]}
             
             # Create format dict for numeric columns
             format_dict = {}
@@ -2480,15 +1891,9 @@ elif st.session_state.active_tab == "TOURNAMENT STATS":
                 if col in df_adv.columns:
                     format_dict[col] = "{:.1f}"
             
-            styled_df = df_adv.style.apply(highlight_max).format(format_dict, na_rep="-")
-            
-            # Display dataframe without selection
-            st.dataframe(
-                styled_df,
-                use_container_width=True,
-                hide_index=True,
-                height=600
-            )
+            # Cached display table; re-sorting reuses its formatted text
+            dsp.render_table(tbl.display_table(df_adv, format_dict, highlight), key="ts_adv",
+                             sortable=list(df_adv.select_dtypes("number").columns), height=600)
         
         # TAB 4: USG (Table)
         with ts_usg:
@@ -2503,7 +1908,7 @@ elif st.session_state.active_tab == "TOURNAMENT STATS":
             if entity_type == "Players" and not df_usg_base.empty:
                 try:
                     # Use Centralized Metrics Engine
-                    df_usg, _ = MetricsEngine.get_tournament_stats(raw_data, period=period_sel, entity_type="Players")
+                    df_usg, _ = MetricsEngine.get_tournament_stats(raw_data, period=period_sel, entity_type="Players", _player_games=player_games, _period_cube=period_cube, data_key=raw_key)
                     
                     if not df_usg.empty:
                          # Filter to > 0 GP just in case
@@ -2615,7 +2020,8 @@ elif st.session_state.active_tab == "TOURNAMENT STATS":
 
 
 # --- BRACKET ---
-elif st.session_state.active_tab == "BRACKET":
+@section("BRACKET")
+def render_bracket():
     st.markdown("""
     <h2 style='text-align: center; margin-bottom: 24px; font-family: "Space Grotesk", sans-serif;'>TOURNAMENT BRACKET</h2>
     """, unsafe_allow_html=True)
@@ -2624,8 +2030,7 @@ elif st.session_state.active_tab == "BRACKET":
     b_gender = st.radio("Select Division", ["Men", "Women"], horizontal=True, key="bracket_gender")
     
     # Load Schedule for Bracket Data
-    df_sch_bracket = dm.load_schedule()
-    manual_scores_bracket = dm.load_manual_scores()
+    df_sch_bracket = store.fixtures
     
     if df_sch_bracket.empty:
         st.info("Schedule data not available for brackets.")
@@ -2668,29 +2073,11 @@ elif st.session_state.active_tab == "BRACKET":
             t1 = m_row['Team A']
             t2 = m_row['Team B']
             
-            # Check for score in Score column first (format: "54-88")
-            score_str = m_row.get('Score', '')
-            if score_str and score_str != '' and '-' in str(score_str):
-                try:
-                    parts = str(score_str).split('-')
-                    s1, s2 = parts[0].strip(), parts[1].strip()
-                except:
-                    s1, s2 = "-", "-"
+            # Score resolved in the fixtures table (stats > manual > Score column)
+            if pd.notna(m_row['ScoreSource']):
+                s1, s2 = int(m_row['S1']), int(m_row['S2'])
             else:
-                # Fallback to manual_scores dict
-                m_key = f"{t1.upper()}_VS_{t2.upper()}_{m_row['Gender'].upper()}"
-                m_score = manual_scores_bracket.get(m_key)
-                
-                if not m_score:
-                     # Try reverse key
-                     m_key_rev = f"{t2.upper()}_VS_{t1.upper()}_{m_row['Gender'].upper()}"
-                     m_score_rev = manual_scores_bracket.get(m_key_rev)
-                     if m_score_rev:
-                         m_score = {"s1": m_score_rev["s2"], "s2": m_score_rev["s1"]}
-                
-                s1 = m_score['s1'] if m_score else "-"
-                s2 = m_score['s2'] if m_score else "-"
-            
+                s1, s2 = "-", "-"
             
             winner = None
             if s1 != "-" and s2 != "-":
@@ -2940,9 +2327,10 @@ elif st.session_state.active_tab == "BRACKET":
                         """, unsafe_allow_html=True)
 
 # --- LEADERBOARDS ---
-elif st.session_state.active_tab == "LEADERBOARDS":
+@section("LEADERBOARDS")
+def render_leaderboards():
     # Get aggregated player data
-    df_p_all, _ = MetricsEngine.get_tournament_stats(raw_data, period="Full Game", entity_type="Players")
+    df_p_all, _ = MetricsEngine.get_tournament_stats(raw_data, period="Full Game", entity_type="Players", _player_games=player_games, data_key=raw_key)
     
     if df_p_all.empty:
         st.warning("No player data available.")
@@ -3254,13 +2642,14 @@ elif st.session_state.active_tab == "LEADERBOARDS":
 
 
 # --- PLAYER PROFILE ---
-elif st.session_state.active_tab == "PLAYER PROFILE":
+@section("PLAYER PROFILE")
+def render_player_profile():
     st.markdown("""
     <h2 style='text-align: center; margin-bottom: 24px; font-family: "Space Grotesk", sans-serif;'>PLAYER PROFILE</h2>
     """, unsafe_allow_html=True)
     
     # Get all player data
-    df_p_all, _ = MetricsEngine.get_tournament_stats(raw_data, period="Full Game", entity_type="Players")
+    df_p_all, _ = MetricsEngine.get_tournament_stats(raw_data, period="Full Game", entity_type="Players", _player_games=player_games, data_key=raw_key)
     
     if df_p_all.empty:
         st.warning("No player data available.")
@@ -3337,7 +2726,7 @@ elif st.session_state.active_tab == "PLAYER PROFILE":
     """, unsafe_allow_html=True)
     
     # === TABS FOR DIFFERENT VIEWS ===
-    tab_overview, tab_games, tab_splits = st.tabs(["📊 Season Stats", "🎯 Game Log", "📈 Splits & Advanced"])
+    tab_overview, tab_games, tab_splits, tab_similar = st.tabs(["📊 Season Stats", "🎯 Game Log", "📈 Splits & Advanced", "🧬 Similar Players"])
     
     # TAB 1: SEASON STATS
     with tab_overview:
@@ -3402,21 +2791,19 @@ elif st.session_state.active_tab == "PLAYER PROFILE":
     with tab_games:
         st.markdown("<h3 style='font-family: \"Space Grotesk\", sans-serif; margin-top: 20px;'>Game-by-Game Performance</h3>", unsafe_allow_html=True)
         
-        # Get individual game data
-        game_stats = ant.get_daily_stats(raw_data, period="Full Game")
+        # Only this player's rows of the shared game log (per-player row index on the store)
+        player_log = store.player_log(selected_player, category=cat_sel)
         
-        if not game_stats.empty:
-            player_games = game_stats[game_stats['Player'] == selected_player].copy()
-            
-            if not player_games.empty:
+        if not store.game_log.empty:
+            if not player_log.empty:
                 # Sort by date descending
-                player_games = player_games.sort_values('Date', ascending=False)
+                player_log = player_log.sort_values('Date', ascending=False)
                 
                 # Select key columns
                 display_cols = ['Date', 'Opponent', 'PTS', 'REB', 'AST', 'STL', 'BLK', 'TOV', 'FGM', 'FGA', 'FG%', '3PM', '3PA', 'FTM', 'FTA', 'FIC']
-                display_cols = [c for c in display_cols if c in player_games.columns]
+                display_cols = [c for c in display_cols if c in player_log.columns]
                 
-                player_games_display = player_games[display_cols].copy()
+                player_games_display = player_log[display_cols].copy()
                 
                 # Format percentages
                 if 'FG%' in player_games_display.columns:
@@ -3465,24 +2852,52 @@ elif st.session_state.active_tab == "PLAYER PROFILE":
                 ]
             })
             st.dataframe(play_df, use_container_width=True, hide_index=True)
+    
+    # TAB 4: SIMILAR PLAYERS
+    with tab_similar:
+        st.markdown("<h3 style='font-family: \"Space Grotesk\", sans-serif; margin-top: 20px;'>Players Like This One</h3>", unsafe_allow_html=True)
+        
+        # Standardized per-36 profile matrix, rebuilt only when the data version changes
+        sim_index = sim.similarity_index(df_p_all, data_key=raw_key)
+        pos = sim_index.position(selected_player, player_team)
+        
+        if pos is None:
+            st.info(f"Not enough minutes for a similarity profile (needs {sim.MIN_MINUTES:.0f}+ minutes)")
+        else:
+            c_metric, c_k, c_cat = st.columns([1, 1, 1])
+            with c_metric:
+                metric = st.radio("Measure", sim.METRICS, horizontal=True, key="pp_sim_metric", format_func=str.title)
+            with c_k:
+                k = st.slider("Players", 3, 20, 8, key="pp_sim_k")
+            with c_cat:
+                same_cat = st.toggle("Same category only", value=True, key="pp_sim_same_cat")
+            
+            similar_df = sim_index.neighbours(pos, k=k, metric=metric, same_category=same_cat)
+            if similar_df.empty:
+                st.info("No comparable players found")
+            else:
+                mpg = (similar_df.pop("MIN_CALC") / similar_df["GP"]).round(1)
+                similar_df.insert(similar_df.columns.get_loc("GP") + 1, "MPG", mpg)
+                st.dataframe(similar_df, use_container_width=True, hide_index=True)
+                st.caption(f"Compared on {', '.join(sim_index.stats)} (per 36 minutes for counting stats), "
+                           f"standardized across players with {sim.MIN_MINUTES:.0f}+ minutes.")
 
 
 # --- PLAYER COMPARISON ---
-elif st.session_state.active_tab == "COMPARISON":
+# Radars and the head-to-head table read the cached percentile matrix, so the
+# selection size barely matters; 8 keeps the radar legible
+MAX_COMPARE_PLAYERS = 8
+
+@section("COMPARISON")
+def render_comparison():
     st.header("Player Comparison")
     
     # Get aggregated player data
-    df_p_all_comp, _ = MetricsEngine.get_tournament_stats(raw_data, period="Full Game", entity_type="Players")
+    df_p_all_comp, _ = MetricsEngine.get_tournament_stats(raw_data, period="Full Game", entity_type="Players", _player_games=player_games, data_key=raw_key)
     
     if df_p_all_comp.empty:
         st.warning("No player data available.")
         st.stop()
-        
-    # Ensure Advanced Metrics
-    df_p_all_comp = ant.calculate_derived_stats(df_p_all_comp)
-    
-    # Filter out players with 0 games played
-    df_p_all_comp = df_p_all_comp[df_p_all_comp['GP'] > 0].copy()
     
     # --- STAT CATEGORY SELECTOR ---
     st.markdown("### Select Stats to Compare")
@@ -3501,6 +2916,12 @@ elif st.session_state.active_tab == "COMPARISON":
     for category_stats in stat_categories.values():
         all_available_stats.extend(category_stats)
     
+    # Derived stats (GP > 0) with per-game units, percentiles and z-scores for every
+    # player x stat, cached per data version and minutes qualifier (src.core.percentiles)
+    min_mpg = float(st.session_state.get("comp_min_mpg") or 0.0)
+    df_p_all_comp, comp_units, comp_pct, _ = pm.comparison_matrix(df_p_all_comp, data_key=raw_key,
+                                                                 stats=tuple(all_available_stats), min_mpg=min_mpg)
+    
     # Filter to only stats that exist in the dataframe
     available_stats = [stat for stat in all_available_stats if stat in df_p_all_comp.columns]
     
@@ -3579,52 +3000,30 @@ elif st.session_state.active_tab == "COMPARISON":
     
     # Multi-Select Players
     all_p_names = sorted(df_p_all_comp['Player'].unique())
-    comp_players = st.multiselect("Select Players to Compare (Max 4)", all_p_names, max_selections=4)
+    c_players, c_pool = st.columns([3, 1])
+    with c_players:
+        comp_players = st.multiselect(f"Select Players to Compare (Max {MAX_COMPARE_PLAYERS})", all_p_names, max_selections=MAX_COMPARE_PLAYERS)
+    with c_pool:
+        st.number_input("Percentile pool: min MPG", min_value=0.0, max_value=40.0, step=1.0, key="comp_min_mpg",
+                        help="Percentiles rank each player against the players of the same category averaging at least this many minutes")
+    radar_scale = st.radio("Radar scale", ["Percentile", "Relative"], horizontal=True, key="comp_radar_scale",
+                           help="Percentile: rank within the category pool (100 = best). Relative: scaled to the selected players.")
     
     if comp_players:
-        comp_df = df_p_all_comp[df_p_all_comp['Player'].isin(comp_players)].copy()
+        comp_df = df_p_all_comp[df_p_all_comp['Player'].isin(comp_players)]
+        sel = comp_df.index
         
         # Radar Chart
         import plotly.graph_objects as go
         
-        # --- DYNAMIC METRIC CONFIGURATION ---
-        # Determine appropriate max values for selected stats
-        metric_configs = {}
-        
-        # Stats that are percentages (max = 100)
-        percentage_stats = ["FG%", "2P%", "3P%", "FT%", "eFG%", "TS%", "AST%", "USG%"]
-        
         # Stats that should use per-game values
-        per_game_stats = ["PTS", "REB", "OREB", "DREB", "AST", "STL", "BLK", "TOV", "PF", 
-                         "FGM", "FGA", "2PM", "2PA", "3PM", "3PA", "FTM", "FTA",
-                         "FIC", "GmScr", "+/-"]
+        per_game_stats = pm.PER_GAME_STATS
         
-        for stat in selected_stats:
-            if stat in percentage_stats:
-                # Percentages: max = 100
-                metric_configs[stat] = {"max": 100, "label": stat}
-            elif stat in ["OFFRTG", "DEFRTG", "NETRTG"]:
-                # Ratings: use dynamic max (1.5x highest value)
-                max_val = 0
-                for _, row in comp_df.iterrows():
-                    val = row.get(stat, 0)
-                    max_val = max(max_val, abs(val))
-                metric_configs[stat] = {"max": max(max_val * 1.5, 10), "label": stat}
-            elif stat in per_game_stats:
-                # Per-game stats: calculate from totals, use dynamic max
-                max_val = 0
-                for _, row in comp_df.iterrows():
-                    gp = row.get('GP', 1)
-                    val = row.get(stat, 0) / gp if gp > 0 else 0
-                    max_val = max(max_val, val)
-                metric_configs[stat] = {"max": max(max_val * 1.5, 1), "label": stat}
-            else:
-                # Other advanced stats: use dynamic max
-                max_val = 0
-                for _, row in comp_df.iterrows():
-                    val = row.get(stat, 0)
-                    max_val = max(max_val, abs(val))
-                metric_configs[stat] = {"max": max(max_val * 1.5, 10), "label": stat}
+        # Pre-normalized radar values: percentile ranks, or the selection-relative scale
+        if radar_scale == "Percentile":
+            radar_vals = comp_pct.loc[sel, selected_stats]
+        else:
+            radar_vals = pm.relative_scale(comp_units.loc[sel], selected_stats)
         
         fig = go.Figure()
         
@@ -3633,38 +3032,21 @@ elif st.session_state.active_tab == "COMPARISON":
             '#d16b07',  # Tappa Orange (Player 1)
             '#3b82f6',  # Blue (Player 2)
             '#10b981',  # Green (Player 3)
-            '#8b5cf6'   # Purple (Player 4)
+            '#8b5cf6',  # Purple (Player 4)
+            '#ef4444',  # Red (Player 5)
+            '#eab308',  # Yellow (Player 6)
+            '#06b6d4',  # Cyan (Player 7)
+            '#ec4899'   # Pink (Player 8)
         ]
         
-        # Collect all values to find actual max for dynamic scaling
-        all_normalized_values = []
-        
-        for idx, (i, row) in enumerate(comp_df.iterrows()):
-            gp = row['GP']
-            if gp == 0:
-                continue
-            
-            # Calculate raw values dynamically based on selected stats
-            raw_values = {}
-            for stat in selected_stats:
-                if stat in per_game_stats:
-                    # Convert totals to per-game
-                    raw_values[stat] = row.get(stat, 0) / gp if gp > 0 else 0
-                else:
-                    # Use raw value (percentages, ratings, etc.)
-                    raw_values[stat] = row.get(stat, 0)
-            
-            # Normalize to 0-100 scale based on expected max
-            normalized_vals = []
-            for metric, config in metric_configs.items():
-                normalized = (raw_values[metric] / config["max"]) * 100
-                normalized_vals.append(normalized)
-            
-            all_normalized_values.extend(normalized_vals)
-            
+        closed_theta = list(selected_stats) + [selected_stats[0]]
+        for idx, i in enumerate(sel):
             # Close the polygon by repeating first value
+            normalized_vals = radar_vals.loc[i].fillna(0).tolist()
             closed_vals = normalized_vals + [normalized_vals[0]]
-            closed_theta = [config["label"] for config in metric_configs.values()] + [list(metric_configs.values())[0]["label"]]
+            hover = np.column_stack([comp_units.loc[i, selected_stats].to_numpy(dtype=float),
+                                     comp_pct.loc[i, selected_stats].to_numpy(dtype=float)])
+            hover = np.vstack([hover, hover[:1]])
             
             # Get color for this player
             color = colors[idx % len(colors)]
@@ -3672,19 +3054,20 @@ elif st.session_state.active_tab == "COMPARISON":
             fig.add_trace(go.Scatterpolar(
                 r=closed_vals,
                 theta=closed_theta,
+                customdata=hover,
                 fill='toself',
-                name=row['Player'],
+                name=comp_df.at[i, 'Player'],
                 line=dict(color=color, width=2),
                 fillcolor=f'rgba({int(color[1:3], 16)}, {int(color[3:5], 16)}, {int(color[5:7], 16)}, 0.25)',
-                hovertemplate='<b>%{theta}</b><br>%{r:.1f}<extra></extra>'
+                hovertemplate='<b>%{theta}</b><br>%{customdata[0]:.1f} (P%{customdata[1]:.0f})<extra></extra>'
             ))
         
-        # Calculate dynamic max with padding (so it doesn't fill to 100%)
-        if all_normalized_values:
-            data_max = max(all_normalized_values)
-            chart_max = data_max * 1.25  # Add 25% padding
-        else:
+        # Percentiles use the full 0-100 axis; the relative scale gets 25% padding
+        if radar_scale == "Percentile":
             chart_max = 100
+        else:
+            data_max = float(radar_vals.to_numpy().max()) if radar_vals.size else 0
+            chart_max = data_max * 1.25 if data_max > 0 else 100
         
         # Update layout with Tappa styling
         fig.update_layout(
@@ -3825,6 +3208,7 @@ elif st.session_state.active_tab == "COMPARISON":
             
             # Get values for all players
             values = []
+            badges = []
             for idx, (i, row) in enumerate(comp_df.iterrows()):
                 if stat_key == "GP":
                     val = int(row.get(stat_key, 0))
@@ -3837,6 +3221,10 @@ elif st.session_state.active_tab == "COMPARISON":
                     # Percentage stats and other advanced metrics
                     val = row.get(stat_key, 0)
                     values.append((val, True))
+                # Percentile within the category pool, from the cached matrix
+                p_rank = comp_pct.at[i, stat_key] if stat_key in comp_pct.columns else np.nan
+                badges.append("" if pd.isna(p_rank) else
+                              f'<div style="font-size: 0.7rem; color: var(--text-secondary); font-weight: 600;">P{p_rank:.0f}</div>')
             
             # Find min/max for color coding (only for numeric values)
             numeric_values = [v[0] for v in values if v[1] and isinstance(v[0], (int, float))]
@@ -3874,14 +3262,14 @@ elif st.session_state.active_tab == "COMPARISON":
                             display_val = f"{float(val):.1f}"
                             
                         # Highlight best performer with their color
-                        table_html += f'<td style="background: rgba({r}, {g}, {b}, 0.7); font-weight: 700; border: 2px solid {color}; font-family: \'Outfit\', sans-serif;">{display_val}</td>'
+                        table_html += f'<td style="background: rgba({r}, {g}, {b}, 0.7); font-weight: 700; border: 2px solid {color}; font-family: \'Outfit\', sans-serif;">{display_val}{badges[idx]}</td>'
                     else:
                         # Normal background for others
                         if stat_key == "GP":
                             display_val = f"{int(val)}"
                         else:
                             display_val = f"{float(val):.1f}"
-                        table_html += f'<td style="font-weight: 500; font-family: \'Outfit\', sans-serif;">{display_val}</td>'
+                        table_html += f'<td style="font-weight: 500; font-family: \'Outfit\', sans-serif;">{display_val}{badges[idx]}</td>'
             
             table_html += '</tr>'
         
@@ -3893,6 +3281,9 @@ elif st.session_state.active_tab == "COMPARISON":
         st.info("Select players to compare using the dropdown above.")
 
 
+if st.session_state.active_tab in SECTIONS:
+    SECTIONS[st.session_state.active_tab]()
+
 # --- FOOTER ---
 st.divider()
 st.markdown("""<div style='text-align: center; margin-top: 32px; padding: 24px;'>
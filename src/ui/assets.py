@@ -0,0 +1,51 @@
+"""Image assets served from memory: each file is read and base64-encoded once.
+
+Assets are inlined into st.markdown HTML as data URIs. ``data_uri`` keeps
+the encoded form per (path, mtime, size), so a rerun costs one ``os.stat``
+per image and a changed file is picked up without a restart. Logos that
+ship with the code (``INLINE``) are encoded already.
+"""
+import base64
+import mimetypes
+import os
+
+ASSET_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "web", "assets")
+TAPPA_LOGO = os.path.join(ASSET_DIR, "tappa", "logo.svg")
+KEV_LOGO = os.path.join(ASSET_DIR, "tappa", "thekev circ.png")
+
+mimetypes.add_type("image/svg+xml", ".svg")
+mimetypes.add_type("image/webp", ".webp")
+
+_uri_memo = {}
+
+# NoLookNation logo (SVG), shipped with the code
+NNI_LOGO_B64 = "PHN2ZyBpZD0iTGF5ZXJfMSIgZGF0YS1uYW1lPSJMYXllciAxIiB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHZpZXdCb3g9IjAgMCA2NDkuODQgNzkwLjM1Ij48ZGVmcz48c3R5bGU+LmNscy0xe2ZpbGw6I2ZmZjt9LmNscy0ye2ZpbGw6IzM3MzczNzt9PC9zdHlsZT48L2RlZnM+PHBhdGggY2xhc3M9ImNscy0xIiBkPSJNNDMyLjUyLDQ4My40M2MtMS42OC0xMS43OS40My0yMi4wOCwxLjA2LTMyLjQsMi4wNy0zNC4xMy44Ny02OC4zNSwzLjg2LTEwMi40OCwzLjM3LTM4LjM0LjY4LTc3LDUtMTE1LjMzLDEuMjQtMTEuMDguMy0xMS40OS0xMC44LTExLjVxLTU0LDAtMTA3LjkzLDBhNDYuMjIsNDYuMjIsMCwwLDAtNi43My41OSw0LDQsMCwwLDAtMy43NCwzLjM0Yy0yLjg4LDEzLjYyLTUuNzEsMjcuMjYtOC43OSw0MC44NC0yLDktNC41NSwxNy44Ni02LjcxLDI2LjgyLTIsOC4yOS00LjczLDE2LjU1LTUuNDgsMjVzLTQuMTgsMTYuMzktNi40OCwyNC4xNmMtMi44Nyw5LjcxLTMuODgsMTkuNjMtNS45NSwyOS4zMi0xLjczLDguMTEtNC40OSwxNi4xMy02LjM4LDI0LjA5LTEuOTIsOC4xMS0zLjIxLDE2Ljg3LTUuNjEsMjUuMDgtMy4zNiwxMS41LTYuMTIsMjMuNDgtOC43MiwzNS4zNC0yLjg2LDEzLTUuNzEsMjYtOSwzOS0zLjEsMTItNS4zMiwyNC4xOC04LjI4LDM2LjIzLTIuODIsMTEuNTItNiwyMy4wOS04LjA5LDM0LjY0LTIuMjYsMTIuNjUtNi4xNSwyNC44Mi04LjMxLDM3LjMxLTEuNjgsOS42OS02LDE4Ljg1LTUuNzMsMjguODksMCwxLjI5LS43NCwyLjU4LTEuMDYsMy44OS0yLjQxLDkuOTEtNS4zNiwxOS43My03LDI5Ljc3YTE4NS4zNiwxODUuMzYsMCwwLDEtNS42OSwyNGMtMi40OCw4LTQuMSwxNi41Ny01LjgzLDI0LjQ4LTIsOS4zMi02Ljg5LDE4LjUyLTUuNTcsMjguNmEzLDMsMCwwLDEtLjU1LDEuOTNjLTUuMjcsNy40LTQuNSwxNi42NC02LjM2LDI0LjgzLTIuMDgsOS4xOC02LjQ2LDE4LjE5LTUuNjcsMjhhNC4zNSw0LjM1LDAsMCwxLS41MywxLjk0Yy00LjQyLDkuODItNC45MiwyMC42NS03Ljg5LDMwLjg2LTEuNzEsNS44Ni42Niw4LjMxLDcuMzMsOC4yNSwzNC44NC0uMzIsNjkuNjktLjE0LDEwNC41NC0uMThhMzQuNDcsMzQuNDcsMCwwLDAsNy4zOS0uNjhjMS4yMS0uMjcsMi41NS0uNTQsMi45MS0yLjgxLDEuNzctMTEuMTYsNS40LTIyLjA1LDcuNTEtMzMsMi41OS0xMy4zOCw2LjE2LTI2LjUyLDguODItMzkuODYsMi4yNi0xMS4zOSw1LjA1LTIyLjY3LDcuNjQtMzQsMS45LTguMzMsMy44Ni0xNi42NCw1Ljc3LTI1LDIuMTEtOS4xOSwzLjkxLTE4LjQ2LDYuMzktMjcuNTUsMi03LjI0LDQuMzItMTQuNzgsNS4yNi0yMS44MywxLjM4LTEwLjI5LDQuMzctMjAuMiw2LjE1LTMwLjMsMi0xMS4xNSw2LTIyLjA3LDcuNTYtMzMuNDUuMTUtMS4xMiwwLTIuNC40My0zLjM0LDQuOTQtOS44Miw0LjU4LTIwLjk0LDcuNzYtMzEuMTguNzktMi41Ny0uODUtNy41NCwyLjMzLTcuMjksMy43NC4zLDIuMTYsNS4yMSwyLjE3LDguMDkuMDYsMjQuNjktMi42Niw0OS4zMS0yLjksNzMuOTQtLjYxLDYzLjQxLTQuODQsMTI2LjctNS41MSwxOTAuMSwwLDQuMS0uMTMsOC4yLTIuNDYsMTEuNzYtMi40NCwzLjc0LS42Niw1LjM1LDIuODgsNS45NGE0MS4wNiw0MS4wNiwwLDAsMCw2Ljc1LjM4cTUxLjU4LDAsMTAzLjE4LDBjMTEuNSwwLDEzLjMzLTEuNTEsMTQuNi0xMy40LDEuMTctMTEsNC41OC0yMS41NSw2LjU5LTMyLjM5LDIuMTMtMTEuNTEsNi45My0yMi41NCw3LjY0LTM0LjQ3YTEzLjMyLDEzLjMyLDAsMCwxLDEuMTktNC41OGM1LjMxLTExLjg3LDYuNzktMjQuOTQsMTAtMzcuMywzLjA2LTExLjgzLDYuMjktMjQsOC4zMS0zNiwyLjE3LTEzLDQuNjctMjUuNzgsOC42OC0zOC4yMiwxLjkzLTYtLjE3LTEyLjM4LDMuMTctMTguMTQsMy44My02LjYzLDMuODMtMTQuNjYsNS4zNC0yMS44NCwxLjg3LTguODksNy4xLTE3LjM4LDUuMzYtMjdhMS4yOCwxLjI4LDAsMCwxLC4xMS0uNjZjLjQ1LTEuMzEsMS0yLjY4LDIuNi0yLjcyLDIuMDcsMCwyLjU3LDEuNTQsMi43NCwzLjE3YTI1LjE1LDI1LjE1LDAsMCwxLC4wNiw0LjA3Yy0yLjE1LDM4LjY3LS42MSw3Ny40MS0zLjMzLDExNi4wOS0zLjE5LDQ1LjE3LTEsOTAuNTYtNC40MSwxMzUuNzUtLjQ0LDUuNzUsMS42LDcuNzMsNy4xMyw3LjcycTU0LS4xNSwxMDcuOTMsMGMzLjgzLDAsNS40Ny0xLjU3LDYuOTItNSwyLjQ3LTUuNzcsMi40Mi0xMiwzLjgzLTE3Ljg4LDQtMTYuNjksNy43MS0zMy40MywxMS41Ny01MC4xNHE1LTIxLjgsMTAuMS00My41N2MzLjYzLTE1LjYxLDcuMzQtMzEuMiwxMC45Mi00Ni44MywzLjMyLTE0LjUzLDYuMzktMjkuMTIsOS43OC00My42Myw0LjkyLTIxLjExLDEwLjE4LTQyLjEzLDE1LTYzLjI1LDQuOTEtMjEuMzUsOS4zNy00Mi44MSwxNC4yNy02NC4xNnMxMC4yNC00Mi42LDE1LjE2LTYzLjk0Uzc1NiwzOTcuNjQsNzYxLDM3Ni4yOWM2LjMxLTI3LjI3LDEzLTU0LjQ2LDE5LjI5LTgxLjc0LDQuOTMtMjEuMzQsOS40NS00Mi43OCwxNC4yNy02NC4xNSwxLjc0LTcuNzEsMS40Ny04LjI5LTYuNzItOC4zMS0xNi41Mi0uMDUtMzMsMC00OS41NiwwSDY4NS4zMmMtNCwwLTguMjEuMTgtOC44Niw1LjI1LS44Nyw2Ljc4LTMuMSwxMy4xOS00LjU5LDE5LjgtNC43OSwyMS4xNC05LjMxLDQyLjM0LTE0LjIxLDYzLjQ1LTYuMzEsMjcuMjctMTMsNTQuNDQtMTkuMzIsODEuNzEtNi4yNCwyNy4wNi0xMiw1NC4yMy0xOC4zMyw4MS4yNy0xLjQ5LDYuMzctMy40LDEyLjY0LTQuMzQsMTkuMTUtLjE5LDEuMjktLjQ5LDIuOTItMi4zLDIuNzhzLTEuOTMtMS42NS0yLjA3LTNhMjcuNDksMjcuNDksMCwwLDEtLjE3LTMuMzljLjY4LTI1LjU4LjgtNTEuMTksMi4yLTc2Ljc0LDMuMy02MC4xNCw0LjY5LTEyMC4zNSw3LjI1LTE4MC41Mi40NS0xMC40Ni0uMjQtMTAuODMtMTEuMDctMTAuODRsLTkwLjI5LDBjLTUuNjUsMC0xMS4zMSwwLTE3LDAtNSwuMDYtOC40NCwxLjctOS41Nyw3LjQxLTEuODMsOS4yOC00LjQ2LDE4LjQxLTYuNjIsMjcuNjNxLTUuNzMsMjQuNDEtMTEuMyw0OC44My01LDIxLjc4LTkuOTEsNDMuNTljLTMuNDUsMTUuNDItNi43NCwzMC44Ny0xMC4yNCw0Ni4yOC0zLjY1LDE2LjA3LTcuNjUsMzItMTEuMTQsNDguMTVDNDQwLjYsNDU2LjE2LDQzNi4zNSw0NjksNDMyLjUyLDQ4My40M1oiIHRyYW5zZm9ybT0idHJhbnNsYXRlKC0xNzIuOSAtNDguNTUpIi8+PHBhdGggY2xhc3M9ImNscy0xIiBkPSJNNjgzLjU1LDExOS4xN2MtNS4zOSwzNi42OSwzNC4yNSw3MC41OCw2My44NSw3MC4wNywyMC4yOC0uMzUsMzcuOTItNC4zNiw1Mi43OS0xNy45czIxLjg2LTMwLjcsMjIuNTItNTEuMDhjMS4yOC0zOS0zNC4wNS03MS40Ni03MC03MS43MUM3MTcuMzYsNDguMyw2NzguMzUsODIuNjQsNjgzLjU1LDExOS4xN1oiIHRyYW5zZm9ybT0idHJhbnNsYXRlKC0xNzIuOSAtNDguNTUpIi8+PHBhdGggY2xhc3M9ImNscy0yIiBkPSJNNDMyLjUyLDQ4My40M2MzLjgzLTE0LjM5LDguMDgtMjcuMjcsMTEtNDAuNTYsMy40OS0xNi4xLDcuNDktMzIuMDgsMTEuMTQtNDguMTUsMy41LTE1LjQxLDYuNzktMzAuODYsMTAuMjQtNDYuMjhxNC44OS0yMS44MSw5LjkxLTQzLjU5LDUuNi0yNC40MiwxMS4zLTQ4LjgzYzIuMTYtOS4yMiw0Ljc5LTE4LjM1LDYuNjItMjcuNjMsMS4xMy01LjcxLDQuNTUtNy4zNSw5LjU3LTcuNDEsNS42NS0uMDYsMTEuMzEsMCwxNywwbDkwLjI5LDBjMTAuODMsMCwxMS41Mi4zOCwxMS4wNywxMC44NC0yLjU2LDYwLjE3LTQsMTIwLjM4LTcuMjUsMTgwLjUyLTEuNCwyNS41NS0xLjUyLDUxLjE2LTIuMiw3Ni43NGEyNy40OSwyNy40OSwwLDAsMCwuMTcsMy4zOWMuMTQsMS4zNy4zNiwyLjg5LDIuMDcsM3MyLjExLTEuNDksMi4zLTIuNzhjLjk0LTYuNTEsMi44NS0xMi43OCw0LjM0LTE5LjE1LDYuMzItMjcsMTIuMDktNTQuMjEsMTguMzMtODEuMjcsNi4yOS0yNy4yNywxMy01NC40NCwxOS4zMi04MS43MSw0LjktMjEuMTEsOS40Mi00Mi4zMSwxNC4yMS02My40NSwxLjQ5LTYuNjEsMy43Mi0xMyw0LjU5LTE5LjguNjUtNS4wNyw0Ljg1LTUuMjUsOC44Ni01LjI1aDUyLjk0YzE2LjUyLDAsMzMsMCw0OS41NiwwLDguMTksMCw4LjQ2LjYsNi43Miw4LjMxLTQuODIsMjEuMzctOS4zNCw0Mi44MS0xNC4yNyw2NC4xNUM3NzQsMzIxLjgzLDc2Ny4yOSwzNDksNzYxLDM3Ni4yOWMtNC45NCwyMS4zNS05LjQzLDQyLjgtMTQuMzUsNjQuMTVTNzM2LjM4LDQ4Myw3MzEuNDcsNTA0LjM4cy05LjM2LDQyLjgxLTE0LjI3LDY0LjE2Yy00Ljg2LDIxLjEyLTEwLjEyLDQyLjE0LTE1LDYzLjI1LTMuMzksMTQuNTEtNi40NiwyOS4xLTkuNzgsNDMuNjMtMy41OCwxNS42My03LjI5LDMxLjIyLTEwLjkyLDQ2LjgzcS01LjA3LDIxLjc4LTEwLjEsNDMuNTdjLTMuODYsMTYuNzEtNy42LDMzLjQ1LTExLjU3LDUwLjE0LTEuNDEsNS45Mi0xLjM2LDEyLjExLTMuODMsMTcuODgtMS40NSwzLjM5LTMuMDksNS02LjkyLDVxLTU0LS4xNi0xMDcuOTMsMGMtNS41MywwLTcuNTctMi03LjEzLTcuNzIsMy40NS00NS4xOSwxLjIyLTkwLjU4LDQuNDEtMTM1Ljc1LDIuNzItMzguNjgsMS4xOC03Ny40MiwzLjMzLTExNi4wOWEyNS4xNSwyNS4xNSwwLDAsMC0uMDYtNC4wN2MtLjE3LTEuNjMtLjY3LTMuMjItMi43NC0zLjE3LTEuNjQsMC0yLjE1LDEuNDEtMi42LDIuNzJhMS4yOCwxLjI4LDAsMCwwLS4xMS42NmMxLjc0LDkuNjItMy40OSwxOC4xMS01LjM2LDI3LTEuNTEsNy4xOC0xLjUxLDE1LjIxLTUuMzQsMjEuODQtMy4zNCw1Ljc2LTEuMjQsMTIuMTQtMy4xNywxOC4xNC00LDEyLjQ0LTYuNTEsMjUuMjQtOC42OCwzOC4yMi0yLDEyLjA3LTUuMjUsMjQuMi04LjMxLDM2LTMuMiwxMi4zNi00LjY4LDI1LjQzLTEwLDM3LjNhMTMuMzIsMTMuMzIsMCwwLDAtMS4xOSw0LjU4Yy0uNzEsMTEuOTMtNS41MSwyMy03LjY0LDM0LjQ3LTIsMTAuODQtNS40MiwyMS4zOC02LjU5LDMyLjM5LTEuMjcsMTEuODktMy4xLDEzLjQtMTQuNiwxMy40cS01MS41OCwwLTEwMy4xOCwwYTQxLjA2LDQxLjA2LDAsMCwxLTYuNzUtLjM4Yy0zLjU0LS41OS01LjMyLTIuMi0yLjg4LTUuOTQsMi4zMy0zLjU2LDIuNDItNy42NiwyLjQ2LTExLjc2LjY3LTYzLjQsNC45LTEyNi42OSw1LjUxLTE5MC4xLjI0LTI0LjYzLDMtNDkuMjUsMi45LTczLjk0LDAtMi44OCwxLjU3LTcuNzktMi4xNy04LjA5LTMuMTgtLjI1LTEuNTQsNC43Mi0yLjMzLDcuMjktMy4xOCwxMC4yNC0yLjgyLDIxLjM2LTcuNzYsMzEuMTgtLjQ4Ljk0LS4yOCwyLjIyLS40MywzLjM0LTEuNTksMTEuMzgtNS41OSwyMi4zLTcuNTYsMzMuNDUtMS43OCwxMC4xLTQuNzcsMjAtNi4xNSwzMC4zLS45NCw3LTMuMjksMTQuNTktNS4yNiwyMS44My0yLjQ4LDkuMDktNC4yOCwxOC4zNi02LjM5LDI3LjU1LTEuOTEsOC4zMi0zLjg3LDE2LjYzLTUuNzcsMjUtMi41OSwxMS4zMi01LjM4LDIyLjYtNy42NCwzNC0yLjY2LDEzLjM0LTYuMjMsMjYuNDgtOC44MiwzOS44Ni0yLjExLDEwLjkxLTUuNzQsMjEuOC03LjUxLDMzLS4zNiwyLjI3LTEuNywyLjU0LTIuOTEsMi44MWEzNC40NywzNC40NywwLDAsMS03LjM5LjY4Yy0zNC44NSwwLTY5LjctLjE0LTEwNC41NC4xOC02LjY3LjA2LTktMi4zOS03LjMzLTguMjUsMy0xMC4yMSwzLjQ3LTIxLDcuODktMzAuODZhNC4zNSw0LjM1LDAsMCwwLC41My0xLjk0Yy0uNzktOS44NSwzLjU5LTE4Ljg2LDUuNjctMjgsMS44Ni04LjE5LDEuMDktMTcuNDMsNi4zNi0yNC44M2EzLDMsMCwwLDAsLjU1LTEuOTNDMTkzLjEyLDczMywxOTgsNzIzLjc2LDIwMCw3MTQuNDRjMS43My03LjkxLDMuMzUtMTYuNDUsNS44My0yNC40OGExODUuMzYsMTg1LjM2LDAsMCwwLDUuNjktMjRjMS42Ny0xMCw0LjYyLTE5Ljg2LDctMjkuNzcuMzItMS4zMSwxLjEtMi42LDEuMDYtMy44OS0uMjUtMTAsNC0xOS4yLDUuNzMtMjguODksMi4xNi0xMi40OSw2LjA1LTI0LjY2LDguMzEtMzcuMzEsMi4wNi0xMS41NSw1LjI3LTIzLjEyLDguMDktMzQuNjQsMy0xMiw1LjE4LTI0LjI2LDguMjgtMzYuMjMsMy4zNC0xMi45NCw2LjE5LTI1Ljk0LDktMzksMi42LTExLjg2LDUuMzYtMjMuODQsOC43Mi0zNS4zNCwyLjQtOC4yMSwzLjY5LTE3LDUuNjEtMjUuMDgsMS44OS04LDQuNjUtMTYsNi4zOC0yNC4wOSwyLjA3LTkuNjksMy4wOC0xOS42MSw1Ljk1LTI5LjMyLDIuMy03Ljc3LDUuNzMtMTUuNjMsNi40OC0yNC4xNnMzLjQ4LTE2LjY4LDUuNDgtMjVjMi4xNi05LDQuNjctMTcuODQsNi43MS0yNi44MiwzLjA4LTEzLjU4LDUuOTEtMjcuMjIsOC43OS00MC44NGE0LDQsMCwwLDEsMy43NC0zLjM0LDQ2LjIyLDQ2LjIyLDAsMCwxLDYuNzMtLjU5cTU0LS4wNiwxMDcuOTMsMGMxMS4xLDAsMTIsLjQyLDEwLjgsMTEuNS00LjI4LDM4LjM1LTEuNTksNzctNSwxMTUuMzMtMywzNC4xMy0xLjc5LDY4LjM1LTMuODYsMTAyLjQ4QzQzMyw0NjEuMzUsNDMwLjg0LDQ3MS42NCw0MzIuNTIsNDgzLjQzWiIgdHJhbnNmb3JtPSJ0cmFuc2xhdGUoLTE3Mi45IC00OC41NSkiLz48cGF0aCBjbGFzcz0iY2xzLTIiIGQ9Ik02ODMuNTUsMTE5LjE3Yy01LjItMzYuNTMsMzMuODEtNzAuODcsNjkuMTctNzAuNjIsMzUuOTQuMjUsNzEuMjcsMzIuNzIsNzAsNzEuNzEtLjY2LDIwLjM4LTcuNjEsMzcuNTEtMjIuNTIsNTEuMDhzLTMyLjUxLDE3LjU1LTUyLjc5LDE3LjlDNzE3LjgsMTg5Ljc1LDY3OC4xNiwxNTUuODYsNjgzLjU1LDExOS4xN1oiIHRyYW5zZm9ybT0idHJhbnNsYXRlKC0xNzIuOSAtNDguNTUpIi8+PC9zdmc+"
+
+
+def _encode(path):
+    mime = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    with open(path, "rb") as f:
+        return f"data:{mime};base64,{base64.b64encode(f.read()).decode()}"
+
+
+def data_uri(path):
+    """``data:`` URI for an image file, or "" if it does not exist."""
+    if not path:
+        return ""
+    try:
+        st_res = os.stat(path)
+    except OSError:
+        return ""
+    key = (path, st_res.st_mtime_ns, st_res.st_size)
+    uri = _uri_memo.get(key)
+    if uri is None:
+        # Drop the stale encoding of a file that changed on disk
+        for old in [k for k in _uri_memo if k[0] == path]:
+            del _uri_memo[old]
+        uri = _uri_memo[key] = _encode(path)
+    return uri
+
+
+INLINE = {
+    "nni": "data:image/svg+xml;base64," + NNI_LOGO_B64,
+}
@@ -0,0 +1,55 @@
+"""Stat tables as HTML: renders src.core.tables display tables.
+
+``render_table`` emits a display table's cached strings as one HTML block,
+with an optional sort control that only reorders them.
+"""
+import html
+
+import streamlit as st
+
+from src.core.tables import sort_table
+
+# The highlight styles the Styler tables used
+MAX_CSS = "background-color: rgba(255, 133, 51, 0.3); font-weight: bold"
+EXCEPTIONAL_CSS = "background-color: #1a472a; color: white; font-weight: bold"
+
+
+def table_html(table, highlight_css=MAX_CSS, height=600):
+    """One scrollable HTML table from a display_table result."""
+    _, text, mask = table
+    head = "".join(f"<th>{html.escape(str(col))}</th>" for col in text.columns)
+    cells = [
+        [f"<td style='{highlight_css}'>{html.escape(s)}</td>" if hit else f"<td>{html.escape(s)}</td>"
+         for s, hit in zip(text[col].tolist(), mask[col].tolist())]
+        for col in text.columns
+    ]
+    body = "".join(f"<tr>{''.join(row)}</tr>" for row in zip(*cells))
+    return (f"<div class='display-table' style='max-height: {height}px;'>"
+            f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table></div>")
+
+
+_TABLE_CSS = """<style>
+.display-table { overflow: auto; border: 1px solid rgba(255,255,255,0.1); border-radius: 8px; margin-bottom: 16px; }
+.display-table table { width: 100%; border-collapse: collapse; font-size: 0.85rem; }
+.display-table th { position: sticky; top: 0; background: #0f0f0f; color: #b0b0b0; font-weight: bold; text-align: center; vertical-align: middle; padding: 6px 10px; border-bottom: 1px solid #333; white-space: nowrap; }
+.display-table td { text-align: center; vertical-align: middle; padding: 4px 10px; border-bottom: 1px solid rgba(255,255,255,0.05); white-space: nowrap; }
+.display-table tr:hover td { background-color: #252525; }
+</style>"""
+
+
+def render_table(table, key, sortable=None, highlight_css=MAX_CSS, height=600):
+    """Render a display_table result, with a sort control over ``sortable`` columns.
+
+    The sort only reorders the cached text (see ``sort_table``).
+    """
+    values = table[0]
+    if sortable:
+        options = [c for c in sortable if c in values.columns]
+        c_sort, c_dir = st.columns([0.8, 0.2])
+        with c_sort:
+            by = st.selectbox("Sort by", ["Default"] + options, key=f"{key}_sort")
+        with c_dir:
+            ascending = st.toggle("Ascending", key=f"{key}_asc")
+        if by != "Default":
+            table = sort_table(table, by, ascending)
+    st.markdown(_TABLE_CSS + table_html(table, highlight_css, height), unsafe_allow_html=True)
@@ -4,7 +4,6 @@ Reusable modern components with glassmorphism, animations, and premium design
 """
 
 import streamlit as st
-import plotly.graph_objects as go
 import pandas as pd
 import numpy as np
 import json
@@ -265,7 +264,9 @@ def create_team_score_card(team_name, score, logo_path=None, mvp_name=None, mvp_
 
 def create_comparison_bar_chart(categories, team1_values, team2_values, team1_name, team2_name):
     """Create horizontal bar chart for team comparison"""
-    
+    # Imported on first use: plotly is only needed by the chart sections
+    import plotly.graph_objects as go
+
     fig = go.Figure()
     
     # Team 1 bars (left side, negative values for left alignment)
@@ -415,7 +416,8 @@ def create_four_factors_chart(team1_name, stats1, team2_name, stats2):
     # Extract values ensuring order
     v1 = [stats1.get(f, 0) for f in factors]
     v2 = [stats2.get(f, 0) for f in factors]
-    
+
+    import plotly.graph_objects as go
     fig = go.Figure()
     
     # Team 1 (Left side)
@@ -514,9 +516,8 @@ def render_html_scoreboard(q_data, t1, t2):
 
 def apply_dataframe_style(df):
     """Apply dark theme to pandas staging"""
-    # If it's already a Styler (from format_df), use it directly. 
-    # Otherwise, access .style
-    styler = df if hasattr(df, "set_properties") else df.style
+    # format_df returns a display table now, so this always starts from df.style
+    styler = df.style
     
     # Hide index to remove the white column on the left
     styler.hide(axis="index")
@@ -543,23 +544,87 @@ def apply_dataframe_style(df):
         {'selector': 'tr:hover', 'props': [('background-color', '#252525')]}
     ])
 
-def render_html_table(df, highlight_cols=None, star_players=None, outlier_thresholds=None):
-    """
-    Render a styled HTML table with advanced conditional formatting.
-    - star_players: List of player names whose rows should be highlighted.
-    - outlier_thresholds: Dict of col -> threshold. Cells exceeding this get an outlier glow.
-    """
-    if df.empty: return ""
-    
-    if highlight_cols is None:
-        highlight_cols = [
-            "PTS", "REB", "AST", "STL", "BLK", "Eff", "GmScr", 
-            "FIC", "PIE", "TS%", "eFG%", "USG%", "OFFRTG", "DEFRTG", "NETRTG", "FG%", "3P%", "FT%", "AST/TO"
-        ]
+DEFAULT_HIGHLIGHT_COLS = [
+    "PTS", "REB", "AST", "STL", "BLK", "Eff", "GmScr", 
+    "FIC", "PIE", "TS%", "eFG%", "USG%", "OFFRTG", "DEFRTG", "NETRTG", "FG%", "3P%", "FT%", "AST/TO"
+]
+
+_NUMBER_TYPES = (int, float, np.integer, np.floating)
+_PLAYER_COLS = ["Player", "PLAYER"]
+
+# Cell styles: base, then the leader/outlier or plain background, then the column font
+_CELL_BASE = 'text-align: center; padding: 10px; color: white; border-bottom: 1px solid var(--border-glass); transition: all 0.2s ease;'
+_CELL_HIGHLIGHT = 'background: rgba(255, 133, 51, 0.45); border-bottom: 2px solid var(--tappa-orange); font-weight: 800; text-shadow: 0 0 10px rgba(255,133,51,0.5);'
+_CELL_PLAIN = 'background: rgba(255, 255, 255, 0.02);'
+_ROW_BASE = "transition: background 0.2s;"
+_ROW_STAR = _ROW_BASE + "background: rgba(255, 133, 51, 0.08);"
+
+
+def _td(style):
+    return f'<td style="{style}">'
+
+
+_STAT_TD = {hl: _td(_CELL_BASE + (_CELL_HIGHLIGHT if hl else _CELL_PLAIN) + "font-family: 'Outfit', sans-serif;")
+            for hl in (False, True)}
+_PLAYER_TD = {
+    (hl, star): _td((_CELL_BASE + (_CELL_HIGHLIGHT if hl else _CELL_PLAIN)).replace("text-align: center", "text-align: left; padding-left: 15px")
+                    + "font-family: 'Space Grotesk', sans-serif; font-weight: 700;" + ("color: var(--tappa-orange);" if star else ""))
+    for hl in (False, True) for star in (False, True)
+}
 
-    if star_players is None: star_players = []
-    if outlier_thresholds is None: outlier_thresholds = {}
 
+def _format_number(val):
+    """Whole numbers without decimals, everything else to one decimal."""
+    if val % 1 == 0:
+        return f"{int(val)}"
+    return f"{float(val):.1f}"
+
+
+def _as_float(val):
+    try:
+        return float(val)
+    except Exception:
+        return np.nan
+
+
+def _display_column(values):
+    """Display strings for one column (as ``df.values`` hands out its cells)."""
+    if values.dtype.kind in "iuf":
+        nums = values.astype(float)
+        whole = nums % 1 == 0
+        out = np.empty(len(nums), dtype=object)
+        if values.dtype.kind in "iu":
+            out[:] = values.astype(str)
+        else:
+            out[whole] = nums[whole].astype(np.int64).astype(str)
+            out[~whole] = [f"{x:.1f}" for x in nums[~whole].tolist()]
+        return out.tolist()
+    return [_format_number(v) if isinstance(v, _NUMBER_TYPES) else f"{v}" for v in values]
+
+
+def _highlight_mask(values, col, outlier_thresholds, max_values):
+    """Cells drawn as leaders: >= the outlier threshold, or equal to the column max, and > 0."""
+    if col in outlier_thresholds:
+        target, is_outlier = outlier_thresholds[col], True
+    elif col in max_values:
+        target, is_outlier = max_values[col], False
+    else:
+        return np.zeros(len(values), dtype=bool)
+
+    if values.dtype.kind in "iuf":
+        nums = values.astype(float)
+    else:
+        nums = np.array([_as_float(v) for v in values], dtype=float)
+    try:
+        with np.errstate(invalid="ignore"):
+            hit = nums >= target if is_outlier else nums == target
+            return np.asarray(hit & (nums > 0), dtype=bool)
+    except Exception:
+        return np.zeros(len(values), dtype=bool)
+
+
+def _table_html(df, highlight_cols, star_players, outlier_thresholds):
+    """Markup for render_html_table, built a column at a time."""
     # Calculate local max values just in case outlier_thresholds aren't provided
     max_values = {}
     if not outlier_thresholds:
@@ -574,67 +639,42 @@ def render_html_table(df, highlight_cols=None, star_players=None, outlier_thresh
 
     # Generate Table Headers
     headers = "".join([f'<th style="text-align: center; padding: 12px; color: var(--text-muted); font-size: 0.8rem; background: rgba(0,0,0,0.3); border-bottom: 2px solid var(--border-glass); font-family: \'Space Grotesk\', sans-serif;">{col}</th>' for col in df.columns])
-    
-    # Generate Rows
-    rows_html = ""
-    for _, row in df.iterrows():
-        p_name = str(row.get('Player', row.get('PLAYER', '')))
-        is_star = any(star in p_name for star in star_players) if p_name else False
-        
-        row_style = "transition: background 0.2s;"
-        if is_star:
-            row_style += "background: rgba(255, 133, 51, 0.08);"
 
-        cells = ""
-        for col in df.columns:
-            val = row[col]
-            display_val = val
-            
-            # Formatting
-            if isinstance(val, (int, float, np.integer, np.floating)):
-                if val % 1 == 0:
-                    display_val = f"{int(val)}"
-                else:
-                    display_val = f"{float(val):.1f}"
-            
-            # Base style
-            style = f'text-align: center; padding: 10px; color: white; border-bottom: 1px solid var(--border-glass); transition: all 0.2s ease;'
-            
-            # 1. Outlier/Leader Highlight (Cell level)
-            is_highlighted = False
-            try:
-                numeric_val = float(val)
-                if col in outlier_thresholds:
-                    if numeric_val >= outlier_thresholds[col] and numeric_val > 0:
-                        is_highlighted = True
-                elif col in max_values:
-                    if numeric_val == max_values[col] and numeric_val > 0:
-                        is_highlighted = True
-                
-                if is_highlighted:
-                    style += 'background: rgba(255, 133, 51, 0.45); border-bottom: 2px solid var(--tappa-orange); font-weight: 800; text-shadow: 0 0 10px rgba(255,133,51,0.5);'
-                else:
-                    # Subtle background to maintain uniformity
-                    style += 'background: rgba(255, 255, 255, 0.02);'
-            except:
-                style += 'background: rgba(255, 255, 255, 0.02);'
-            
-            # 2. Player names - Left align + Clean Redundancy
-            if col in ["Player", "PLAYER"]:
-                # Strip (Team) if present in name to avoid redundancy with the Team column
-                if isinstance(display_val, str) and " (" in display_val:
-                    display_val = display_val.split(" (")[0]
-                    
-                style = style.replace("text-align: center", "text-align: left; padding-left: 15px")
-                style += "font-family: 'Space Grotesk', sans-serif; font-weight: 700;"
-                if is_star:
-                    style += "color: var(--tappa-orange);"
-            else:
-                style += "font-family: 'Outfit', sans-serif;"
-
-            cells += f'<td style="{style}">{display_val}</td>'
-        
-        rows_html += f'<tr style="{row_style}">{cells}</tr>'
+    # Numeric and object columns are read as-is; any other dtype (bool,
+    # datetime...) as the cells of df.values, which is what iterrows() sees
+    cells = None
+    columns = []
+    for j in range(df.shape[1]):
+        values = df.iloc[:, j].to_numpy()
+        if values.dtype.kind not in "iufO":
+            if cells is None:
+                cells = df.values
+            values = cells[:, j]
+        columns.append(values)
+
+    names = list(df.columns)
+    name_col = next((c for c in _PLAYER_COLS if c in names), None)
+    if name_col is None:
+        is_star = [False] * len(df)
+    else:
+        players = [str(v) for v in columns[names.index(name_col)]]
+        is_star = [any(star in p for star in star_players) if p else False for p in players]
+
+    rendered = []
+    for col, values in zip(names, columns):
+        shown = _display_column(values)
+        highlight = _highlight_mask(values, col, outlier_thresholds, max_values).tolist()
+        if col in _PLAYER_COLS:
+            # Player names - Left align + Clean Redundancy
+            shown = [s.split(" (")[0] if isinstance(v, str) and " (" in s else s for v, s in zip(values, shown)]
+            rendered.append([f"{_PLAYER_TD[(h, star)]}{s}</td>" for h, star, s in zip(highlight, is_star, shown)])
+        else:
+            rendered.append([f"{_STAT_TD[h]}{s}</td>" for h, s in zip(highlight, shown)])
+
+    rows_html = "".join(
+        f'<tr style="{_ROW_STAR if star else _ROW_BASE}">{"".join(row)}</tr>'
+        for star, row in zip(is_star, zip(*rendered))
+    )
 
     html = f"""
     <div style="
@@ -658,6 +698,29 @@ def render_html_table(df, highlight_cols=None, star_players=None, outlier_thresh
     """
     return html
 
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_table_html(df, highlight_cols, star_players, outlier_thresholds):
+    # Keyed on the frame's contents plus the highlight configuration
+    return _table_html(df, highlight_cols, star_players, outlier_thresholds)
+
+
+def render_html_table(df, highlight_cols=None, star_players=None, outlier_thresholds=None):
+    """
+    Render a styled HTML table with advanced conditional formatting.
+    - star_players: List of player names whose rows should be highlighted.
+    - outlier_thresholds: Dict of col -> threshold. Cells exceeding this get an outlier glow.
+    Memoized on the frame and the highlight configuration.
+    """
+    if df.empty: return ""
+
+    if highlight_cols is None:
+        highlight_cols = DEFAULT_HIGHLIGHT_COLS
+    if star_players is None: star_players = []
+    if outlier_thresholds is None: outlier_thresholds = {}
+
+    return _cached_table_html(df, highlight_cols, star_players, outlier_thresholds)
+
 def render_four_factors_table(df):
     """Render the Four Factors comparison as a premium HTML table"""
     # Standardize column names and values
@@ -697,4 +760,3 @@ def render_four_factors_table(df):
 
     return html
 
-NNI_LOGO_B64 = "PHN2ZyBpZD0iTGF5ZXJfMSIgZGF0YS1uYW1lPSJMYXllciAxIiB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHZpZXdCb3g9IjAgMCA2NDkuODQgNzkwLjM1Ij48ZGVmcz48c3R5bGU+LmNscy0xe2ZpbGw6I2ZmZjt9LmNscy0ye2ZpbGw6IzM3MzczNzt9PC9zdHlsZT48L2RlZnM+PHBhdGggY2xhc3M9ImNscy0xIiBkPSJNNDMyLjUyLDQ4My40M2MtMS42OC0xMS43OS40My0yMi4wOCwxLjA2LTMyLjQsMi4wNy0zNC4xMy44Ny02OC4zNSwzLjg2LTEwMi40OCwzLjM3LTM4LjM0LjY4LTc3LDUtMTE1LjMzLDEuMjQtMTEuMDguMy0xMS40OS0xMC44LTExLjVxLTU0LDAtMTA3LjkzLDBhNDYuMjIsNDYuMjIsMCwwLDAtNi43My41OSw0LDQsMCwwLDAtMy43NCwzLjM0Yy0yLjg4LDEzLjYyLTUuNzEsMjcuMjYtOC43OSw0MC44NC0yLDktNC41NSwxNy44Ni02LjcxLDI2LjgyLTIsOC4yOS00LjczLDE2LjU1LTUuNDgsMjVzLTQuMTgsMTYuMzktNi40OCwyNC4xNmMtMi44Nyw5LjcxLTMuODgsMTkuNjMtNS45NSwyOS4zMi0xLjczLDguMTEtNC40OSwxNi4xMy02LjM4LDI0LjA5LTEuOTIsOC4xMS0zLjIxLDE2Ljg3LTUuNjEsMjUuMDgtMy4zNiwxMS41LTYuMTIsMjMuNDgtOC43MiwzNS4zNC0yLjg2LDEzLTUuNzEsMjYtOSwzOS0zLjEsMTItNS4zMiwyNC4xOC04LjI4LDM2LjIzLTIuODIsMTEuNTItNiwyMy4wOS04LjA5LDM0LjY0LTIuMjYsMTIuNjUtNi4xNSwyNC44Mi04LjMxLDM3LjMxLTEuNjgsOS42OS02LDE4Ljg1LTUuNzMsMjguODksMCwxLjI5LS43NCwyLjU4LTEuMDYsMy44OS0yLjQxLDkuOTEtNS4zNiwxOS43My03LDI5Ljc3YTE4NS4zNiwxODUuMzYsMCwwLDEtNS42OSwyNGMtMi40OCw4LTQuMSwxNi41Ny01LjgzLDI0LjQ4LTIsOS4zMi02Ljg5LDE4LjUyLTUuNTcsMjguNmEzLDMsMCwwLDEtLjU1LDEuOTNjLTUuMjcsNy40LTQuNSwxNi42NC02LjM2LDI0LjgzLTIuMDgsOS4xOC02LjQ2LDE4LjE5LTUuNjcsMjhhNC4zNSw0LjM1LDAsMCwxLS41MywxLjk0Yy00LjQyLDkuODItNC45MiwyMC42NS03Ljg5LDMwLjg2LTEuNzEsNS44Ni42Niw4LjMxLDcuMzMsOC4yNSwzNC44NC0uMzIsNjkuNjktLjE0LDEwNC41NC0uMThhMzQuNDcsMzQuNDcsMCwwLDAsNy4zOS0uNjhjMS4yMS0uMjcsMi41NS0uNTQsMi45MS0yLjgxLDEuNzctMTEuMTYsNS40LTIyLjA1LDcuNTEtMzMsMi41OS0xMy4zOCw2LjE2LTI2LjUyLDguODItMzkuODYsMi4yNi0xMS4zOSw1LjA1LTIyLjY3LDcuNjQtMzQsMS45LTguMzMsMy44Ni0xNi42NCw1Ljc3LTI1LDIuMTEtOS4xOSwzLjkxLTE4LjQ2LDYuMzktMjcuNTUsMi03LjI0LDQuMzItMTQuNzgsNS4yNi0yMS44MywxLjM4LTEwLjI5LDQuMzctMjAuMiw2LjE1LTMwLjMsMi0xMS4xNSw2LTIyLjA3LDcuNTYtMzMuNDUuMTUtMS4xMiwwLTIuNC40My0zLjM0LDQuOTQtOS44Miw0LjU4LTIwLjk0LDcuNzYtMzEuMTguNzktMi41Ny0uODUtNy41NCwyLjMzLTcuMjksMy43NC4zLDIuMTYsNS4yMSwyLjE3LDguMDkuMDYsMjQuNjktMi42Niw0OS4zMS0yLjksNzMuOTQtLjYxLDYzLjQxLTQuODQsMTI2LjctNS41MSwxOTAuMSwwLDQuMS0uMTMsOC4yLTIuNDYsMTEuNzYtMi40NCwzLjc0LS42Niw1LjM1LDIuODgsNS45NGE0MS4wNiw0MS4wNiwwLDAsMCw2Ljc1LjM4cTUxLjU4LDAsMTAzLjE4LDBjMTEuNSwwLDEzLjMzLTEuNTEsMTQuNi0xMy40LDEuMTctMTEsNC41OC0yMS41NSw2LjU5LTMyLjM5LDIuMTMtMTEuNTEsNi45My0yMi41NCw3LjY0LTM0LjQ3YTEzLjMyLDEzLjMyLDAsMCwxLDEuMTktNC41OGM1LjMxLTExLjg3LDYuNzktMjQuOTQsMTAtMzcuMywzLjA2LTExLjgzLDYuMjktMjQsOC4zMS0zNiwyLjE3LTEzLDQuNjctMjUuNzgsOC42OC0zOC4yMiwxLjkzLTYtLjE3LTEyLjM4LDMuMTctMTguMTQsMy44My02LjYzLDMuODMtMTQuNjYsNS4zNC0yMS44NCwxLjg3LTguODksNy4xLTE3LjM4LDUuMzYtMjdhMS4yOCwxLjI4LDAsMCwxLC4xMS0uNjZjLjQ1LTEuMzEsMS0yLjY4LDIuNi0yLjcyLDIuMDcsMCwyLjU3LDEuNTQsMi43NCwzLjE3YTI1LjE1LDI1LjE1LDAsMCwxLC4wNiw0LjA3Yy0yLjE1LDM4LjY3LS42MSw3Ny40MS0zLjMzLDExNi4wOS0zLjE5LDQ1LjE3LTEsOTAuNTYtNC40MSwxMzUuNzUtLjQ0LDUuNzUsMS42LDcuNzMsNy4xMyw3LjcycTU0LS4xNSwxMDcuOTMsMGMzLjgzLDAsNS40Ny0xLjU3LDYuOTItNSwyLjQ3LTUuNzcsMi40Mi0xMiwzLjgzLTE3Ljg4LDQtMTYuNjksNy43MS0zMy40MywxMS41Ny01MC4xNHE1LTIxLjgsMTAuMS00My41N2MzLjYzLTE1LjYxLDcuMzQtMzEuMiwxMC45Mi00Ni44MywzLjMyLTE0LjUzLDYuMzktMjkuMTIsOS43OC00My42Myw0LjkyLTIxLjExLDEwLjE4LTQyLjEzLDE1LTYzLjI1LDQuOTEtMjEuMzUsOS4zNy00Mi44MSwxNC4yNy02NC4xNnMxMC4yNC00Mi42LDE1LjE2LTYzLjk0Uzc1NiwzOTcuNjQsNzYxLDM3Ni4yOWM2LjMxLTI3LjI3LDEzLTU0LjQ2LDE5LjI5LTgxLjc0LDQuOTMtMjEuMzQsOS40NS00Mi43OCwxNC4yNy02NC4xNSwxLjc0LTcuNzEsMS40Ny04LjI5LTYuNzItOC4zMS0xNi41Mi0uMDUtMzMsMC00OS41NiwwSDY4NS4zMmMtNCwwLTguMjEuMTgtOC44Niw1LjI1LS44Nyw2Ljc4LTMuMSwxMy4xOS00LjU5LDE5LjgtNC43OSwyMS4xNC05LjMxLDQyLjM0LTE0LjIxLDYzLjQ1LTYuMzEsMjcuMjctMTMsNTQuNDQtMTkuMzIsODEuNzEtNi4yNCwyNy4wNi0xMiw1NC4yMy0xOC4zMyw4MS4yNy0xLjQ5LDYuMzctMy40LDEyLjY0LTQuMzQsMTkuMTUtLjE5LDEuMjktLjQ5LDIuOTItMi4zLDIuNzhzLTEuOTMtMS42NS0yLjA3LTNhMjcuNDksMjcuNDksMCwwLDEtLjE3LTMuMzljLjY4LTI1LjU4LjgtNTEuMTksMi4yLTc2Ljc0LDMuMy02MC4xNCw0LjY5LTEyMC4zNSw3LjI1LTE4MC41Mi40NS0xMC40Ni0uMjQtMTAuODMtMTEuMDctMTAuODRsLTkwLjI5LDBjLTUuNjUsMC0xMS4zMSwwLTE3LDAtNSwuMDYtOC40NCwxLjctOS41Nyw3LjQxLTEuODMsOS4yOC00LjQ2LDE4LjQxLTYuNjIsMjcuNjNxLTUuNzMsMjQuNDEtMTEuMyw0OC44My01LDIxLjc4LTkuOTEsNDMuNTljLTMuNDUsMTUuNDItNi43NCwzMC44Ny0xMC4yNCw0Ni4yOC0zLjY1LDE2LjA3LTcuNjUsMzItMTEuMTQsNDguMTVDNDQwLjYsNDU2LjE2LDQzNi4zNSw0NjksNDMyLjUyLDQ4My40M1oiIHRyYW5zZm9ybT0idHJhbnNsYXRlKC0xNzIuOSAtNDguNTUpIi8+PHBhdGggY2xhc3M9ImNscy0xIiBkPSJNNjgzLjU1LDExOS4xN2MtNS4zOSwzNi42OSwzNC4yNSw3MC41OCw2My44NSw3MC4wNywyMC4yOC0uMzUsMzcuOTItNC4zNiw1Mi43OS0xNy45czIxLjg2LTMwLjcsMjIuNTItNTEuMDhjMS4yOC0zOS0zNC4wNS03MS40Ni03MC03MS43MUM3MTcuMzYsNDguMyw2NzguMzUsODIuNjQsNjgzLjU1LDExOS4xN1oiIHRyYW5zZm9ybT0idHJhbnNsYXRlKC0xNzIuOSAtNDguNTUpIi8+PHBhdGggY2xhc3M9ImNscy0yIiBkPSJNNDMyLjUyLDQ4My40M2MzLjgzLTE0LjM5LDguMDgtMjcuMjcsMTEtNDAuNTYsMy40OS0xNi4xLDcuNDktMzIuMDgsMTEuMTQtNDguMTUsMy41LTE1LjQxLDYuNzktMzAuODYsMTAuMjQtNDYuMjhxNC44OS0yMS44MSw5LjkxLTQzLjU5LDUuNi0yNC40MiwxMS4zLTQ4LjgzYzIuMTYtOS4yMiw0Ljc5LTE4LjM1LDYuNjItMjcuNjMsMS4xMy01LjcxLDQuNTUtNy4zNSw5LjU3LTcuNDEsNS42NS0uMDYsMTEuMzEsMCwxNywwbDkwLjI5LDBjMTAuODMsMCwxMS41Mi4zOCwxMS4wNywxMC44NC0yLjU2LDYwLjE3LTQsMTIwLjM4LTcuMjUsMTgwLjUyLTEuNCwyNS41NS0xLjUyLDUxLjE2LTIuMiw3Ni43NGEyNy40OSwyNy40OSwwLDAsMCwuMTcsMy4zOWMuMTQsMS4zNy4zNiwyLjg5LDIuMDcsM3MyLjExLTEuNDksMi4zLTIuNzhjLjk0LTYuNTEsMi44NS0xMi43OCw0LjM0LTE5LjE1LDYuMzItMjcsMTIuMDktNTQuMjEsMTguMzMtODEuMjcsNi4yOS0yNy4yNywxMy01NC40NCwxOS4zMi04MS43MSw0LjktMjEuMTEsOS40Mi00Mi4zMSwxNC4yMS02My40NSwxLjQ5LTYuNjEsMy43Mi0xMyw0LjU5LTE5LjguNjUtNS4wNyw0Ljg1LTUuMjUsOC44Ni01LjI1aDUyLjk0YzE2LjUyLDAsMzMsMCw0OS41NiwwLDguMTksMCw4LjQ2LjYsNi43Miw4LjMxLTQuODIsMjEuMzctOS4zNCw0Mi44MS0xNC4yNyw2NC4xNUM3NzQsMzIxLjgzLDc2Ny4yOSwzNDksNzYxLDM3Ni4yOWMtNC45NCwyMS4zNS05LjQzLDQyLjgtMTQuMzUsNjQuMTVTNzM2LjM4LDQ4Myw3MzEuNDcsNTA0LjM4cy05LjM2LDQyLjgxLTE0LjI3LDY0LjE2Yy00Ljg2LDIxLjEyLTEwLjEyLDQyLjE0LTE1LDYzLjI1LTMuMzksMTQuNTEtNi40NiwyOS4xLTkuNzgsNDMuNjMtMy41OCwxNS42My03LjI5LDMxLjIyLTEwLjkyLDQ2LjgzcS01LjA3LDIxLjc4LTEwLjEsNDMuNTdjLTMuODYsMTYuNzEtNy42LDMzLjQ1LTExLjU3LDUwLjE0LTEuNDEsNS45Mi0xLjM2LDEyLjExLTMuODMsMTcuODgtMS40NSwzLjM5LTMuMDksNS02LjkyLDVxLTU0LS4xNi0xMDcuOTMsMGMtNS41MywwLTcuNTctMi03LjEzLTcuNzIsMy40NS00NS4xOSwxLjIyLTkwLjU4LDQuNDEtMTM1Ljc1LDIuNzItMzguNjgsMS4xOC03Ny40MiwzLjMzLTExNi4wOWEyNS4xNSwyNS4xNSwwLDAsMC0uMDYtNC4wN2MtLjE3LTEuNjMtLjY3LTMuMjItMi43NC0zLjE3LTEuNjQsMC0yLjE1LDEuNDEtMi42LDIuNzJhMS4yOCwxLjI4LDAsMCwwLS4xMS42NmMxLjc0LDkuNjItMy40OSwxOC4xMS01LjM2LDI3LTEuNTEsNy4xOC0xLjUxLDE1LjIxLTUuMzQsMjEuODQtMy4zNCw1Ljc2LTEuMjQsMTIuMTQtMy4xNywxOC4xNC00LDEyLjQ0LTYuNTEsMjUuMjQtOC42OCwzOC4yMi0yLDEyLjA3LTUuMjUsMjQuMi04LjMxLDM2LTMuMiwxMi4zNi00LjY4LDI1LjQzLTEwLDM3LjNhMTMuMzIsMTMuMzIsMCwwLDAtMS4xOSw0LjU4Yy0uNzEsMTEuOTMtNS41MSwyMy03LjY0LDM0LjQ3LTIsMTAuODQtNS40MiwyMS4zOC02LjU5LDMyLjM5LTEuMjcsMTEuODktMy4xLDEzLjQtMTQuNiwxMy40cS01MS41OCwwLTEwMy4xOCwwYTQxLjA2LDQxLjA2LDAsMCwxLTYuNzUtLjM4Yy0zLjU0LS41OS01LjMyLTIuMi0yLjg4LTUuOTQsMi4zMy0zLjU2LDIuNDItNy42NiwyLjQ2LTExLjc2LjY3LTYzLjQsNC45LTEyNi42OSw1LjUxLTE5MC4xLjI0LTI0LjYzLDMtNDkuMjUsMi45LTczLjk0LDAtMi44OCwxLjU3LTcuNzktMi4xNy04LjA5LTMuMTgtLjI1LTEuNTQsNC43Mi0yLjMzLDcuMjktMy4xOCwxMC4yNC0yLjgyLDIxLjM2LTcuNzYsMzEuMTgtLjQ4Ljk0LS4yOCwyLjIyLS40MywzLjM0LTEuNTksMTEuMzgtNS41OSwyMi4zLTcuNTYsMzMuNDUtMS43OCwxMC4xLTQuNzcsMjAtNi4xNSwzMC4zLS45NCw3LTMuMjksMTQuNTktNS4yNiwyMS44My0yLjQ4LDkuMDktNC4yOCwxOC4zNi02LjM5LDI3LjU1LTEuOTEsOC4zMi0zLjg3LDE2LjYzLTUuNzcsMjUtMi41OSwxMS4zMi01LjM4LDIyLjYtNy42NCwzNC0yLjY2LDEzLjM0LTYuMjMsMjYuNDgtOC44MiwzOS44Ni0yLjExLDEwLjkxLTUuNzQsMjEuOC03LjUxLDMzLS4zNiwyLjI3LTEuNywyLjU0LTIuOTEsMi44MWEzNC40NywzNC40NywwLDAsMS03LjM5LjY4Yy0zNC44NSwwLTY5LjctLjE0LTEwNC41NC4xOC02LjY3LjA2LTktMi4zOS03LjMzLTguMjUsMy0xMC4yMSwzLjQ3LTIxLDcuODktMzAuODZhNC4zNSw0LjM1LDAsMCwwLC41My0xLjk0Yy0uNzktOS44NSwzLjU5LTE4Ljg2LDUuNjctMjgsMS44Ni04LjE5LDEuMDktMTcuNDMsNi4zNi0yNC44M2EzLDMsMCwwLDAsLjU1LTEuOTNDMTkzLjEyLDczMywxOTgsNzIzLjc2LDIwMCw3MTQuNDRjMS43My03LjkxLDMuMzUtMTYuNDUsNS44My0yNC40OGExODUuMzYsMTg1LjM2LDAsMCwwLDUuNjktMjRjMS42Ny0xMCw0LjYyLTE5Ljg2LDctMjkuNzcuMzItMS4zMSwxLjEtMi42LDEuMDYtMy44OS0uMjUtMTAsNC0xOS4yLDUuNzMtMjguODksMi4xNi0xMi40OSw2LjA1LTI0LjY2LDguMzEtMzcuMzEsMi4wNi0xMS41NSw1LjI3LTIzLjEyLDguMDktMzQuNjQsMy0xMiw1LjE4LTI0LjI2LDguMjgtMzYuMjMsMy4zNC0xMi45NCw2LjE5LTI1Ljk0LDktMzksMi42LTExLjg2LDUuMzYtMjMuODQsOC43Mi0zNS4zNCwyLjQtOC4yMSwzLjY5LTE3LDUuNjEtMjUuMDgsMS44OS04LDQuNjUtMTYsNi4zOC0yNC4wOSwyLjA3LTkuNjksMy4wOC0xOS42MSw1Ljk1LTI5LjMyLDIuMy03Ljc3LDUuNzMtMTUuNjMsNi40OC0yNC4xNnMzLjQ4LTE2LjY4LDUuNDgtMjVjMi4xNi05LDQuNjctMTcuODQsNi43MS0yNi44MiwzLjA4LTEzLjU4LDUuOTEtMjcuMjIsOC43OS00MC44NGE0LDQsMCwwLDEsMy43NC0zLjM0LDQ2LjIyLDQ2LjIyLDAsMCwxLDYuNzMtLjU5cTU0LS4wNiwxMDcuOTMsMGMxMS4xLDAsMTIsLjQyLDEwLjgsMTEuNS00LjI4LDM4LjM1LTEuNTksNzctNSwxMTUuMzMtMywzNC4xMy0xLjc5LDY4LjM1LTMuODYsMTAyLjQ4QzQzMyw0NjEuMzUsNDMwLjg0LDQ3MS42NCw0MzIuNTIsNDgzLjQzWiIgdHJhbnNmb3JtPSJ0cmFuc2xhdGUoLTE3Mi45IC00OC41NSkiLz48cGF0aCBjbGFzcz0iY2xzLTIiIGQ9Ik02ODMuNTUsMTE5LjE3Yy01LjItMzYuNTMsMzMuODEtNzAuODcsNjkuMTctNzAuNjIsMzUuOTQuMjUsNzEuMjcsMzIuNzIsNzAsNzEuNzEtLjY2LDIwLjM4LTcuNjEsMzcuNTEtMjIuNTIsNTEuMDhzLTMyLjUxLDE3LjU1LTUyLjc5LDE3LjlDNzE3LjgsMTg5Ljc1LDY3OC4xNiwxNTUuODYsNjgzLjU1LDExOS4xN1oiIHRyYW5zZm9ybT0idHJhbnNsYXRlKC0xNzIuOSAtNDguNTUpIi8+PC9zdmc+"